@@ -0,0 +1,93 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from django.test import AsyncClient
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.utils import decorators
+
+User = get_user_model()
+
+class MemorySink:
+    blocking = False
+
+    def __init__(self):
+        self.entries = []
+
+    def put(self, entry):
+        self.entries.append(entry)
+        return True
+
+@pytest.fixture
+def sink(monkeypatch):
+    sink = MemorySink()
+    monkeypatch.setattr(decorators, "get_log_sink", lambda: sink)
+    monkeypatch.setattr(decorators, "sample_weight", lambda *args: 1.0)
+    return sink
+
+@pytest.fixture
+def admin_user(db):
+    return User.objects.create_user(email="async-admin@test.com", password="AdminPass123!", user_type="admin")
+
+@pytest.fixture
+def normal_user(db):
+    return User.objects.create_user(email="async-user@test.com", password="UserPass123!", user_type="user")
+
+def get(url, user=None, **params):
+    headers = {"authorization": f"Bearer {AccessToken.for_user(user)}"} if user else {}
+    return async_to_sync(AsyncClient().get)(url, params, headers=headers)
+
+@pytest.mark.django_db
+class TestAsyncUserViews:
+    def test_list_users(self, sink, admin_user, normal_user):
+        response = get(reverse("user-list-async"), admin_user, user_type="user")
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["data"]["count"] == 1
+        assert body["data"]["results"][0]["email"] == normal_user.email
+        assert sink.entries[0]["user_id"] == admin_user.id
+        assert sink.entries[0]["message"] == body["message"]
+
+    def test_retrieve_user(self, sink, admin_user, normal_user):
+        response = get(reverse("user-detail-async", kwargs={"pk": normal_user.pk}), admin_user)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["email"] == normal_user.email
+        assert sink.entries[0]["object_id"] == normal_user.pk
+
+        response = get(reverse("user-detail-async", kwargs={"pk": 999999}), admin_user)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_page(self, sink, admin_user):
+        response = get(reverse("user-list-async"), admin_user, page=50)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["success"] is False
+
+    def test_authentication_and_permissions(self, sink, normal_user):
+        response = get(reverse("user-list-async"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = get(reverse("user-list-async"), normal_user)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        response = async_to_sync(AsyncClient().get)(reverse("user-list-async"), headers={"authorization": "Bearer invalid"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+@pytest.mark.django_db
+class TestAsyncRoleViews:
+    def test_list_and_retrieve_roles(self, sink, admin_user):
+        role = Group.objects.create(name="Async role")
+        role.permissions.set(Permission.objects.all()[:2])
+        admin_user.groups.add(role)
+
+        response = get(reverse("rol-list-async"), admin_user)
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()["data"]["results"][0]
+        assert result["name"] == "Async role"
+        assert result["user_count"] == 1
+        assert len(result["permissions"]) == 2
+
+        response = get(reverse("rol-detail-async", kwargs={"pk": role.pk}), admin_user)
+        assert response.json()["data"]["id"] == role.pk
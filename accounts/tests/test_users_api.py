@@ -114,6 +114,8 @@ class TestUserViewSet:
         normal_user.refresh_from_db()
         assert normal_user.first_name == "Parcial"
 
+    # Eliminar un usuario deja en NULL sus logs en la base de auditoria
+    @pytest.mark.django_db(databases=["default", "audit"])
     def test_delete_user(self, auth_client, normal_user):
         url = reverse("user-detail", args=[normal_user.id])
         response = auth_client.delete(url)
@@ -2,7 +2,7 @@ from rest_framework.routers import DefaultRouter
 
 from django.urls import path, include
 
-from accounts.views.roles_views import RoleViewSet, AssignRoleToUserView, RemoveRoleToUserView
+from accounts.views.roles_views import RoleViewSet, AssignRoleToUserView, RemoveRoleToUserView, AsyncRoleListView, AsyncRoleDetailView
 
 rRoles = DefaultRouter()
 rRoles.register(r'roles', RoleViewSet, basename='rol')
@@ -11,4 +11,7 @@ urlpatterns = [
     path('', include(rRoles.urls)),
     path('assign/', AssignRoleToUserView.as_view(), name='assign-role-to-user'),
     path('remove/', RemoveRoleToUserView.as_view(), name='remove-role-to-user'),
+    # Versiones async (ASGI) del listado y detalle
+    path('async/roles/', AsyncRoleListView.as_view(), name='rol-list-async'),
+    path('async/roles/<int:pk>/', AsyncRoleDetailView.as_view(), name='rol-detail-async'),
 ]
\ No newline at end of file
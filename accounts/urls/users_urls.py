@@ -2,7 +2,7 @@ from rest_framework.routers import DefaultRouter
 
 from django.urls import path, include
 
-from accounts.views.users_views import UserViewSet, ChangePasswordView, ChangeUserLanguageView
+from accounts.views.users_views import UserViewSet, ChangePasswordView, ChangeUserLanguageView, AsyncUserListView, AsyncUserDetailView
 
 rUsers = DefaultRouter()
 rUsers.register(r'users', UserViewSet, basename='user')
@@ -11,4 +11,7 @@ urlpatterns = [
   path('', include(rUsers.urls)),
   path('<int:user_id>/change-password/', ChangePasswordView.as_view(), name='user-change-password'),
   path('<int:user_id>/language/', ChangeUserLanguageView.as_view(), name='user-change-language'),
+  # Versiones async (ASGI) del listado y detalle
+  path('async/users/', AsyncUserListView.as_view(), name='user-list-async'),
+  path('async/users/<int:pk>/', AsyncUserDetailView.as_view(), name='user-detail-async'),
 ]
\ No newline at end of file
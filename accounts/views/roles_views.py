@@ -8,9 +8,10 @@ from django.contrib.auth.models import Group
 
 from core.base.messages import get_message
 from core.base.common import GetModelName
-from core.base.pagination import BasePagination
+from core.base.pagination import AsyncBasePagination, BasePagination
 from core.base.serializers.responses_serializer import error_400_serializer
 from core.utils.mixins import APIResponseMixin
+from core.utils.async_views import AsyncAPIView
 from core.utils.decorators import LogActionView
 from core.utils.permissions import IsAdmin, IsStaff
 
@@ -219,4 +220,57 @@ class RemoveRoleToUserView(APIResponseMixin, APIView):
       message=get_message("generic", "bad_request"),
       errors=serializer.errors,
       status_code=status.HTTP_400_BAD_REQUEST
-    )
\ No newline at end of file
+    )
+
+class AsyncRoleListView(AsyncAPIView):
+  """
+  Version async (ASGI) del listado de roles (RoleViewSet.list) con el ORM async.
+  Solo accesible a administradores o staff.
+  """
+
+  permission_classes = [IsAdmin | IsStaff]
+
+  @LogActionView(action_base=get_message("logs", "role_list"))
+  async def get(self, request, *args, **kwargs):
+    paginator = AsyncBasePagination()
+    page = await paginator.apaginate_queryset(async_roles_queryset(), request)
+    serializer = RolesSerializer(page, many=True)
+    return self.success_response(
+      data=paginator.get_paginated_response(serializer.data).data,
+      message=get_message("success", "role_list")
+    )
+
+class AsyncRoleDetailView(AsyncAPIView):
+  """
+  Version async (ASGI) del detalle de un rol (RoleViewSet.retrieve).
+  Solo accesible a administradores o staff.
+  """
+
+  permission_classes = [IsAdmin | IsStaff]
+
+  @LogActionView(
+    action_base=get_message("logs", "role_details"),
+    object_getter=lambda self, request, kwargs, instance: instance.name,
+    meta_getter=lambda view, request, view_kwargs, instance: {
+      "object_id": instance.id,
+      "object_type": GetModelName(instance),
+    }
+  )
+  async def get(self, request, pk, *args, **kwargs):
+    instance = await async_roles_queryset().filter(pk=pk).afirst()
+    if instance is None:
+      return self.error_response(
+        message=get_message("generic", "not_found"),
+        status_code=status.HTTP_404_NOT_FOUND
+      )
+
+    resp = self.success_response(
+      data=RolesSerializer(instance).data,
+      message=get_message("success", "role_recovered")
+    )
+    resp.instance = instance
+    return resp
+
+def async_roles_queryset():
+  # Los permisos se precargan: el serializador no puede consultarlos desde el event loop
+  return Group.objects.annotate(user_count=Count('user')).prefetch_related('permissions').order_by('id')
@@ -9,10 +9,11 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from core.base.messages import get_message
 from core.base.common import GetModelName
-from core.base.pagination import BasePagination
+from core.base.pagination import AsyncBasePagination, BasePagination
 from core.base.serializers.responses_serializer import error_400_serializer, error_403_serializer
 from core.throttle import SensitiveActionThrottle
 from core.utils.mixins import APIResponseMixin
+from core.utils.async_views import AsyncAPIView
 from core.utils.permissions import IsAdmin, IsStaff, IsUserAuthenticated
 from core.utils.decorators import LogActionView
 
@@ -264,4 +265,61 @@ class ChangeUserLanguageView(APIResponseMixin, APIView):
       message=get_message("generic", "bad_request"),
       errors=serializer.errors,
       status_code=status.HTTP_400_BAD_REQUEST
-    )
\ No newline at end of file
+    )
+
+class AsyncUserListView(AsyncAPIView):
+  """
+  Version async (ASGI) del listado de usuarios: mismos filtros, paginacion, permisos y
+  respuesta que UserViewSet.list, con el ORM async. Solo accesible a administradores o staff.
+  """
+
+  permission_classes = [IsAdmin | IsStaff]
+
+  @LogActionView(action_base=get_message("logs", "user_list"))
+  async def get(self, request, *args, **kwargs):
+    filterset = UserFilter(request.query_params, queryset=User.objects.all(), request=request)
+    if not filterset.is_valid():
+      return self.error_response(
+        message=get_message("generic", "bad_request"),
+        errors=filterset.errors,
+        status_code=status.HTTP_400_BAD_REQUEST
+      )
+
+    paginator = AsyncBasePagination()
+    page = await paginator.apaginate_queryset(filterset.qs, request)
+    serializer = UserSerializer(page, many=True)
+    return self.success_response(
+      data=paginator.get_paginated_response(serializer.data).data,
+      message=get_message("success", "user_list")
+    )
+
+class AsyncUserDetailView(AsyncAPIView):
+  """
+  Version async (ASGI) del detalle de un usuario (UserViewSet.retrieve).
+  Solo accesible a administradores o staff.
+  """
+
+  permission_classes = [IsAdmin | IsStaff]
+
+  @LogActionView(
+    action_base=get_message("logs", "user_details"),
+    object_getter=lambda self, request, kwargs, instance: instance.email,
+    meta_getter=lambda view, request, view_kwargs, instance: {
+      "object_id": instance.id,
+      "object_type": GetModelName(instance),
+    }
+  )
+  async def get(self, request, pk, *args, **kwargs):
+    instance = await User.objects.filter(pk=pk).afirst()
+    if instance is None:
+      return self.error_response(
+        message=get_message("generic", "not_found"),
+        status_code=status.HTTP_404_NOT_FOUND
+      )
+
+    resp = self.success_response(
+      data=UserSerializer(instance).data,
+      message=get_message("success", "user_recovered")
+    )
+    resp.instance = instance
+    return resp
@@ -0,0 +1,70 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from authentication.revocation import get_revocation_registry
+from authentication.user_cache import get_cached_user, aget_cached_user, cache_user, acache_user
+
+class CachedJWTAuthentication(JWTAuthentication):
+  """
+  JWTAuthentication que obtiene el usuario de una cache de TTL corto (AUTH_USER_CACHE) en
+  lugar de consultar accounts_user en cada request. La entrada se invalida por version al
+  guardar el usuario o cambiar sus grupos/permisos (authentication.signals), de modo que
+  un usuario desactivado se rechaza en el siguiente request.
+
+  Los tokens revocados (logout, cerrar sesion en todos los dispositivos) se rechazan con la
+  copia en memoria de authentication.revocation, sin consultar la base de datos.
+  """
+
+  def _user_id(self, validated_token):
+    try:
+      return validated_token[api_settings.USER_ID_CLAIM]
+    except KeyError:
+      raise InvalidToken(_("Token contained no recognizable user identification"))
+
+  def check_revoked(self, validated_token):
+    if get_revocation_registry().is_revoked(validated_token):
+      raise InvalidToken(_("Token is blacklisted"))
+
+  def get_user(self, validated_token):
+    get_revocation_registry().refresh_if_due()
+    self.check_revoked(validated_token)
+    user_id = self._user_id(validated_token)
+    user, version = get_cached_user(user_id)
+    if user is None:
+      try:
+        user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+      except self.user_model.DoesNotExist:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+      cache_user(user, version)
+    return self.check_user(user, validated_token)
+
+  async def aget_user(self, validated_token):
+    """
+    Version async de get_user() para vistas ASGI (core.utils.async_views).
+    """
+
+    await get_revocation_registry().arefresh_if_due()
+    self.check_revoked(validated_token)
+    user_id = self._user_id(validated_token)
+    user, version = await aget_cached_user(user_id)
+    if user is None:
+      user = await self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).afirst()
+      if user is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+      await acache_user(user, version)
+    return self.check_user(user, validated_token)
+
+  def check_user(self, user, validated_token):
+    # Mismas verificaciones que JWTAuthentication.get_user, tambien con el usuario en cache
+    if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+      raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+    if api_settings.CHECK_REVOKE_TOKEN:
+      if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+        raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+    return user
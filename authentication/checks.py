@@ -0,0 +1,48 @@
+import os
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from authentication.user_cache import get_user_cache_setting
+from authentication.permission_snapshot import get_snapshot_setting
+
+def _multiple_processes() -> bool:
+  # En produccion (DEBUG=False) gunicorn corre varios workers; WEB_CONCURRENCY es su numero
+  return not settings.DEBUG or int(os.getenv('WEB_CONCURRENCY', '1')) > 1
+
+@checks.register()
+def check_user_cache(app_configs, **kwargs):
+  """
+  Con una cache por proceso, invalidar un usuario (ej. desactivarlo) solo aplica en el proceso
+  que lo hace; los demas lo siguen aceptando hasta AUTH_USER_CACHE['TIMEOUT'].
+  """
+
+  alias = get_user_cache_setting('CACHE')
+  if isinstance(caches[alias], LocMemCache) and _multiple_processes():
+    return [checks.Warning(
+      f"AUTH_USER_CACHE['CACHE'] ('{alias}') es local al proceso; con varios procesos la invalidacion de usuarios no se comparte.",
+      hint="Configura CACHES con Redis o Memcached (ver config/settings/prod.py).",
+      id='authentication.W001',
+    )]
+  return []
+
+@checks.register()
+def check_permission_snapshot_cache(app_configs, **kwargs):
+  """
+  La version de permisos vive en la cache de AUTH_USER_CACHE: con una cache por proceso, un
+  cambio de permisos no invalidaria los tokens validados por los demas procesos.
+  """
+
+  if not get_snapshot_setting('ENABLED'):
+    return []
+  alias = get_user_cache_setting('CACHE')
+  if isinstance(caches[alias], (LocMemCache, DummyCache)):
+    return [checks.Error(
+      f"PERMISSION_SNAPSHOT['ENABLED'] requiere una cache compartida; AUTH_USER_CACHE['CACHE'] ('{alias}') es local al proceso.",
+      hint="Configura CACHES con Redis o Memcached (ver config/settings/prod.py) o desactiva PERMISSION_SNAPSHOT.",
+      id='authentication.E001',
+    )]
+  return []
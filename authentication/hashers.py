@@ -0,0 +1,137 @@
+import math
+import time
+import statistics
+
+from typing import Dict
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+  PBKDF2PasswordHasher, Argon2PasswordHasher,
+  BCryptSHA256PasswordHasher, ScryptPasswordHasher,
+)
+
+# Valores por defecto de la configuracion PASSWORD_HASHING (ver config/settings/base.py):
+# los de Django 5.2. Se calibran en cada servidor con `python manage.py calibrate_password_hashers`
+DEFAULTS = {
+  'PBKDF2_ITERATIONS': PBKDF2PasswordHasher.iterations,
+  'ARGON2_TIME_COST': Argon2PasswordHasher.time_cost,
+  'ARGON2_MEMORY_COST': Argon2PasswordHasher.memory_cost,
+  'ARGON2_PARALLELISM': Argon2PasswordHasher.parallelism,
+  'BCRYPT_ROUNDS': BCryptSHA256PasswordHasher.rounds,
+  'SCRYPT_WORK_FACTOR': ScryptPasswordHasher.work_factor,
+}
+
+def get_hashing_setting(key: str):
+  return getattr(settings, 'PASSWORD_HASHING', {}).get(key, DEFAULTS[key])
+
+# Cada hasher conserva el `algorithm` de Django, por lo que verifica los hashes existentes.
+# Si los parametros guardados en un hash difieren de los configurados, must_update() es
+# verdadero y check_password() lo vuelve a calcular con los actuales al iniciar sesion.
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+  @property
+  def iterations(self):
+    return int(get_hashing_setting('PBKDF2_ITERATIONS'))
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+  @property
+  def time_cost(self):
+    return int(get_hashing_setting('ARGON2_TIME_COST'))
+
+  @property
+  def memory_cost(self):
+    return int(get_hashing_setting('ARGON2_MEMORY_COST'))
+
+  @property
+  def parallelism(self):
+    return int(get_hashing_setting('ARGON2_PARALLELISM'))
+
+class TunedBCryptSHA256PasswordHasher(BCryptSHA256PasswordHasher):
+  @property
+  def rounds(self):
+    return int(get_hashing_setting('BCRYPT_ROUNDS'))
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+  @property
+  def work_factor(self):
+    return int(get_hashing_setting('SCRYPT_WORK_FACTOR'))
+
+  @property
+  def maxmem(self):
+    # scrypt usa 128 * N * r bytes; el limite por defecto de OpenSSL (32 MiB) no alcanza con N > 2**14
+    return max(64 * 1024 * 1024, 256 * self.work_factor * self.block_size)
+
+# Calibracion (calibrate_password_hashers): parametro(s) de costo por algoritmo y como escalarlos
+CALIBRATION_PASSWORD = 'calibracion-Menvitta-1'
+
+def _pbkdf2(params):
+  hasher = PBKDF2PasswordHasher()
+  hasher.iterations = params['PBKDF2_ITERATIONS']
+  return hasher
+
+def _argon2(params):
+  hasher = Argon2PasswordHasher()
+  hasher.time_cost = params['ARGON2_TIME_COST']
+  hasher.memory_cost = params['ARGON2_MEMORY_COST']
+  hasher.parallelism = params['ARGON2_PARALLELISM']
+  return hasher
+
+def _bcrypt(params):
+  hasher = BCryptSHA256PasswordHasher()
+  hasher.rounds = params['BCRYPT_ROUNDS']
+  return hasher
+
+def _scrypt(params):
+  hasher = ScryptPasswordHasher()
+  hasher.work_factor = params['SCRYPT_WORK_FACTOR']
+  hasher.maxmem = max(64 * 1024 * 1024, 256 * hasher.work_factor * hasher.block_size)
+  return hasher
+
+def _scale_linear(value, ratio, step, minimum):
+  return max(minimum, int(round(value * ratio / step)) * step)
+
+def _scale_log2(value, ratio, minimum, maximum):
+  # Parametros exponenciales (bcrypt: 2**rounds; scrypt: N potencia de 2)
+  return min(maximum, max(minimum, value + round(math.log2(ratio))))
+
+CALIBRATORS = {
+  'pbkdf2_sha256': (_pbkdf2, lambda p, r: {'PBKDF2_ITERATIONS': _scale_linear(p['PBKDF2_ITERATIONS'], r, 1000, 10_000)}),
+  'argon2': (_argon2, lambda p, r: {'ARGON2_TIME_COST': _scale_linear(p['ARGON2_TIME_COST'], r, 1, 1)}),
+  'bcrypt_sha256': (_bcrypt, lambda p, r: {'BCRYPT_ROUNDS': _scale_log2(p['BCRYPT_ROUNDS'], r, 4, 31)}),
+  'scrypt': (_scrypt, lambda p, r: {'SCRYPT_WORK_FACTOR': 2 ** _scale_log2(int(math.log2(p['SCRYPT_WORK_FACTOR'])), r, 10, 20)}),
+}
+
+def time_verification(hasher, samples: int = 3) -> float:
+  """
+  Retorna la mediana en segundos de hasher.verify() sobre un hash recien generado.
+  """
+
+  encoded = hasher.encode(CALIBRATION_PASSWORD, hasher.salt())
+  timings = []
+  for _ in range(samples):
+    start = time.perf_counter()
+    hasher.verify(CALIBRATION_PASSWORD, encoded)
+    timings.append(time.perf_counter() - start)
+  return statistics.median(timings)
+
+def calibrate(algorithm: str, target: float, samples: int = 3) -> Dict:
+  """
+  Mide la verificacion con los parametros configurados y propone los que se acercan a
+  `target` segundos, midiendolos tambien.
+
+  Raises:
+    ValueError: La libreria del hasher no esta instalada (argon2-cffi, bcrypt).
+  """
+
+  build, propose = CALIBRATORS[algorithm]
+  current = {key: get_hashing_setting(key) for key in DEFAULTS}
+  keys = list(propose(current, 1))
+  measured = time_verification(build(current), samples)
+  proposed = {**current, **propose(current, target / measured)}
+  return {
+    'algorithm': algorithm,
+    'current': {key: current[key] for key in keys},
+    'current_time': measured,
+    'proposed': {key: proposed[key] for key in keys},
+    'proposed_time': time_verification(build(proposed), samples),
+  }
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from authentication.hashers import CALIBRATORS, calibrate
+
+class Command(BaseCommand):
+  help = (
+    "Mide el tiempo de verificacion de cada hasher de contraseñas en este servidor y propone "
+    "los parametros de costo (PASSWORD_HASHING) que se acercan al tiempo objetivo."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--target-ms', type=float, default=250.0, help="Tiempo objetivo por verificacion en milisegundos (por defecto 250).")
+    parser.add_argument('--samples', type=int, default=3, help="Mediciones por configuracion (se usa la mediana).")
+    parser.add_argument('--algorithm', action='append', choices=sorted(CALIBRATORS), help="Algoritmo a calibrar (repetible; por defecto todos).")
+
+  def handle(self, *args, **options):
+    target = options['target_ms'] / 1000
+    self.stdout.write(f"Objetivo: {options['target_ms']:.0f} ms por verificacion ({options['samples']} muestras).")
+
+    proposal = {}
+    for algorithm in options['algorithm'] or CALIBRATORS:
+      try:
+        result = calibrate(algorithm, target, options['samples'])
+      except ValueError as e:
+        self.stdout.write(self.style.WARNING(f"{algorithm:14} no disponible: {e}"))
+        continue
+      proposal.update(result['proposed'])
+      self.stdout.write(
+        f"{algorithm:14} actual {_params(result['current'])} {result['current_time'] * 1000:8.1f} ms"
+        f"  ->  propuesto {_params(result['proposed'])} {result['proposed_time'] * 1000:8.1f} ms"
+      )
+
+    if proposal:
+      self.stdout.write("\nConfiguracion propuesta (config/settings):")
+      self.stdout.write("PASSWORD_HASHING = {")
+      for key, value in proposal.items():
+        self.stdout.write(f"  '{key}': {value},")
+      self.stdout.write("}")
+
+def _params(params):
+  return ', '.join(f"{key}={value}" for key, value in params.items())
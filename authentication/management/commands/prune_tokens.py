@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+
+from authentication.pruning import prune_expired_tokens
+from authentication.revocation import get_revocation_setting
+
+class Command(BaseCommand):
+  help = (
+    "Elimina los tokens expirados de token_blacklist (outstanding y blacklisted) en lotes "
+    "acotados con transacciones cortas, sin bloquear la tabla. Con --every se ejecuta de "
+    "forma periodica."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--batch-size', type=int, default=None, help="Tokens por lote (por defecto TOKEN_REVOCATION['PRUNE_BATCH_SIZE']).")
+    parser.add_argument('--pause', type=float, default=None, help="Segundos de espera entre lotes (por defecto TOKEN_REVOCATION['PRUNE_PAUSE']).")
+    parser.add_argument('--every', type=float, default=None, help="Repite la depuracion cada N segundos (trabajo periodico).")
+    parser.add_argument('--dry-run', action='store_true', help="Solo muestra lo que se eliminaria.")
+
+  def handle(self, *args, **options):
+    if options['dry_run']:
+      expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+      blacklisted = BlacklistedToken.objects.filter(token__in=expired).count()
+      self.stdout.write(f"Se eliminarian {expired.count()} tokens expirados ({blacklisted} en la blacklist).")
+      return
+
+    batch_size = options['batch_size'] or get_revocation_setting('PRUNE_BATCH_SIZE')
+    pause = options['pause'] if options['pause'] is not None else get_revocation_setting('PRUNE_PAUSE')
+    while True:
+      self._prune(batch_size, pause)
+      if not options['every']:
+        return
+      close_old_connections()
+      time.sleep(options['every'])
+
+  def _prune(self, batch_size, pause):
+    stats = prune_expired_tokens(batch_size=batch_size, pause=pause)
+    self.stdout.write(self.style.SUCCESS(
+      f"Tokens eliminados: {stats['outstanding']} outstanding, {stats['blacklisted']} blacklisted, "
+      f"{stats['watermarks']} marcas en {stats['batches']} lotes ({stats['elapsed']:.2f} s)."
+    ))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 14:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenWatermark',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='token_watermark', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('revoked_before', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'authentication_token_watermark',
+            },
+        ),
+    ]
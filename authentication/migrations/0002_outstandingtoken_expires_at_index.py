@@ -0,0 +1,39 @@
+from django.db import migrations
+
+INDEX_NAME = 'token_blacklist_outstandingtoken_expires_at_idx'
+
+
+def create_index(apps, schema_editor):
+    connection = schema_editor.connection
+    table = apps.get_model('token_blacklist', 'OutstandingToken')._meta.db_table
+    # En PostgreSQL se crea sin bloquear escrituras sobre la tabla
+    concurrently = 'CONCURRENTLY ' if connection.vendor == 'postgresql' else ''
+    schema_editor.execute(
+        f'CREATE INDEX {concurrently}IF NOT EXISTS {connection.ops.quote_name(INDEX_NAME)} '
+        f'ON {connection.ops.quote_name(table)} (expires_at)'
+    )
+
+
+def drop_index(apps, schema_editor):
+    connection = schema_editor.connection
+    concurrently = 'CONCURRENTLY ' if connection.vendor == 'postgresql' else ''
+    schema_editor.execute(f'DROP INDEX {concurrently}IF EXISTS {connection.ops.quote_name(INDEX_NAME)}')
+
+
+class Migration(migrations.Migration):
+    """
+    Indice sobre token_blacklist_outstandingtoken.expires_at para la depuracion en lotes
+    (prune_tokens). La tabla pertenece a simplejwt, por eso el indice se crea con SQL.
+    """
+
+    # CREATE INDEX CONCURRENTLY no puede ejecutarse dentro de una transaccion
+    atomic = False
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
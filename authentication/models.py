@@ -1,3 +1,17 @@
 from django.db import models
+from django.conf import settings
 
-# Create your models here.
+class TokenWatermark(models.Model):
+  """
+  Marca de revocacion por usuario: los tokens emitidos antes de `revoked_before` son
+  invalidos ("cerrar sesion en todos los dispositivos"). Ver authentication.revocation.
+  """
+
+  user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='token_watermark')
+  revoked_before = models.DateTimeField(db_index=True)
+
+  class Meta:
+    db_table = 'authentication_token_watermark'
+
+  def __str__(self):
+    return f"{self.user_id} < {self.revoked_before.isoformat()}"
@@ -0,0 +1,115 @@
+import uuid
+import base64
+import threading
+
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+from django.contrib.auth.models import Permission
+from rest_framework_simplejwt.settings import api_settings
+
+from authentication.user_cache import get_user_cache_setting
+
+# Valores por defecto de la configuracion PERMISSION_SNAPSHOT (ver config/settings/base.py)
+DEFAULTS = {
+  # Agrega los permisos del usuario a los access tokens (claims `perms` y `pv`)
+  'ENABLED': False,
+  'KEY_PREFIX': 'auth:perms',
+}
+
+PERMS_CLAIM = 'perms'
+VERSION_CLAIM = 'pv'
+# Valor de `perms` para superusuarios: tienen todos los permisos
+ALL_PERMISSIONS = '*'
+
+def get_snapshot_setting(key: str):
+  return getattr(settings, 'PERMISSION_SNAPSHOT', {}).get(key, DEFAULTS[key])
+
+def _cache():
+  # Misma cache que los usuarios autenticados (AUTH_USER_CACHE); debe ser compartida entre procesos
+  return caches[get_user_cache_setting('CACHE')]
+
+def _version_key(user_id):
+  return f"{get_snapshot_setting('KEY_PREFIX')}:{user_id}"
+
+def get_permission_version(user_id) -> str:
+  """
+  Version vigente de los permisos del usuario; se crea si no existe.
+  """
+
+  cache = _cache()
+  key = _version_key(user_id)
+  version = cache.get(key)
+  if version is None:
+    cache.add(key, uuid.uuid4().hex[:12], timeout=None)
+    version = cache.get(key)
+  return version
+
+def bump_permission_versions(user_ids: Iterable):
+  """
+  Cambia la version de permisos de los usuarios: los tokens emitidos antes quedan obsoletos.
+  """
+
+  _cache().set_many({_version_key(user_id): uuid.uuid4().hex[:12] for user_id in user_ids}, timeout=None)
+
+def encode_permissions(permission_ids: Iterable[int]) -> str:
+  """
+  Codifica los ids de permisos como un bitset (bit N = permiso con id N) en base64url.
+  """
+
+  bits = 0
+  for permission_id in permission_ids:
+    bits |= 1 << permission_id
+  raw = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+  return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+def decode_permissions(encoded: str) -> int:
+  return int.from_bytes(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)), 'little')
+
+def permission_claims(user) -> Dict[str, str]:
+  """
+  Claims `perms` y `pv` del usuario para un access token (una consulta; ninguna para superusuarios).
+  """
+
+  version = get_permission_version(user.pk)
+  if user.is_active and user.is_superuser:
+    return {PERMS_CLAIM: ALL_PERMISSIONS, VERSION_CLAIM: version}
+  permission_ids = Permission.objects.filter(Q(user=user) | Q(group__user=user)).values_list('id', flat=True).distinct()
+  return {PERMS_CLAIM: encode_permissions(permission_ids), VERSION_CLAIM: version}
+
+_permission_ids: Dict[str, int] = {}
+_permission_ids_lock = threading.Lock()
+
+def permission_id(perm: str) -> Optional[int]:
+  """
+  Id del permiso 'app_label.codename'; se consulta una vez por proceso.
+  """
+
+  if perm not in _permission_ids:
+    app_label, _, codename = perm.partition('.')
+    found = Permission.objects.filter(content_type__app_label=app_label, codename=codename).values_list('id', flat=True).first()
+    if found is None:
+      return None
+    with _permission_ids_lock:
+      _permission_ids[perm] = found
+  return _permission_ids[perm]
+
+def token_has_perm(token, perm: str) -> Optional[bool]:
+  """
+  Resuelve un permiso desde el access token, sin consultar la base de datos.
+
+  Returns:
+    bool | None: None si el token no trae permisos o su version es obsoleta (usar has_perm).
+  """
+
+  if token is None or token.get(PERMS_CLAIM) is None:
+    return None
+  if token.get(VERSION_CLAIM) != _cache().get(_version_key(token.get(api_settings.USER_ID_CLAIM))):
+    return None
+  encoded = token[PERMS_CLAIM]
+  if encoded == ALL_PERMISSIONS:
+    return True
+  perm_id = permission_id(perm)
+  return perm_id is not None and bool(decode_permissions(encoded) >> perm_id & 1)
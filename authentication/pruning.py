@@ -0,0 +1,46 @@
+import time
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+
+from authentication.models import TokenWatermark
+
+def prune_expired_tokens(batch_size: int = 1000, pause: float = 0.0, now: Optional[datetime] = None) -> Dict:
+  """
+  Elimina los tokens expirados de token_blacklist (OutstandingToken y su BlacklistedToken)
+  en lotes acotados, cada uno en su propia transaccion corta, y las marcas de
+  TokenWatermark que ya no pueden invalidar ningun token.
+
+  Params:
+    - batch_size: Tokens por lote.
+    - pause: Segundos de espera entre lotes para ceder la tabla a otras transacciones.
+
+  Returns:
+    dict: Filas eliminadas por tabla, lotes y segundos transcurridos.
+  """
+
+  now = now or timezone.now()
+  start = time.monotonic()
+  stats = {'outstanding': 0, 'blacklisted': 0, 'watermarks': 0, 'batches': 0}
+
+  while True:
+    # Recorre el indice de expires_at (migracion authentication.0002)
+    ids = list(OutstandingToken.objects.filter(expires_at__lte=now).order_by().values_list('id', flat=True)[:batch_size])
+    if not ids:
+      break
+    with transaction.atomic():
+      stats['blacklisted'] += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+      stats['outstanding'] += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+    stats['batches'] += 1
+    if pause and len(ids) == batch_size:
+      time.sleep(pause)
+
+  horizon = now - max(api_settings.REFRESH_TOKEN_LIFETIME, api_settings.ACCESS_TOKEN_LIFETIME)
+  stats['watermarks'] = TokenWatermark.objects.filter(revoked_before__lt=horizon).delete()[0]
+  stats['elapsed'] = time.monotonic() - start
+  return stats
@@ -0,0 +1,152 @@
+import time
+import logging
+import threading
+
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from authentication.models import TokenWatermark
+
+logger = logging.getLogger(__name__)
+
+# Valores por defecto de la configuracion TOKEN_REVOCATION (ver config/settings/base.py)
+DEFAULTS = {
+  # Segundos entre recargas de la lista de revocacion desde la base de datos. Las revocaciones
+  # hechas en otro proceso tardan a lo mas este tiempo en aplicar; en el propio proceso son inmediatas
+  'REFRESH_INTERVAL': 30,
+  # Depuracion de tokens expirados (prune_tokens): tokens por lote y pausa entre lotes
+  'PRUNE_BATCH_SIZE': 1000,
+  'PRUNE_PAUSE': 0.1,
+}
+
+def get_revocation_setting(key: str):
+  return getattr(settings, 'TOKEN_REVOCATION', {}).get(key, DEFAULTS[key])
+
+class RevocationRegistry:
+  """
+  Copia en memoria de las revocaciones de tokens para verificarlas en O(1) sin consultar
+  la base de datos en cada request:
+
+  - JTIs de los refresh tokens en la blacklist de simplejwt que aun no expiran.
+  - Marca por usuario (TokenWatermark): tokens con `iat` anterior o igual a la marca son invalidos.
+    La marca conserva la fraccion de segundo y RevocableRefreshToken emite `iat` con fraccion:
+    un token emitido justo despues de la marca, en el mismo segundo, sigue siendo valido.
+
+  Se recarga completa desde la base de datos cada `refresh_interval` segundos (sin
+  notificaciones entre procesos). Las revocaciones del propio proceso se aplican al momento.
+  """
+
+  def __init__(self, refresh_interval: float = 30):
+    self.refresh_interval = float(refresh_interval)
+    self._jtis: FrozenSet[str] = frozenset()
+    self._watermarks: Dict[str, float] = {}
+    # Revocaciones locales hechas durante una recarga (monotonic de cuando se registraron)
+    self._local_jtis: Dict[str, float] = {}
+    self._local_watermarks: Dict[str, float] = {}
+    self._lock = threading.Lock()
+    self._loaded_at: Optional[float] = None
+
+  def is_due(self) -> bool:
+    return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+
+  def refresh(self):
+    """
+    Recarga la blacklist y las marcas vigentes desde la base de datos.
+    """
+
+    started = time.monotonic()
+    now = timezone.now()
+    jtis = frozenset(BlacklistedToken.objects.filter(token__expires_at__gt=now).values_list('token__jti', flat=True))
+    # Una marca mas antigua que la vida de un refresh token ya no puede invalidar ningun token
+    horizon = now - max(api_settings.REFRESH_TOKEN_LIFETIME, api_settings.ACCESS_TOKEN_LIFETIME)
+    watermarks = {
+      str(user_id): _epoch(revoked_before)
+      for user_id, revoked_before in TokenWatermark.objects.filter(revoked_before__gt=horizon).values_list('user_id', 'revoked_before')
+    }
+
+    with self._lock:
+      # Conserva las revocaciones locales que la consulta pudo no ver (aun sin confirmar)
+      self._local_jtis = {jti: at for jti, at in self._local_jtis.items() if at >= started}
+      self._local_watermarks = {key: at for key, at in self._local_watermarks.items() if at >= started}
+      jtis |= frozenset(self._local_jtis)
+      for key in self._local_watermarks:
+        watermarks[key] = max(watermarks.get(key, 0), self._watermarks.get(key, 0))
+      self._jtis, self._watermarks = jtis, watermarks
+      self._loaded_at = time.monotonic()
+
+  def refresh_if_due(self):
+    if not self.is_due():
+      return
+    try:
+      self.refresh()
+    except Exception as e:
+      # Se mantiene la copia anterior; se reintenta en el siguiente request
+      logger.warning(f"[Revocation] No se pudo recargar la lista de revocacion: {e}")
+      if self._loaded_at is None:
+        raise
+
+  async def arefresh_if_due(self):
+    if self.is_due():
+      await sync_to_async(self.refresh_if_due)()
+
+  def is_revoked(self, payload) -> bool:
+    """
+    Verifica un token ya validado (payload o Token) contra la copia en memoria.
+    """
+
+    if payload.get(api_settings.JTI_CLAIM) in self._jtis:
+      return True
+    watermark = self._watermarks.get(str(payload.get(api_settings.USER_ID_CLAIM)))
+    return watermark is not None and payload.get('iat', 0) <= watermark
+
+  def revoke_jti(self, jti: str):
+    with self._lock:
+      self._local_jtis[jti] = time.monotonic()
+      self._jtis = self._jtis | {jti}
+
+  def revoke_user(self, user, at: Optional[datetime] = None) -> datetime:
+    """
+    Invalida todos los tokens emitidos hasta ahora para el usuario (marca en base de datos
+    y en memoria).
+    """
+
+    at = at or timezone.now()
+    TokenWatermark.objects.update_or_create(user=user, defaults={'revoked_before': at})
+    key = str(user.pk)
+    with self._lock:
+      self._local_watermarks[key] = time.monotonic()
+      self._watermarks = {**self._watermarks, key: max(self._watermarks.get(key, 0), _epoch(at))}
+    return at
+
+  def clear(self):
+    with self._lock:
+      self._jtis, self._watermarks = frozenset(), {}
+      self._local_jtis, self._local_watermarks = {}, {}
+      self._loaded_at = None
+
+def _epoch(value: datetime) -> float:
+  # Sin truncar a segundos: un `iat` entero (tokens de simplejwt) del mismo segundo de la marca
+  # es anterior o igual a ella y se invalida; uno con fraccion se compara exacto
+  return value.timestamp()
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_revocation_registry() -> RevocationRegistry:
+  """
+  Retorna el RevocationRegistry del proceso segun `TOKEN_REVOCATION`.
+  """
+
+  global _registry
+  if _registry is None:
+    with _registry_lock:
+      if _registry is None:
+        _registry = RevocationRegistry(refresh_interval=get_revocation_setting('REFRESH_INTERVAL'))
+  return _registry
@@ -1,17 +1,19 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.tokens import TokenError
 
 from django.contrib.auth import get_user_model
 
 from core.base.messages import get_message
 
+from authentication.tokens import RevocableRefreshToken
+
 User = get_user_model()
 
 # Serializador de Login
-class LoginSerializer(TokenObtainPairSerializer):
+class LoginSerializer(serializers.Serializer):
   """
-  Serializador para login de usuario. Valida las credenciales del usuario y devuelve tokens JWT.
+  Serializador para login de usuario. Valida las credenciales con una sola consulta del
+  usuario y un solo calculo de hash, y devuelve tokens JWT si el usuario esta activo.
   """
 
   email = serializers.EmailField()
@@ -20,12 +22,20 @@ class LoginSerializer(TokenObtainPairSerializer):
   def validate(self, attrs):
     email = attrs.get('email')
     password = attrs.get('password')
-    user = User.objects.filter(email=email).first()
+    user = User._default_manager.filter(email=email).first()
+    if user is None:
+      # Mismo costo que una contraseña incorrecta, para no revelar si el correo existe
+      User().set_password(password)
     if user is None or not user.check_password(password):
       raise serializers.ValidationError(
         {"auth": [get_message("errors", "user_invalid_credentials")]}
       )
-    return super().validate(attrs)
+    attrs['user'] = user
+    if user.is_active:
+      refresh = RevocableRefreshToken.for_user(user)
+      attrs['refresh'] = str(refresh)
+      attrs['access'] = str(refresh.access_token)
+    return attrs
 
 # Serializador que regresa informacion del usuario por el Token generado
 class UserWithPermissionsSerializer(serializers.ModelSerializer):
@@ -58,10 +68,8 @@ class LogoutSerializer(serializers.Serializer):
         {"auth": [get_message("errors", "token_required")]}
       )
     try:
-      token = RefreshToken(refresh_token)
-      # Optionally, check if token is blacklisted (if using blacklist app)
-      if hasattr(token, 'check_blacklist'):
-        token.check_blacklist()
+      # La blacklist se verifica al validar el token (RevocableRefreshToken.verify)
+      RevocableRefreshToken(refresh_token)
     except TokenError:
       raise serializers.ValidationError(
         {"auth": [get_message("errors", "token_invalid")]}
@@ -83,7 +91,7 @@ class RefreshTokenSerializer(serializers.Serializer):
         {"auth": [get_message("errors", "token_required")]}
       )
     try:
-      RefreshToken(refresh_token)
+      RevocableRefreshToken(refresh_token)
     except TokenError:
       raise serializers.ValidationError(
           {"auth": [get_message("errors", "token_invalid")]}
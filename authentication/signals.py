@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from authentication.user_cache import invalidate_user, invalidate_users
+from authentication.permission_snapshot import bump_permission_versions
+
+User = get_user_model()
+
+# Invalidacion de la cache de usuarios de CachedJWTAuthentication (authentication.user_cache)
+# y de la version de permisos de los access tokens (authentication.permission_snapshot).
+# Se invalida al momento y otra vez al confirmar la transaccion, para que un request
+# concurrente no deje en cache la fila previa al commit.
+# Nota: QuerySet.update() no emite señales; para desactivar usuarios usar save().
+
+# Campos de User que cambian el resultado de has_perm()
+PERMISSION_FIELDS = {'is_active', 'is_superuser'}
+
+def _invalidate(user_ids):
+  # Cambios de grupos y permisos: usuario en cache y version de permisos
+  user_ids = list(user_ids)
+  if not user_ids:
+    return
+
+  def invalidate():
+    invalidate_users(user_ids)
+    bump_permission_versions(user_ids)
+
+  invalidate()
+  transaction.on_commit(invalidate)
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, update_fields=None, **kwargs):
+  if update_fields is None or PERMISSION_FIELDS & set(update_fields):
+    _invalidate([instance.pk])
+    return
+  invalidate_user(instance.pk)
+  transaction.on_commit(lambda: invalidate_user(instance.pk))
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_cached_user_relations(sender, instance, action, reverse, pk_set, **kwargs):
+  if action not in ('post_add', 'post_remove', 'pre_clear', 'post_clear'):
+    return
+  if not reverse:
+    _invalidate([instance.pk])
+  elif action == 'pre_clear':
+    # Desde el grupo/permiso: se invalidan los usuarios antes de perder la relacion
+    _invalidate(instance.user_set.values_list('pk', flat=True))
+  elif pk_set:
+    _invalidate(pk_set)
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_cached_group_users(sender, instance, action, reverse, pk_set, **kwargs):
+  if action not in ('post_add', 'post_remove', 'pre_clear', 'post_clear'):
+    return
+  if not reverse:
+    if action != 'pre_clear':
+      _invalidate(instance.user_set.values_list('pk', flat=True))
+    return
+  # Desde el permiso: pk_set son grupos (en clear se leen antes de perder la relacion)
+  if action == 'pre_clear':
+    groups = instance.group_set.all()
+  elif action == 'post_clear' or not pk_set:
+    return
+  else:
+    groups = pk_set
+  _invalidate(User.objects.filter(groups__in=groups).values_list('pk', flat=True).distinct())
+
+@receiver(pre_delete, sender=Group)
+def invalidate_cached_group_members(sender, instance, **kwargs):
+  _invalidate(instance.user_set.values_list('pk', flat=True))
@@ -0,0 +1,95 @@
+import pytest
+
+from asgiref.sync import async_to_sync
+
+from django.db import connection
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.backends import CachedJWTAuthentication
+from authentication.checks import check_user_cache
+from authentication.user_cache import get_cached_user
+
+User = get_user_model()
+
+def authenticate(user):
+    request = APIRequestFactory().get("/api/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return CachedJWTAuthentication().authenticate(request)
+
+def user_queries(ctx):
+    return [q for q in ctx.captured_queries if User._meta.db_table in q["sql"]]
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_second_request_does_not_query_user(self):
+        user = User.objects.create_user(email="cached@test.com", password="secret")
+        with CaptureQueriesContext(connection) as ctx:
+            authenticate(user)
+        assert len(user_queries(ctx)) == 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            cached, _ = authenticate(user)
+        assert len(ctx.captured_queries) == 0
+        assert cached.pk == user.pk
+
+    def test_save_invalidates_cached_user(self):
+        user = User.objects.create_user(email="rename@test.com", password="secret", first_name="Antes")
+        authenticate(user)
+        user.first_name = "Despues"
+        user.save()
+        assert get_cached_user(user.pk)[0] is None
+        assert authenticate(user)[0].first_name == "Despues"
+
+    def test_deactivated_user_is_rejected_immediately(self):
+        user = User.objects.create_user(email="inactive@test.com", password="secret")
+        authenticate(user)
+        user.is_active = False
+        user.save()
+        with pytest.raises(AuthenticationFailed):
+            authenticate(user)
+
+    def test_group_changes_invalidate_members(self):
+        user = User.objects.create_user(email="group@test.com", password="secret")
+        group = Group.objects.create(name="Cache")
+        authenticate(user)
+        user.groups.add(group)
+        assert get_cached_user(user.pk)[0] is None
+
+        authenticate(user)
+        group.permissions.add(Permission.objects.first())
+        assert get_cached_user(user.pk)[0] is None
+
+        authenticate(user)
+        group.delete()
+        assert get_cached_user(user.pk)[0] is None
+
+    def test_async_lookup_uses_cache(self):
+        user = User.objects.create_user(email="async-cache@test.com", password="secret")
+        token = AccessToken(str(AccessToken.for_user(user)))
+        authenticate(user)
+        with CaptureQueriesContext(connection) as ctx:
+            cached = async_to_sync(CachedJWTAuthentication().aget_user)(token)
+        assert len(ctx.captured_queries) == 0
+        assert cached.pk == user.pk
+
+class TestUserCacheCheck:
+    def test_warns_on_process_local_cache_in_production(self, settings, monkeypatch):
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        settings.DEBUG = True
+        assert check_user_cache(None) == []
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        assert [warning.id for warning in check_user_cache(None)] == ["authentication.W001"]
+
+        monkeypatch.delenv("WEB_CONCURRENCY")
+        settings.DEBUG = False
+        assert [warning.id for warning in check_user_cache(None)] == ["authentication.W001"]
+
+    def test_shared_cache_passes(self, settings, tmp_path):
+        settings.DEBUG = False
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}}
+        assert check_user_cache(None) == []
@@ -0,0 +1,63 @@
+import pytest
+
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+User = get_user_model()
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    hasher = type(get_hasher("default"))
+    encode = hasher.encode
+    calls = []
+
+    def counted(self, *args, **kwargs):
+        calls.append(1)
+        return encode(self, *args, **kwargs)
+
+    monkeypatch.setattr(hasher, "encode", counted)
+    return calls
+
+def login(email, password):
+    return APIClient().post(reverse("login"), {"email": email, "password": password}, format="json")
+
+def user_lookups(ctx):
+    table = connection.ops.quote_name(User._meta.db_table)
+    return [q for q in ctx.captured_queries if f"FROM {table} WHERE" in q["sql"]]
+
+@pytest.mark.django_db
+class TestLoginView:
+    def test_success_uses_one_lookup_and_one_hash(self, hash_calls):
+        User.objects.create_user(email="single@test.com", password="secret")
+        hash_calls.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = login("single@test.com", "secret")
+        assert response.status_code == 200
+        assert {"access", "refresh", "user"} <= set(response.data["data"])
+        assert len(user_lookups(ctx)) == 1
+        assert len(hash_calls) == 1
+
+    def test_wrong_password_uses_one_hash(self, hash_calls):
+        User.objects.create_user(email="wrong@test.com", password="secret")
+        hash_calls.clear()
+        assert login("wrong@test.com", "nope").status_code == 400
+        assert len(hash_calls) == 1
+
+    def test_unknown_email_costs_one_hash(self, hash_calls):
+        assert login("nobody@test.com", "secret").status_code == 400
+        assert len(hash_calls) == 1
+
+    def test_inactive_user_is_forbidden_without_tokens(self):
+        User.objects.create_user(email="disabled@test.com", password="secret", is_active=False)
+        response = login("disabled@test.com", "secret")
+        assert response.status_code == 403
+        assert not OutstandingToken.objects.exists()
+
+    def test_inactive_user_with_wrong_password_gets_invalid_credentials(self):
+        User.objects.create_user(email="disabled2@test.com", password="secret", is_active=False)
+        assert login("disabled2@test.com", "nope").status_code == 400
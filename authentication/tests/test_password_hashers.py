@@ -0,0 +1,56 @@
+import pytest
+from io import StringIO
+
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from authentication.hashers import TunedPBKDF2PasswordHasher, calibrate
+
+User = get_user_model()
+
+def stored_iterations(user):
+    user.refresh_from_db()
+    return int(user.password.split("$")[1])
+
+@pytest.mark.django_db
+class TestRehashOnLogin:
+    def test_outdated_hash_is_rehashed_with_configured_cost(self):
+        with override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 1000}):
+            user = User.objects.create_user(email="rehash@test.com", password="secret")
+        assert stored_iterations(user) == 1000
+
+        with override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 2000}):
+            response = APIClient().post(reverse("login"), {"email": "rehash@test.com", "password": "secret"}, format="json")
+        assert response.status_code == 200
+        assert stored_iterations(user) == 2000
+
+    def test_failed_login_does_not_rehash(self):
+        with override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 1000}):
+            user = User.objects.create_user(email="norehash@test.com", password="secret")
+        with override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 2000}):
+            APIClient().post(reverse("login"), {"email": "norehash@test.com", "password": "wrong"}, format="json")
+        assert stored_iterations(user) == 1000
+
+class TestCalibration:
+    def test_default_hasher_reads_cost_from_settings(self):
+        assert isinstance(get_hasher("default"), TunedPBKDF2PasswordHasher)
+        with override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 1234}):
+            assert get_hasher("default").iterations == 1234
+
+    @override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 20000})
+    def test_proposal_scales_towards_target(self):
+        # 20000 iteraciones toman pocos ms en cualquier maquina
+        result = calibrate("pbkdf2_sha256", target=0.2, samples=1)
+        assert result["current"] == {"PBKDF2_ITERATIONS": 20000}
+        assert result["proposed"]["PBKDF2_ITERATIONS"] > 20000
+
+    @override_settings(PASSWORD_HASHING={"PBKDF2_ITERATIONS": 10000})
+    def test_command_prints_settings_snippet(self):
+        out = StringIO()
+        call_command("calibrate_password_hashers", "--target-ms", "5", "--samples", "1", "--algorithm", "pbkdf2_sha256", stdout=out)
+        assert "PASSWORD_HASHING = {" in out.getvalue()
+        assert "'PBKDF2_ITERATIONS':" in out.getvalue()
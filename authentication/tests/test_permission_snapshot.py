@@ -0,0 +1,112 @@
+import pytest
+
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from authentication.checks import check_permission_snapshot_cache
+from authentication.permission_snapshot import encode_permissions, decode_permissions, PERMS_CLAIM, VERSION_CLAIM
+from authentication.tokens import RevocableRefreshToken
+
+User = get_user_model()
+
+@pytest.fixture(autouse=True)
+def snapshot_settings(settings):
+    settings.PERMISSION_SNAPSHOT = {"ENABLED": True}
+    settings.PASSWORD_HASHING = {"PBKDF2_ITERATIONS": 1000}
+
+@pytest.fixture
+def log_viewers():
+    group = Group.objects.create(name="Auditores")
+    group.permissions.add(Permission.objects.get(content_type__app_label="core", codename="view_accesslog"))
+    return group
+
+def access_token(user):
+    return RevocableRefreshToken.for_user(user).access_token
+
+def client_for(token):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+def permission_queries(ctx):
+    return [q for q in ctx.captured_queries if "auth_permission" in q["sql"]]
+
+def test_check_rejects_process_local_cache(settings, tmp_path):
+    assert [error.id for error in check_permission_snapshot_cache(None)] == ["authentication.E001"]
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}}
+    assert check_permission_snapshot_cache(None) == []
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.PERMISSION_SNAPSHOT = {"ENABLED": False}
+    assert check_permission_snapshot_cache(None) == []
+
+def test_bitset_round_trip():
+    encoded = encode_permissions([1, 9, 130])
+    bits = decode_permissions(encoded)
+    assert [n for n in range(200) if bits >> n & 1] == [1, 9, 130]
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestPermissionSnapshot:
+    def test_access_token_carries_permissions(self, log_viewers):
+        user = User.objects.create_user(email="snapshot@test.com", password="secret")
+        user.groups.add(log_viewers)
+        token = access_token(user)
+        assert token[PERMS_CLAIM] and token[VERSION_CLAIM]
+        assert PERMS_CLAIM not in RevocableRefreshToken.for_user(user).payload
+
+    def test_permission_class_authorizes_from_token(self, log_viewers):
+        user = User.objects.create_user(email="reader@test.com", password="secret")
+        user.groups.add(log_viewers)
+        client = client_for(access_token(user))
+        client.get(reverse("access-log-list"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse("access-log-list"))
+        assert response.status_code == 200
+        assert permission_queries(ctx) == []
+
+    def test_token_without_permission_is_denied(self):
+        user = User.objects.create_user(email="nobody@test.com", password="secret")
+        assert client_for(access_token(user)).get(reverse("access-log-list")).status_code == 403
+
+    def test_disabled_mode_does_not_add_claims(self, settings):
+        settings.PERMISSION_SNAPSHOT = {"ENABLED": False}
+        user = User.objects.create_user(email="plain@test.com", password="secret")
+        assert PERMS_CLAIM not in access_token(user).payload
+
+    def test_role_removal_makes_token_stale(self, log_viewers):
+        admin = User.objects.create_user(email="admin-snap@test.com", password="secret", user_type="admin")
+        user = User.objects.create_user(email="removed@test.com", password="secret")
+        user.groups.add(log_viewers)
+        client = client_for(access_token(user))
+        assert client.get(reverse("access-log-list")).status_code == 200
+
+        response = client_for(access_token(admin)).post(reverse("remove-role-to-user"), {"user_id": user.pk, "role_id": log_viewers.pk}, format="json")
+        assert response.status_code == 200
+        assert client.get(reverse("access-log-list")).status_code == 403
+
+    def test_role_assignment_is_seen_before_refresh(self, log_viewers):
+        admin = User.objects.create_user(email="admin-assign@test.com", password="secret", user_type="admin")
+        user = User.objects.create_user(email="assigned@test.com", password="secret")
+        client = client_for(access_token(user))
+        assert client.get(reverse("access-log-list")).status_code == 403
+
+        response = client_for(access_token(admin)).post(reverse("assign-role-to-user"), {"user_id": user.pk, "role_id": log_viewers.pk}, format="json")
+        assert response.status_code == 200
+        assert client.get(reverse("access-log-list")).status_code == 200
+
+    def test_role_permission_update_makes_token_stale(self, log_viewers):
+        admin = User.objects.create_user(email="admin-role@test.com", password="secret", user_type="admin")
+        user = User.objects.create_user(email="member@test.com", password="secret")
+        user.groups.add(log_viewers)
+        client = client_for(access_token(user))
+        assert client.get(reverse("access-log-list")).status_code == 200
+
+        response = client_for(access_token(admin)).patch(reverse("rol-detail", args=[log_viewers.pk]), {"permissions": []}, format="json")
+        assert response.status_code == 200
+        assert client.get(reverse("access-log-list")).status_code == 403
@@ -0,0 +1,58 @@
+import pytest
+from io import StringIO
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+
+from authentication.models import TokenWatermark
+from authentication.pruning import prune_expired_tokens
+from authentication.tokens import RevocableRefreshToken
+
+User = get_user_model()
+
+def expired_tokens(user, count, blacklist=0):
+    tokens = [RevocableRefreshToken.for_user(user) for _ in range(count)]
+    for token in tokens[:blacklist]:
+        token.blacklist()
+    OutstandingToken.objects.filter(jti__in=[t["jti"] for t in tokens]).update(expires_at=timezone.now() - timedelta(days=1))
+    return tokens
+
+@pytest.mark.django_db
+class TestPruneTokens:
+    def test_prunes_only_expired_tokens_in_batches(self):
+        user = User.objects.create_user(email="prune@test.com", password="secret")
+        expired_tokens(user, 5, blacklist=2)
+        live = RevocableRefreshToken.for_user(user)
+        live.blacklist()
+
+        stats = prune_expired_tokens(batch_size=2)
+        assert stats["outstanding"] == 5
+        assert stats["blacklisted"] == 2
+        assert stats["batches"] == 3
+        assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [live["jti"]]
+        assert BlacklistedToken.objects.count() == 1
+
+    def test_prunes_stale_watermarks(self):
+        user = User.objects.create_user(email="stale-mark@test.com", password="secret")
+        TokenWatermark.objects.create(user=user, revoked_before=timezone.now() - timedelta(days=30))
+        assert prune_expired_tokens()["watermarks"] == 1
+
+    def test_command_reports_rows_and_time(self):
+        user = User.objects.create_user(email="prune-cmd@test.com", password="secret")
+        expired_tokens(user, 3, blacklist=1)
+        out = StringIO()
+        call_command("prune_tokens", "--batch-size", "2", "--pause", "0", stdout=out)
+        assert "3 outstanding, 1 blacklisted" in out.getvalue()
+        assert "2 lotes" in out.getvalue()
+        assert OutstandingToken.objects.count() == 0
+
+    def test_dry_run_does_not_delete(self):
+        user = User.objects.create_user(email="prune-dry@test.com", password="secret")
+        expired_tokens(user, 2)
+        out = StringIO()
+        call_command("prune_tokens", "--dry-run", stdout=out)
+        assert "2 tokens expirados" in out.getvalue()
+        assert OutstandingToken.objects.count() == 2
@@ -0,0 +1,117 @@
+import time
+import pytest
+from datetime import timedelta
+
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+
+from authentication.models import TokenWatermark
+from authentication.revocation import RevocationRegistry, get_revocation_registry
+from authentication.tokens import RevocableRefreshToken
+
+User = get_user_model()
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    yield
+    get_revocation_registry().clear()
+
+def issued(user, seconds_ago=5):
+    # Tokens emitidos antes de la marca
+    refresh = RevocableRefreshToken.for_user(user)
+    refresh.set_iat(at_time=timezone.now() - timedelta(seconds=seconds_ago))
+    return refresh
+
+def api_client(refresh):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    return client
+
+@pytest.mark.django_db
+class TestRevocationRegistry:
+    def test_blacklisted_jti_is_loaded_on_refresh(self):
+        user = User.objects.create_user(email="jti@test.com", password="secret")
+        refresh = RefreshToken.for_user(user)
+        refresh.blacklist()
+        registry = RevocationRegistry(refresh_interval=3600)
+        registry.refresh()
+        assert registry.is_revoked(refresh.payload)
+        assert not registry.is_revoked(RefreshToken.for_user(user).payload)
+
+    def test_watermark_from_other_process_applies_after_interval(self):
+        user = User.objects.create_user(email="mark@test.com", password="secret")
+        token = issued(user)
+        registry = RevocationRegistry(refresh_interval=0.05)
+        registry.refresh_if_due()
+        TokenWatermark.objects.create(user=user, revoked_before=timezone.now())
+        assert not registry.is_revoked(token.payload)
+        time.sleep(0.06)
+        registry.refresh_if_due()
+        assert registry.is_revoked(token.payload)
+
+    def test_check_does_not_query_until_due(self):
+        user = User.objects.create_user(email="noquery@test.com", password="secret")
+        token = RevocableRefreshToken.for_user(user)
+        get_revocation_registry().refresh()
+        with CaptureQueriesContext(connection) as ctx:
+            RevocableRefreshToken(str(token))
+        assert len(ctx.captured_queries) == 0
+
+    def test_local_blacklist_is_immediate(self):
+        user = User.objects.create_user(email="local@test.com", password="secret")
+        token = RevocableRefreshToken.for_user(user)
+        get_revocation_registry().refresh()
+        token.blacklist()
+        with pytest.raises(TokenError):
+            RevocableRefreshToken(str(token))
+
+@pytest.mark.django_db
+class TestLogoutAllView:
+    def test_logout_all_revokes_access_and_refresh_tokens(self):
+        user = User.objects.create_user(email="everywhere@test.com", password="secret")
+        refresh = issued(user)
+        client = api_client(refresh)
+        other_device = issued(user)
+
+        response = client.post(reverse("logout-all"))
+        assert response.status_code == 205
+        assert TokenWatermark.objects.filter(user=user).exists()
+
+        assert client.post(reverse("logout-all")).status_code == 401
+        assert api_client(other_device).post(reverse("logout-all")).status_code == 401
+        response = APIClient().post(reverse("token-refresh"), {"refresh": str(refresh)}, format="json")
+        assert response.status_code == 400
+
+    def test_tokens_issued_after_logout_all_are_valid(self):
+        user = User.objects.create_user(email="after@test.com", password="secret")
+        get_revocation_registry().revoke_user(user, at=timezone.now() - timedelta(seconds=5))
+        refresh = RevocableRefreshToken.for_user(user)
+        assert api_client(refresh).post(reverse("logout-all")).status_code == 205
+
+    def test_relogin_in_the_same_second_as_logout_all(self, monkeypatch):
+        user = User.objects.create_user(email="relogin@test.com", password="secret")
+        second = timezone.now().replace(microsecond=0)
+        before = RevocableRefreshToken.for_user(user)
+        before.set_iat(at_time=second + timedelta(milliseconds=100))
+        get_revocation_registry().revoke_user(user, at=second + timedelta(milliseconds=200))
+
+        monkeypatch.setattr("rest_framework_simplejwt.tokens.aware_utcnow", lambda: second + timedelta(milliseconds=300))
+        after = RevocableRefreshToken.for_user(user)
+        assert int(after["iat"]) == int(before["iat"])
+        assert get_revocation_registry().is_revoked(before.access_token.payload)
+        assert not get_revocation_registry().is_revoked(after.access_token.payload)
+
+    def test_relogin_right_after_logout_all(self):
+        user = User.objects.create_user(email="again@test.com", password="secret")
+        client = api_client(issued(user))
+        assert client.post(reverse("logout-all")).status_code == 205
+        refresh = RevocableRefreshToken.for_user(user)
+        assert api_client(refresh).post(reverse("logout-all")).status_code == 205
+
+    def test_logout_all_requires_authentication(self):
+        assert APIClient().post(reverse("logout-all")).status_code == 401
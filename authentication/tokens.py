@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+
+from authentication.revocation import get_revocation_registry
+from authentication.permission_snapshot import get_snapshot_setting, permission_claims
+
+class RevocableRefreshToken(RefreshToken):
+  """
+  RefreshToken que verifica la blacklist contra la copia en memoria (RevocationRegistry)
+  en lugar de consultar BlacklistedToken, e incluye la marca de "cerrar sesion en todos
+  los dispositivos". blacklist() sigue escribiendo en las tablas de simplejwt.
+
+  Con PERMISSION_SNAPSHOT['ENABLED'] cada access token lleva los permisos vigentes del
+  usuario (ver authentication.permission_snapshot).
+  """
+
+  @classmethod
+  def for_user(cls, user):
+    token = super().for_user(user)
+    # Evita volver a consultar el usuario al generar el access token del login
+    token._user = user
+    return token
+
+  def set_iat(self, claim: str = 'iat', at_time=None):
+    # `iat` con fraccion de segundo (NumericDate, RFC 7519): distingue un token emitido justo
+    # despues de "cerrar sesion en todos los dispositivos" de uno emitido antes en el mismo segundo.
+    # El access token copia el `iat` del refresh token
+    self.payload[claim] = (at_time or self.current_time).timestamp()
+
+  @property
+  def access_token(self):
+    access = super().access_token
+    if get_snapshot_setting('ENABLED'):
+      user = getattr(self, '_user', None) or get_user_model()._default_manager.filter(
+        **{api_settings.USER_ID_FIELD: self.payload.get(api_settings.USER_ID_CLAIM)}
+      ).first()
+      if user is not None:
+        access.payload.update(permission_claims(user))
+    return access
+
+  def check_blacklist(self):
+    registry = get_revocation_registry()
+    registry.refresh_if_due()
+    if registry.is_revoked(self.payload):
+      raise TokenError(_("Token is blacklisted"))
+
+  def blacklist(self):
+    result = super().blacklist()
+    get_revocation_registry().revoke_jti(self.payload[api_settings.JTI_CLAIM])
+    return result
@@ -1,9 +1,10 @@
 from django.urls import path
 
-from authentication.views.auth_views import LoginView, LogoutView, RefreshTokenView
+from authentication.views.auth_views import LoginView, LogoutView, LogoutAllView, RefreshTokenView
 
 urlpatterns = [
   path('login/', LoginView.as_view(), name='login'),
   path('logout/', LogoutView.as_view(), name='logout'),
+  path('logout/all/', LogoutAllView.as_view(), name='logout-all'),
   path('token/refresh/', RefreshTokenView.as_view(), name='token-refresh'),
 ]
\ No newline at end of file
@@ -0,0 +1,80 @@
+import uuid
+
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Valores por defecto de la configuracion AUTH_USER_CACHE (ver config/settings/base.py)
+DEFAULTS = {
+  # Alias en CACHES; con varios procesos debe ser compartida (Redis/Memcached) para que la
+  # invalidacion (ej. desactivar un usuario) aplique de inmediato en todos
+  'CACHE': 'default',
+  # Segundos que un usuario permanece en cache
+  'TIMEOUT': 60,
+  'KEY_PREFIX': 'auth:user',
+}
+
+def get_user_cache_setting(key: str):
+  return getattr(settings, 'AUTH_USER_CACHE', {}).get(key, DEFAULTS[key])
+
+def _cache():
+  return caches[get_user_cache_setting('CACHE')]
+
+def _keys(user_id):
+  prefix = get_user_cache_setting('KEY_PREFIX')
+  return f'{prefix}:{user_id}', f'{prefix}:{user_id}:version'
+
+def _lookup(values, user_key, version_key):
+  # Valido solo si la version guardada con el usuario es la version vigente
+  entry = values.get(user_key)
+  version = values.get(version_key)
+  if entry is not None and version is not None and entry[0] == version:
+    return entry[1], version
+  return None, version
+
+def get_cached_user(user_id):
+  """
+  Retorna (usuario o None, version vigente) con una sola lectura a la cache.
+  """
+
+  user_key, version_key = _keys(user_id)
+  return _lookup(_cache().get_many([user_key, version_key]), user_key, version_key)
+
+async def aget_cached_user(user_id):
+  user_key, version_key = _keys(user_id)
+  return _lookup(await _cache().aget_many([user_key, version_key]), user_key, version_key)
+
+def cache_user(user, version: Optional[str]):
+  """
+  Guarda el usuario con la version leida ANTES de consultarlo en la base de datos: si se
+  invalido mientras tanto, la entrada nace obsoleta y se ignora.
+  """
+
+  cache = _cache()
+  user_key, version_key = _keys(user.pk)
+  if version is None:
+    version = uuid.uuid4().hex
+    if not cache.add(version_key, version, timeout=None):
+      return
+  cache.set(user_key, (version, user), timeout=get_user_cache_setting('TIMEOUT'))
+
+async def acache_user(user, version: Optional[str]):
+  cache = _cache()
+  user_key, version_key = _keys(user.pk)
+  if version is None:
+    version = uuid.uuid4().hex
+    if not await cache.aadd(version_key, version, timeout=None):
+      return
+  await cache.aset(user_key, (version, user), timeout=get_user_cache_setting('TIMEOUT'))
+
+def invalidate_user(user_id):
+  """
+  Invalida el usuario en cache cambiando su version (las entradas previas dejan de ser validas).
+  """
+
+  _, version_key = _keys(user_id)
+  _cache().set(version_key, uuid.uuid4().hex, timeout=None)
+
+def invalidate_users(user_ids):
+  _cache().set_many({_keys(user_id)[1]: uuid.uuid4().hex for user_id in user_ids}, timeout=None)
@@ -1,21 +1,21 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.views import TokenObtainPairView
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
 
 from drf_spectacular.utils import extend_schema, OpenApiExample
-from django.contrib.auth import authenticate
 
 from core.base.messages import get_message
 from core.base.serializers.responses_serializer import (
   login_response_serializer, refresh_response_serializer,
   error_400_serializer, error_401_serializer, 
-  error_403_serializer, error_404_serializer
+  error_403_serializer
 )
 from core.utils.mixins import APIResponseMixin
 from core.utils.decorators import LogActionView
 
+from authentication.revocation import get_revocation_registry
+from authentication.tokens import RevocableRefreshToken
 from authentication.serializers.auth_serializer import (
   UserWithPermissionsSerializer, 
   LoginSerializer, LogoutSerializer, 
@@ -28,31 +28,21 @@ from authentication.serializers.auth_serializer import (
   request=LoginSerializer,
   responses={
     200: login_response_serializer,
+    400: error_400_serializer,
     403: error_403_serializer,
-    404: error_404_serializer,
   },
 )
-class LoginView(APIResponseMixin, TokenObtainPairView):
+class LoginView(APIResponseMixin, APIView):
   authentication_classes = []
   permission_classes = [AllowAny]
 
-  @LogActionView(action_base=get_message("logs", "login"))
+  @LogActionView(action_base=get_message("logs", "login"), always_log=True)
   def post(self, request):
+    # Una consulta del usuario y un calculo de hash por intento (LoginSerializer)
     serializer = LoginSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
+    user = serializer.validated_data['user']
 
-    email = serializer.validated_data['email']
-    password = serializer.validated_data['password']
-
-    user = authenticate(request, username=email, password=password)
-
-    if user is None:
-      return self.error_response(
-        message=get_message("generic", "not_found"),
-        errors={"user": [get_message("errors", "user_invalid_credentials")]},
-        status_code=status.HTTP_404_NOT_FOUND
-      )
-    
     if not user.is_active:
       return self.error_response(
         message=get_message("generic", "forbidden"),
@@ -60,15 +50,11 @@ class LoginView(APIResponseMixin, TokenObtainPairView):
         status_code=status.HTTP_403_FORBIDDEN
       )
     
-    refresh = RefreshToken.for_user(user)
-    access_token = str(refresh.access_token)
-    refresh_token = str(refresh)
-
     user_data = UserWithPermissionsSerializer(user).data
 
     data = {
-      "access": access_token,
-      "refresh": refresh_token,
+      "access": serializer.validated_data['access'],
+      "refresh": serializer.validated_data['refresh'],
       "user": user_data,
     }
 
@@ -88,14 +74,14 @@ class LoginView(APIResponseMixin, TokenObtainPairView):
     }
 )
 class LogoutView(APIResponseMixin, APIView):
-  @LogActionView(action_base=get_message("logs", "logout"))
+  @LogActionView(action_base=get_message("logs", "logout"), always_log=True)
   def post(self, request):
     serializer = LogoutSerializer(data=request.data)
     if serializer.is_valid():
       refresh_token = serializer.validated_data['refresh']
 
       try:
-        token = RefreshToken(refresh_token)
+        token = RevocableRefreshToken(refresh_token)
         token.blacklist()
       except TokenError:
         return self.error_response(
@@ -120,6 +106,23 @@ class LogoutView(APIResponseMixin, APIView):
       status_code=status.HTTP_401_UNAUTHORIZED
     )
 
+@extend_schema(
+    summary="Cerrar sesión en todos los dispositivos",
+    description="Invalida todos los tokens (access y refresh) emitidos hasta ahora para el usuario autenticado.",
+    request=None,
+    responses={
+      205: OpenApiExample("Response", value={"status_code": "205"}, response_only=True, status_codes=["205"]),
+      401: error_401_serializer
+    }
+)
+class LogoutAllView(APIResponseMixin, APIView):
+  @LogActionView(action_base=get_message("logs", "logout_all"), always_log=True)
+  def post(self, request):
+    get_revocation_registry().revoke_user(request.user)
+    return self.onlystatus_response(
+      status_code=status.HTTP_205_RESET_CONTENT
+    )
+
 @extend_schema(
   summary="Refrescar token de acceso",
   description="Permite obtener un nuevo access token usando un refresh token válido.",
@@ -133,14 +136,14 @@ class LogoutView(APIResponseMixin, APIView):
 class RefreshTokenView(APIResponseMixin, APIView):
   permission_classes = [AllowAny]
 
-  @LogActionView(action_base=get_message("logs", "token_refresh"))
+  @LogActionView(action_base=get_message("logs", "token_refresh"), always_log=True)
   def post(self, request):
     serializer = RefreshTokenSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     refresh_token = serializer.validated_data['refresh']
 
     try:
-      refresh = RefreshToken(refresh_token)
+      refresh = RevocableRefreshToken(refresh_token)
       access_token = str(refresh.access_token)
     except TokenError:
       return self.error_response(
@@ -0,0 +1,119 @@
+"""
+Compara la concurrencia del listado de usuarios servido por gunicorn con worker sync
+(el CMD del Dockerfile, endpoint DRF sincrono) contra uvicorn (ASGI, endpoint async).
+
+Crea (o reutiliza) un usuario admin en la base de datos configurada, levanta cada
+servidor en un puerto local, lanza `--requests` peticiones con `--concurrency`
+conexiones simultaneas y reporta peticiones/s y latencias p50/p95.
+
+Requiere gunicorn y uvicorn instalados y la base de datos migrada.
+
+Uso:
+  python benchmarks/asgi_concurrency.py [--requests 2000] [--concurrency 50] [--workers 1]
+"""
+
+import os
+import sys
+import time
+import socket
+import secrets
+import asyncio
+import argparse
+import statistics
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+import django
+
+django.setup()
+
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+
+SYNC_PATH = '/api/accounts/users/users/'
+ASYNC_PATH = '/api/accounts/users/async/users/'
+BENCH_EMAIL = 'benchmark@menvitta.local'
+
+def bench_token() -> str:
+  User = get_user_model()
+  user = User.objects.filter(email=BENCH_EMAIL).first()
+  if user is None:
+    user = User.objects.create_user(email=BENCH_EMAIL, password=secrets.token_urlsafe(24), user_type='admin')
+  return str(AccessToken.for_user(user))
+
+def wait_for_port(port: int, timeout: float = 20.0):
+  deadline = time.monotonic() + timeout
+  while time.monotonic() < deadline:
+    with socket.socket() as sock:
+      if sock.connect_ex(('127.0.0.1', port)) == 0:
+        return
+    time.sleep(0.1)
+  raise RuntimeError(f"El servidor no respondio en el puerto {port}")
+
+async def fetch(port: int, path: str, token: str) -> float:
+  start = time.perf_counter()
+  reader, writer = await asyncio.open_connection('127.0.0.1', port)
+  writer.write((
+    f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nAuthorization: Bearer {token}\r\n"
+    "Connection: close\r\n\r\n"
+  ).encode())
+  await writer.drain()
+  status_line = await reader.readline()
+  await reader.read()
+  writer.close()
+  if b' 200 ' not in status_line:
+    raise RuntimeError(f"Respuesta inesperada: {status_line!r}")
+  return time.perf_counter() - start
+
+async def load(port: int, path: str, token: str, requests: int, concurrency: int):
+  semaphore = asyncio.Semaphore(concurrency)
+
+  async def one():
+    async with semaphore:
+      return await fetch(port, path, token)
+
+  start = time.perf_counter()
+  latencies = await asyncio.gather(*(one() for _ in range(requests)))
+  return time.perf_counter() - start, sorted(latencies)
+
+def run_server(command, port: int, path: str, token: str, args):
+  env = dict(os.environ, ACCESS_LOG_SINK='buffer')
+  process = subprocess.Popen(command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  try:
+    wait_for_port(port)
+    # Calentamiento: imports, conexiones y caches
+    asyncio.run(load(port, path, token, min(50, args.requests), 5))
+    elapsed, latencies = asyncio.run(load(port, path, token, args.requests, args.concurrency))
+  finally:
+    process.terminate()
+    process.wait(timeout=10)
+  return {
+    'rps': args.requests / elapsed,
+    'p50': statistics.median(latencies) * 1000,
+    'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--requests', type=int, default=2000)
+  parser.add_argument('--concurrency', type=int, default=50)
+  parser.add_argument('--workers', type=int, default=1, help="Procesos por servidor (gunicorn -w / uvicorn --workers)")
+  parser.add_argument('--port', type=int, default=8765)
+  args = parser.parse_args()
+
+  token = bench_token()
+  servers = (
+    ('gunicorn (sync)', [sys.executable, '-m', 'gunicorn', 'config.wsgi:application', '--bind', f'127.0.0.1:{args.port}', '-w', str(args.workers)], args.port, SYNC_PATH),
+    ('uvicorn (async)', [sys.executable, '-m', 'uvicorn', 'config.asgi:application', '--port', str(args.port + 1), '--workers', str(args.workers), '--no-access-log'], args.port + 1, ASYNC_PATH),
+  )
+
+  print(f"requests: {args.requests}  concurrency: {args.concurrency}  workers: {args.workers}")
+  for name, command, port, path in servers:
+    result = run_server(command, port, path, token, args)
+    print(f"{name:16} {result['rps']:8.1f} req/s   p50 {result['p50']:7.1f} ms   p95 {result['p95']:7.1f} ms")
+
+if __name__ == '__main__':
+  main()
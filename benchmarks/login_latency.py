@@ -0,0 +1,118 @@
+"""
+Mide la latencia y el tiempo de CPU por request de POST /api/auth/login/ (pipeline
+completo: middleware, vista, serializador, tokens y log), para un login correcto, una
+contraseña incorrecta y un correo inexistente. Reporta tambien los calculos de hash por
+request; el login debe hacer exactamente uno en los tres casos.
+
+Crea (o reutiliza) un usuario en la base de datos configurada; requiere la base de datos migrada.
+
+Uso:
+  python benchmarks/login_latency.py [--requests 50]
+"""
+
+import io
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import statistics
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+import django
+
+django.setup()
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.test import Client, override_settings
+from django.urls import reverse
+
+BENCH_EMAIL = 'login-benchmark@menvitta.local'
+BENCH_PASSWORD = 'Benchmark-login-1'
+
+class HashCounter:
+  """
+  Cuenta las llamadas a encode() del hasher por defecto (verificar y generar un hash).
+  """
+
+  def __init__(self):
+    self.hasher = type(get_hasher('default'))
+    self.encode = self.hasher.encode
+    self.calls = 0
+
+  def __enter__(self):
+    counter = self
+
+    def encode(hasher, *args, **kwargs):
+      counter.calls += 1
+      return counter.encode(hasher, *args, **kwargs)
+
+    self.hasher.encode = encode
+    return self
+
+  def __exit__(self, *exc):
+    self.hasher.encode = self.encode
+
+def bench_user():
+  User = get_user_model()
+  user = User.objects.filter(email=BENCH_EMAIL).first()
+  if user is None:
+    return User.objects.create_user(email=BENCH_EMAIL, password=BENCH_PASSWORD, first_name='Bench', last_name='Login')
+  user.set_password(BENCH_PASSWORD)
+  user.is_active = True
+  user.save()
+  return user
+
+def run(client, email: str, password: str, expected: int, requests: int):
+  body = json.dumps({'email': email, 'password': password})
+  wall, cpu = [], []
+  # Los intentos fallidos escriben en stdout (LogActionView) y en el logger django.request
+  with HashCounter() as counter, contextlib.redirect_stdout(io.StringIO()):
+    for _ in range(requests):
+      start_wall, start_cpu = time.perf_counter(), time.process_time()
+      response = client.post(reverse('login'), body, content_type='application/json')
+      wall.append(time.perf_counter() - start_wall)
+      cpu.append(time.process_time() - start_cpu)
+      if response.status_code != expected:
+        raise RuntimeError(f"Respuesta inesperada {response.status_code}: {response.content[:200]!r}")
+  wall.sort()
+  return {
+    'p50': statistics.median(wall) * 1000,
+    'p95': wall[max(int(len(wall) * 0.95) - 1, 0)] * 1000,
+    'cpu': statistics.mean(cpu) * 1000,
+    'hashes': counter.calls / requests,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--requests', type=int, default=50)
+  args = parser.parse_args()
+
+  logging.getLogger('django.request').setLevel(logging.CRITICAL)
+  bench_user()
+  cases = (
+    ('login correcto', BENCH_EMAIL, BENCH_PASSWORD, 200),
+    ('contraseña mala', BENCH_EMAIL, 'incorrecta', 400),
+    ('correo inexistente', 'nadie@menvitta.local', BENCH_PASSWORD, 400),
+  )
+
+  with override_settings(ALLOWED_HOSTS=['*']):
+    client = Client()
+    # Calentamiento: imports, URLconf y conexion
+    run(client, BENCH_EMAIL, BENCH_PASSWORD, 200, 2)
+
+    print(f"requests: {args.requests}  hasher: {get_hasher('default').algorithm}")
+    for name, email, password, expected in cases:
+      result = run(client, email, password, expected, args.requests)
+      print(
+        f"{name:20} p50 {result['p50']:7.1f} ms   p95 {result['p95']:7.1f} ms   "
+        f"cpu {result['cpu']:7.1f} ms/request   hashes {result['hashes']:.1f}/request"
+      )
+
+if __name__ == '__main__':
+  main()
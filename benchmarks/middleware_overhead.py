@@ -0,0 +1,112 @@
+"""
+Mide el costo por request de la cadena de middleware en una ruta /api/, antes
+(pipeline completo de Django + 3 middlewares del core) y despues (apiFastPath +
+CoreRequestMiddleware). La vista no hace trabajo: el tiempo es solo del middleware.
+
+Uso:
+  python benchmarks/middleware_overhead.py [--requests 20000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.http import JsonResponse
+from django.test import RequestFactory, override_settings
+from django.urls import path
+from django.utils import translation
+
+def noop_view(request):
+  return JsonResponse({'success': True})
+
+urlpatterns = [path('api/bench/', noop_view)]
+
+# Middlewares previos del core (sin cambios de comportamiento) para la linea base
+_local = threading.local()
+
+class LegacyUpdateUserInfoMiddleware:
+  def __init__(self, get_response):
+    self.get_response = get_response
+
+  def __call__(self, request):
+    response = self.get_response(request)
+    if request.path.startswith('/api/') and request.user.is_authenticated:
+      pass
+    return response
+
+class LegacyLanguageFromUserMiddleware:
+  def __init__(self, get_response):
+    self.get_response = get_response
+
+  def __call__(self, request):
+    if request.user.is_authenticated:
+      translation.activate(getattr(request.user, 'language', 'es'))
+    return self.get_response(request)
+
+class LegacyThreadLocalUserMiddleware:
+  def __init__(self, get_response):
+    self.get_response = get_response
+
+  def __call__(self, request):
+    _local.current_user = request.user if request.user.is_authenticated else None
+    try:
+      return self.get_response(request)
+    finally:
+      _local.current_user = None
+
+LEGACY_MIDDLEWARE = [
+  'django.middleware.security.SecurityMiddleware',
+  'django.contrib.sessions.middleware.SessionMiddleware',
+  'corsheaders.middleware.CorsMiddleware',
+  'django.middleware.common.CommonMiddleware',
+  'django.middleware.csrf.CsrfViewMiddleware',
+  'django.contrib.auth.middleware.AuthenticationMiddleware',
+  f'{__name__}.LegacyUpdateUserInfoMiddleware',
+  f'{__name__}.LegacyLanguageFromUserMiddleware',
+  f'{__name__}.LegacyThreadLocalUserMiddleware',
+  'django.middleware.locale.LocaleMiddleware',
+  'django.contrib.messages.middleware.MessageMiddleware',
+  'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+def run(middleware, requests: int) -> float:
+  """
+  Retorna los microsegundos promedio por request.
+  """
+
+  factory = RequestFactory()
+  with override_settings(MIDDLEWARE=middleware, ROOT_URLCONF=__name__, ALLOWED_HOSTS=['*']):
+    handler = WSGIHandler()
+    # Calentamiento: carga de modulos, catalogos de traduccion y URLconf
+    for _ in range(200):
+      handler.get_response(factory.get('/api/bench/', HTTP_ACCEPT_LANGUAGE='en'))
+    start = time.perf_counter()
+    for _ in range(requests):
+      handler.get_response(factory.get('/api/bench/', HTTP_ACCEPT_LANGUAGE='en'))
+    return (time.perf_counter() - start) / requests * 1e6
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--requests', type=int, default=20000)
+  args = parser.parse_args()
+
+  before = run(LEGACY_MIDDLEWARE, args.requests)
+  after = run(settings.MIDDLEWARE, args.requests)
+  print(f"requests: {args.requests}")
+  print(f"antes:    {before:8.1f} us/request ({len(LEGACY_MIDDLEWARE)} middlewares)")
+  print(f"despues:  {after:8.1f} us/request ({len(settings.MIDDLEWARE)} middlewares)")
+  print(f"ahorro:   {before - after:8.1f} us/request ({(before - after) / before:.0%})")
+
+if __name__ == '__main__':
+  main()
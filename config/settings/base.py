@@ -39,30 +39,28 @@ INSTALLED_APPS = [
 ]
 
 # Middleware
+# Las rutas /api/ (JWT) omiten sesion, CSRF, mensajes y LocaleMiddleware (ver core.middleware.apiFastPath);
+# el admin y demas rutas conservan el comportamiento estandar de Django
 MIDDLEWARE = [
   'django.middleware.security.SecurityMiddleware',
-  'django.contrib.sessions.middleware.SessionMiddleware',
+  'core.middleware.apiFastPath.ApiSkipSessionMiddleware',
 
   # Middleware para permitir peticiones de backend a frontend
   "corsheaders.middleware.CorsMiddleware",
 
-  'django.middleware.common.CommonMiddleware',  
-  'django.middleware.csrf.CsrfViewMiddleware',
+  # Para hacer traduccion de los textos (despues de la sesion y antes de CommonMiddleware)
+  'core.middleware.apiFastPath.ApiSkipLocaleMiddleware',
+
+  'django.middleware.common.CommonMiddleware',
+  'core.middleware.apiFastPath.ApiSkipCsrfViewMiddleware',
 
   # 👇 Middleware que dependan de la authentication van despues de este
-  'django.contrib.auth.middleware.AuthenticationMiddleware',
-
-  # Middleware para actualizar la actividad del usuario
-  'core.middleware.updateRequestInfo.UpdateUserInfoMiddleware',
-  # Middleware para obtener el idioma del usuario
-  'core.middleware.setLanguage.LanguageFromUserMiddleware',
-  # Middleware para guardar el usuario del request
-  'core.middleware.updateRequestInfo.ThreadLocalUserMiddleware',
-  
-  # Para hacer traduccion de los textos
-  'django.middleware.locale.LocaleMiddleware',
+  'core.middleware.apiFastPath.ApiSkipAuthenticationMiddleware',
+
+  # Idioma del usuario, usuario actual y actividad del usuario en una sola pasada
+  'core.middleware.updateRequestInfo.CoreRequestMiddleware',
 
-  'django.contrib.messages.middleware.MessageMiddleware',
+  'core.middleware.apiFastPath.ApiSkipMessageMiddleware',
   'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -128,10 +126,30 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Toma por default el usuario del modelo accounts
 AUTH_USER_MODEL = 'accounts.User'
 
+# Hashers de contraseñas con costo configurable (authentication.hashers); el primero es el que
+# genera los hashes nuevos y los demas solo verifican. Argon2 y bcrypt requieren argon2-cffi / bcrypt
+PASSWORD_HASHERS = [
+  'authentication.hashers.TunedPBKDF2PasswordHasher',
+  'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+  'authentication.hashers.TunedArgon2PasswordHasher',
+  'authentication.hashers.TunedBCryptSHA256PasswordHasher',
+  'authentication.hashers.TunedScryptPasswordHasher',
+]
+
+# Costo de los hashers; calibrar en el hardware de produccion con
+# `python manage.py calibrate_password_hashers --target-ms 250`. Los hashes con otros
+# parametros se recalculan al iniciar sesion. Ver authentication/hashers.py para los valores por defecto
+PASSWORD_HASHING = {
+  'PBKDF2_ITERATIONS': int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', '1000000')),
+}
+
+# Los modelos de auditoria (core) pueden vivir en su propia base de datos (ACCESS_LOG['DATABASE'])
+DATABASE_ROUTERS = ['core.audit.routers.AccessLogRouter']
+
 # Configuracion de Rest Framework
 REST_FRAMEWORK = {
   'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
-  'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication', ),
+  'DEFAULT_AUTHENTICATION_CLASSES': ('authentication.backends.CachedJWTAuthentication', ),
   'DEFAULT_PERMISSION_CLASSES': ('rest_framework.permissions.IsAuthenticated', ),
   'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
   'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -153,6 +171,83 @@ SIMPLE_JWT = {
   'TOKEN_BLACKLIST_ENABLED': True,
 }
 
+# Configuracion de los logs de acceso (AccessLog)
+# Ver core/audit/conf.py para los valores por defecto
+ACCESS_LOG = {
+  # Base de datos de los logs; debe existir en DATABASES (ver core.audit.routers.AccessLogRouter)
+  'DATABASE': os.getenv('ACCESS_LOG_DATABASE', 'default'),
+  # 'buffer' acumula en memoria y escribe con bulk_create; 'direct' escribe en cada request;
+  # 'spool' escribe a archivos locales que carga `python manage.py load_access_log_spool --loop`
+  'SINK': os.getenv('ACCESS_LOG_SINK', 'buffer'),
+  'BATCH_SIZE': 200,
+  'FLUSH_INTERVAL': 2.0,
+  'MAX_QUEUE_SIZE': 10000,
+  # Retencion y particionado mensual (python manage.py maintain_access_logs)
+  'RETENTION_DAYS': int(os.getenv('ACCESS_LOG_RETENTION_DAYS', '365')),
+  'PARTITION_MONTHS_AHEAD': 3,
+  'PRUNE_BATCH_SIZE': 5000,
+  # Exportacion en streaming (/api/core/access-logs/export/)
+  'EXPORT_CHUNK_SIZE': 2000,
+  # Agregados por hora para /api/core/access-logs/stats/
+  'ROLLUPS': True,
+  # Cache en proceso de los ids de accion/ruta/user agent (tablas de diccionario)
+  'INTERN_CACHE_SIZE': 5000,
+  # Muestreo de lecturas por vista ("Vista.metodo" -> tasa); tiene prioridad sobre el
+  # `sample_rate` del decorador. Ej. {'UserViewSet.list': 0.05}. Se valida al arrancar (check core.E001)
+  'SAMPLING': {},
+  # Archivo frio en segmentos comprimidos por dia (python manage.py archive_access_logs)
+  'ARCHIVE_DIR': os.getenv('ACCESS_LOG_ARCHIVE_DIR', str(BASE_DIR / 'archive' / 'access_logs')),
+  'ARCHIVE_AFTER_DAYS': int(os.getenv('ACCESS_LOG_ARCHIVE_AFTER_DAYS', '90')),
+  # Spool local (SINK='spool'); debe estar en disco local del servidor
+  'SPOOL_DIR': os.getenv('ACCESS_LOG_SPOOL_DIR', str(BASE_DIR / 'spool' / 'access_logs')),
+  'SPOOL_SEGMENT_MAX_BYTES': 64 * 1024 * 1024,
+  'SPOOL_SEGMENT_MAX_AGE': 300,
+  'SPOOL_STALE_AFTER': 3600,
+  # Compactacion de lecturas repetidas (polling): un registro con count/first_seen/last_seen por ventana
+  'COMPACTION_WINDOW': float(os.getenv('ACCESS_LOG_COMPACTION_WINDOW', '0')),
+  'COMPACTION_MAX_KEYS': 10000,
+}
+
+# Actividad del usuario (last_activity/last_ip): CoreRequestMiddleware la acumula en las rutas /api/
+# y core.utils.activity (ActivityTracker) la escribe en lote
+# Ver core/utils/activity.py para los valores por defecto
+USER_ACTIVITY = {
+  # Segundos minimos entre escrituras de last_activity del mismo usuario
+  'GRANULARITY': int(os.getenv('USER_ACTIVITY_GRANULARITY', '60')),
+  # Segundos entre escrituras en lote de la actividad acumulada
+  'FLUSH_INTERVAL': 30,
+}
+
+# Cache del usuario autenticado por JWT (authentication.backends.CachedJWTAuthentication)
+# Ver authentication/user_cache.py para los valores por defecto. Con varios procesos, CACHE debe
+# apuntar a una cache compartida para que desactivar un usuario aplique de inmediato en todos:
+# sin CACHES Django usa LocMemCache (una por proceso). Ej. con Redis (ver config/settings/prod.py):
+#   CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://redis:6379/0'}}
+# Check authentication.W001
+AUTH_USER_CACHE = {
+  'CACHE': 'default',
+  # Segundos que un usuario permanece en cache
+  'TIMEOUT': int(os.getenv('AUTH_USER_CACHE_TIMEOUT', '60')),
+}
+
+# Revocacion de tokens en memoria (authentication.revocation.RevocationRegistry)
+# Ver authentication/revocation.py para los valores por defecto
+TOKEN_REVOCATION = {
+  # Segundos entre recargas de la blacklist y las marcas de "cerrar sesion en todos los dispositivos"
+  'REFRESH_INTERVAL': int(os.getenv('TOKEN_REVOCATION_REFRESH_INTERVAL', '30')),
+  # Depuracion de tokens expirados (python manage.py prune_tokens)
+  'PRUNE_BATCH_SIZE': 1000,
+  'PRUNE_PAUSE': 0.1,
+}
+
+# Permisos del usuario dentro del access token (authentication.permission_snapshot)
+# Ver authentication/permission_snapshot.py para los valores por defecto. La version de permisos
+# vive en la cache de AUTH_USER_CACHE, que debe ser compartida (check authentication.E001)
+PERMISSION_SNAPSHOT = {
+  # Los permisos de core.utils.permissions se resuelven desde el token, sin consultar la base de datos
+  'ENABLED': os.getenv('PERMISSION_SNAPSHOT', 'False') == 'True',
+}
+
 # Cors Headers authorization
 # Se le coloca las urls del localhost que podra hacer peticiones
 # CORS_ALLOWED_ORIGINS = ['http://localhost:5174']
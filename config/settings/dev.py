@@ -4,8 +4,14 @@ DATABASES = {
   'default': {
     'ENGINE': 'django.db.backends.sqlite3',
     'NAME': BASE_DIR / 'db.sqlite3',
-  }
+  },
+  # Logs de acceso en una base separada: python manage.py migrate --database audit
+  'audit': {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': BASE_DIR / 'audit.sqlite3',
+  },
 }
+ACCESS_LOG['DATABASE'] = 'audit'
 
 # Development database (PostgreSQL local)
 # DATABASES = {
@@ -14,6 +14,29 @@ DATABASES = {
   }
 }
 
+# Base de datos de auditoria (AccessLog), opcional: python manage.py migrate --database audit
+if os.getenv('AUDIT_POSTGRES_DB'):
+  DATABASES['audit'] = {
+    'ENGINE': 'django.db.backends.postgresql',
+    'NAME': os.getenv('AUDIT_POSTGRES_DB'),
+    'USER': os.getenv('AUDIT_POSTGRES_USER', os.getenv('POSTGRES_USER')),
+    'PASSWORD': os.getenv('AUDIT_POSTGRES_PASSWORD', os.getenv('POSTGRES_PASSWORD')),
+    'HOST': os.getenv('AUDIT_POSTGRES_HOST', os.getenv('POSTGRES_HOST')),
+    'PORT': os.getenv('AUDIT_POSTGRES_PORT', os.getenv('POSTGRES_PORT', '5432')),
+  }
+  ACCESS_LOG['DATABASE'] = 'audit'
+
+# Cache compartida entre procesos (gunicorn con varios workers). AUTH_USER_CACHE y
+# PERMISSION_SNAPSHOT la requieren: con la cache local por defecto (LocMemCache) una invalidacion
+# solo aplica en el proceso que la hace (checks authentication.W001 / authentication.E001)
+if os.getenv('REDIS_URL'):
+  CACHES = {
+    'default': {
+      'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+      'LOCATION': os.getenv('REDIS_URL'),
+    }
+  }
+
 # Security
 SECURE_HSTS_SECONDS = 3600
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
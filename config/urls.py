@@ -8,6 +8,7 @@ urlpatterns = [
     # Apps
     path("api/", include("authentication.urls")),
     path("api/accounts/", include("accounts.urls")),
+    path("api/core/", include("core.urls")),
     # Documentacion API
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     # Optional UI:
@@ -1,3 +1,71 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
-# Register your models here.
+from core.audit.search import search_access_logs
+from core.base.pagination import EstimatedCountPaginator
+from core.models import AccessLog
+
+class AccessLogMethodFilter(admin.SimpleListFilter):
+  """
+  Filtro por metodo HTTP con opciones fijas: el filtro por defecto (AllValuesFieldListFilter)
+  haria un SELECT DISTINCT sobre toda la tabla para armar la lista.
+  """
+
+  title = _('method')
+  parameter_name = 'method'
+
+  def lookups(self, request, model_admin):
+    return [(method, method) for method in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')]
+
+  def queryset(self, request, queryset):
+    if self.value():
+      # Columna inicial del indice (method, route)
+      return queryset.filter(method=self.value())
+    return queryset
+
+@admin.register(AccessLog)
+class AccessLogAdmin(admin.ModelAdmin):
+  """
+  Admin de solo lectura para core_access_log, pensado para decenas de millones de filas:
+  sin COUNT(*) (EstimatedCountPaginator y show_full_result_count=False), orden sobre el
+  indice (created_at, id) y filtros con opciones fijas, sin consultas para armarlas: ni
+  date_hierarchy (SELECT DISTINCT de fechas) ni lista de acciones (diccionario sin limite).
+  La accion se busca con el indice de texto completo (ver core.audit.search).
+  """
+
+  list_display = ('created_at', 'user', 'method', 'path', 'action', 'status_code', 'ip_address', 'count')
+  list_display_links = ('created_at',)
+  # El usuario puede vivir en otra base de datos: se carga con prefetch en get_queryset
+  list_select_related = ('path', 'action')
+  # Rangos relativos (hoy, 7 dias, mes, año) sobre el indice de created_at
+  list_filter = (AccessLogMethodFilter, ('created_at', admin.DateFieldListFilter))
+  ordering = ('-created_at', '-id')
+  paginator = EstimatedCountPaginator
+  show_full_result_count = False
+  list_per_page = 50
+  # Solo habilita la caja de busqueda; la busqueda real la hace get_search_results
+  search_fields = ('message',)
+  search_help_text = _('Full-text search on action and message.')
+  readonly_fields = (
+    'user', 'method', 'path', 'route', 'view_name', 'query_string', 'action', 'status_code', 'message',
+    'ip_address', 'user_agent', 'object_type', 'object_id', 'sample_weight', 'count', 'first_seen',
+    'last_seen', 'created_at',
+  )
+
+  def get_queryset(self, request):
+    return super().get_queryset(request).prefetch_related('user')
+
+  def get_search_results(self, request, queryset, search_term):
+    if not search_term.strip():
+      return queryset, False
+    return search_access_logs(queryset, search_term), False
+
+  # Los logs de auditoria no se crean, editan ni eliminan desde el admin
+  def has_add_permission(self, request):
+    return False
+
+  def has_change_permission(self, request, obj=None):
+    return False
+
+  def has_delete_permission(self, request, obj=None):
+    return False
@@ -1,6 +1,28 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def reinstall_access_log_search(sender, using, **kwargs):
+    """
+    SQLite reconstruye la tabla en algunos ALTER y pierde sus triggers: se vuelven a
+    crear despues de cada migrate (ver core.audit.search).
+    """
+
+    from django.db import connections, router
+    from core.audit.search import install_search
+    from core.models import AccessLog
+
+    connection = connections[using]
+    if connection.vendor != 'sqlite' or not router.allow_migrate_model(using, AccessLog):
+        return
+    if AccessLog._meta.db_table in connection.introspection.table_names():
+        install_search(connection)
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from core import checks  # noqa: F401
+        post_migrate.connect(reinstall_access_log_search, sender=self)
@@ -0,0 +1,342 @@
+import os
+import gzip
+import json
+import logging
+
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import TruncDate
+
+from core.audit.conf import get_audit_setting
+
+logger = logging.getLogger(__name__)
+
+# Columna del segmento -> campo del queryset (los valores de diccionario se guardan como texto)
+ARCHIVE_COLUMNS = (
+  ('id', 'id'),
+  ('created_at', 'created_at'),
+  ('user_id', 'user_id'),
+  ('method', 'method'),
+  ('path', 'path__value'),
+  ('query_string', 'query_string'),
+  ('route', 'route__value'),
+  ('view_name', 'view_name'),
+  ('action', 'action__value'),
+  ('status_code', 'status_code'),
+  ('message', 'message'),
+  ('ip_address', 'ip_address'),
+  ('user_agent', 'user_agent__value'),
+  ('object_type', 'object_type'),
+  ('object_id', 'object_id'),
+  ('sample_weight', 'sample_weight'),
+  ('count', 'count'),
+  ('first_seen', 'first_seen'),
+  ('last_seen', 'last_seen'),
+)
+COLUMN_NAMES = tuple(name for name, _ in ARCHIVE_COLUMNS)
+# Version 2: la primera linea del segmento es el encabezado y cada linea siguiente un bloque
+# de columnas. Version 1: una sola linea con todas las columnas del dia
+SEGMENT_VERSION = 2
+
+def archive_dir() -> Path:
+  """
+  Directorio raiz del archivo frio (ACCESS_LOG['ARCHIVE_DIR']).
+  """
+
+  return Path(get_audit_setting('ARCHIVE_DIR') or Path(settings.BASE_DIR) / 'archive' / 'access_logs')
+
+def day_bounds(day: date):
+  start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+  return start, start + timedelta(days=1)
+
+def segment_paths(day: date, root: Optional[Path] = None):
+  """
+  Rutas del segmento de un dia y de su indice, ej. 2025/05/access_log_2025-05-03.json.gz
+  """
+
+  folder = (root or archive_dir()) / f'{day:%Y}' / f'{day:%m}'
+  return folder / f'access_log_{day:%Y-%m-%d}.json.gz', folder / f'access_log_{day:%Y-%m-%d}.meta.json'
+
+def _write_atomic(path: Path, data: bytes):
+  # Se escribe a un temporal y se renombra: un lector nunca ve un segmento a medias
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp = path.with_name(path.name + '.tmp')
+  with open(tmp, 'wb') as fh:
+    fh.write(data)
+    fh.flush()
+    os.fsync(fh.fileno())
+  os.replace(tmp, path)
+
+def _with_all_columns(columns: Dict[str, list]) -> Dict[str, list]:
+  rows = len(columns['id'])
+  for name in COLUMN_NAMES:
+    # Segmentos escritos antes de agregar una columna
+    columns.setdefault(name, [None] * rows)
+  return columns
+
+def iter_segment(path: Path) -> Iterator[Dict[str, list]]:
+  """
+  Recorre los bloques de un segmento (columna -> lista de valores) sin cargarlo completo.
+  """
+
+  with gzip.open(path, 'rt', encoding='utf-8') as fh:
+    header = json.loads(fh.readline())
+    if 'columns' in header:
+      yield _with_all_columns(header['columns'])
+      return
+    for line in fh:
+      yield _with_all_columns(json.loads(line))
+
+def read_segment(path: Path) -> Dict[str, list]:
+  """
+  Lee un segmento completo y retorna sus columnas (nombre -> lista de valores).
+  """
+
+  columns = {name: [] for name in COLUMN_NAMES}
+  for block in iter_segment(path):
+    for name in COLUMN_NAMES:
+      columns[name].extend(block[name])
+  return columns
+
+def read_meta(path: Path) -> Dict:
+  with open(path, encoding='utf-8') as fh:
+    return json.load(fh)
+
+class SegmentWriter:
+  """
+  Escribe el segmento de un dia bloque por bloque y acumula su indice min/max, que permite
+  descartar segmentos completos en la busqueda. El segmento se publica con un rename al
+  cerrar: un lector nunca ve un segmento a medias.
+  """
+
+  def __init__(self, day: date, root: Optional[Path] = None):
+    self.data_path, self.meta_path = segment_paths(day, root)
+    self.data_path.parent.mkdir(parents=True, exist_ok=True)
+    self._tmp = self.data_path.with_name(self.data_path.name + '.tmp')
+    self._raw = open(self._tmp, 'wb')
+    self._fh = gzip.open(self._raw, 'wt', encoding='utf-8')
+    self._actions = set()
+    self.meta = {
+      'version': SEGMENT_VERSION,
+      'day': day.isoformat(),
+      'rows': 0,
+      'min_id': None,
+      'max_id': None,
+      'min_created_at': None,
+      'max_created_at': None,
+      'min_user_id': None,
+      'max_user_id': None,
+      'has_anonymous': False,
+      'actions': [],
+    }
+    self._write_line({'version': SEGMENT_VERSION, 'day': day.isoformat()})
+
+  def _write_line(self, payload: Dict):
+    self._fh.write(json.dumps(payload, ensure_ascii=False))
+    self._fh.write('\n')
+
+  def _extend(self, key: str, values: list):
+    values = [value for value in values if value is not None]
+    if values:
+      current_min, current_max = self.meta[f'min_{key}'], self.meta[f'max_{key}']
+      self.meta[f'min_{key}'] = min(values) if current_min is None else min(current_min, *values)
+      self.meta[f'max_{key}'] = max(values) if current_max is None else max(current_max, *values)
+
+  def write(self, columns: Dict[str, list]):
+    """
+    Agrega un bloque de filas (columna -> lista de valores).
+    """
+
+    if not columns['id']:
+      return
+    self._write_line({name: columns[name] for name in COLUMN_NAMES})
+    meta = self.meta
+    meta['rows'] += len(columns['id'])
+    self._extend('id', columns['id'])
+    self._extend('created_at', columns['created_at'])
+    self._extend('user_id', columns['user_id'])
+    meta['has_anonymous'] = meta['has_anonymous'] or None in columns['user_id']
+    self._actions.update(columns['action'])
+
+  def close(self) -> Dict:
+    self._fh.close()
+    self._raw.flush()
+    os.fsync(self._raw.fileno())
+    self._raw.close()
+    os.replace(self._tmp, self.data_path)
+    self.meta['actions'] = sorted(self._actions)
+    _write_atomic(self.meta_path, json.dumps(self.meta, indent=2).encode('utf-8'))
+    return self.meta
+
+  def abort(self):
+    self._fh.close()
+    self._raw.close()
+    self._tmp.unlink(missing_ok=True)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc, tb):
+    if exc_type is None:
+      self.close()
+    else:
+      self.abort()
+
+def write_segment(day: date, columns: Dict[str, list], root: Optional[Path] = None) -> Dict:
+  """
+  Escribe (o reemplaza) el segmento de un dia y su indice con un solo bloque.
+  """
+
+  with SegmentWriter(day, root) as writer:
+    writer.write(columns)
+  return writer.meta
+
+def _serialize(name: str, value):
+  if name in ('created_at', 'first_seen', 'last_seen') and value is not None:
+    return value.astimezone(dt_timezone.utc).isoformat()
+  return value
+
+def _batches(iterable, size: int):
+  iterator = iter(iterable)
+  while batch := list(islice(iterator, size)):
+    yield batch
+
+def _contains(sorted_ids: array, pk: int) -> bool:
+  index = bisect_left(sorted_ids, pk)
+  return index < len(sorted_ids) and sorted_ids[index] == pk
+
+def archive_day(day: date, batch_size: int, using: Optional[str] = None, root: Optional[Path] = None) -> int:
+  """
+  Mueve los registros de un dia (UTC) a su segmento y los elimina de la base de datos.
+  Los registros se leen y escriben en bloques de `batch_size`. Si el segmento ya existe
+  (ej. registros tardios) se fusiona por id. Las filas solo se eliminan despues de que el
+  segmento quedo escrito en disco.
+
+  Returns:
+    int: Numero de registros archivados.
+  """
+
+  from core.models import AccessLog
+
+  manager = AccessLog.objects.db_manager(using)
+  start, end = day_bounds(day)
+  day_rows = manager.filter(created_at__gte=start, created_at__lt=end)
+  if not day_rows.exists():
+    return 0
+
+  data_path, _ = segment_paths(day, root)
+  rows = (
+    day_rows.order_by('created_at', 'id')
+    .values_list(*(field for _, field in ARCHIVE_COLUMNS))
+    .iterator(chunk_size=batch_size)
+  )
+  with SegmentWriter(day, root) as writer:
+    # Ids del segmento previo como arreglo ordenado de enteros (8 bytes por fila)
+    known = array('q')
+    if data_path.exists():
+      for block in iter_segment(data_path):
+        writer.write(block)
+        known.extend(block['id'])
+      known = array('q', sorted(known))
+    for batch in _batches(rows, batch_size):
+      block = {name: [] for name in COLUMN_NAMES}
+      for row in batch:
+        if _contains(known, row[0]):
+          continue
+        for name, value in zip(COLUMN_NAMES, row):
+          block[name].append(_serialize(name, value))
+      writer.write(block)
+
+  # Se eliminan los ids del segmento ya publicado, bloque por bloque
+  archived = 0
+  for block in iter_segment(data_path):
+    for ids in _batches(block['id'], batch_size):
+      with transaction.atomic(using=manager.db):
+        count, _ = day_rows.filter(id__in=ids).delete()
+      archived += count
+  return archived
+
+def archivable_days(cutoff: date, using: Optional[str] = None) -> List[date]:
+  """
+  Dias completos (UTC) anteriores a `cutoff` que aun tienen registros en la base de datos.
+  """
+
+  from core.models import AccessLog
+
+  return list(
+    AccessLog.objects.db_manager(using)
+    .filter(created_at__lt=day_bounds(cutoff)[0])
+    .annotate(day=TruncDate('created_at', tzinfo=dt_timezone.utc))
+    .values_list('day', flat=True)
+    .distinct()
+    .order_by('day')
+  )
+
+def _segment_may_match(meta: Dict, date_from, date_to, user_id, action) -> bool:
+  if date_from and meta['max_created_at'] < date_from:
+    return False
+  if date_to and meta['min_created_at'] >= date_to:
+    return False
+  if user_id is not None and (meta['min_user_id'] is None or not meta['min_user_id'] <= user_id <= meta['max_user_id']):
+    return False
+  if action and not any(action in value.lower() for value in meta['actions']):
+    return False
+  return True
+
+def search_archive(
+  date_from: Optional[datetime] = None,
+  date_to: Optional[datetime] = None,
+  user_id: Optional[int] = None,
+  action: Optional[str] = None,
+  limit: Optional[int] = None,
+  root: Optional[Path] = None,
+) -> Iterator[Dict]:
+  """
+  Busca registros archivados sin restaurarlos a la base de datos. Los segmentos se
+  descartan con su indice min/max y solo se leen, bloque por bloque, los que pueden coincidir.
+
+  Args:
+    date_from / date_to: Rango [date_from, date_to) de created_at.
+    user_id: ID del usuario.
+    action: Texto contenido en la accion (sin distinguir mayusculas).
+    limit: Maximo de registros a retornar.
+
+  Returns:
+    Iterator[dict]: Registros en orden cronologico.
+  """
+
+  root = root or archive_dir()
+  date_from = date_from.astimezone(dt_timezone.utc).isoformat() if date_from else None
+  date_to = date_to.astimezone(dt_timezone.utc).isoformat() if date_to else None
+  action = action.lower() if action else None
+
+  found = 0
+  for meta_path in sorted(root.glob('*/*/access_log_*.meta.json')):
+    meta = read_meta(meta_path)
+    if not _segment_may_match(meta, date_from, date_to, user_id, action):
+      continue
+
+    # Se filtra columna por columna, bloque por bloque; solo se arma el registro de las filas que coinciden
+    for columns in iter_segment(meta_path.with_name(meta_path.name.replace('.meta.json', '.json.gz'))):
+      matches = range(len(columns['id']))
+      if date_from:
+        matches = [i for i in matches if columns['created_at'][i] >= date_from]
+      if date_to:
+        matches = [i for i in matches if columns['created_at'][i] < date_to]
+      if user_id is not None:
+        matches = [i for i in matches if columns['user_id'][i] == user_id]
+      if action:
+        matches = [i for i in matches if action in columns['action'][i].lower()]
+
+      for index in matches:
+        yield {name: columns[name][index] for name in COLUMN_NAMES}
+        found += 1
+        if limit and found >= limit:
+          return
@@ -0,0 +1,42 @@
+from datetime import timedelta
+from typing import Dict, Tuple
+
+from core.audit.sampling import SAFE_METHODS
+
+def is_compactable(entry: Dict) -> bool:
+  """
+  Solo las lecturas exitosas se compactan; escrituras y errores se registran uno a uno.
+  """
+
+  return entry['method'] in SAFE_METHODS and (entry.get('status_code') or 0) < 400
+
+def compaction_key(entry: Dict) -> Tuple:
+  """
+  Eventos identicos: mismo usuario, accion, ruta, estatus y objeto.
+  """
+
+  return (
+    entry.get('user_id'),
+    entry['method'],
+    entry['action'],
+    entry.get('route') or entry['path'],
+    entry.get('status_code'),
+    entry.get('object_type'),
+    entry.get('object_id'),
+  )
+
+def start_group(entry: Dict) -> Dict:
+  return dict(entry, count=1, first_seen=entry['created_at'], last_seen=entry['created_at'])
+
+def merge_into(group: Dict, entry: Dict):
+  """
+  Acumula un evento en su grupo. El resto de campos (ruta, query string, IP, mensaje)
+  se conservan del primer evento.
+  """
+
+  group['count'] += 1
+  group['sample_weight'] = group.get('sample_weight', 1.0) + entry.get('sample_weight', 1.0)
+  group['last_seen'] = max(group['last_seen'], entry['created_at'])
+
+def is_expired(group: Dict, now, window: float) -> bool:
+  return now - group['first_seen'] >= timedelta(seconds=window)
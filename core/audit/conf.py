@@ -0,0 +1,53 @@
+from django.conf import settings
+
+# Valores por defecto de la configuracion ACCESS_LOG (ver config/settings/base.py)
+DEFAULTS = {
+  # Alias de la base de datos de los modelos de auditoria (ver core.audit.routers.AccessLogRouter)
+  'DATABASE': 'default',
+  # Destino de los registros: 'buffer' (en memoria, bulk_create), 'direct' (un INSERT por registro)
+  # o 'spool' (archivo local append-only que carga load_access_log_spool)
+  'SINK': 'buffer',
+  # Numero de registros por bulk_create
+  'BATCH_SIZE': 200,
+  # Segundos maximos que un registro permanece en memoria antes de escribirse
+  'FLUSH_INTERVAL': 2.0,
+  # Limite de registros en cola; los excedentes se descartan y se contabilizan
+  'MAX_QUEUE_SIZE': 10000,
+  # Dias que se conservan los registros antes de eliminarlos (maintain_access_logs)
+  'RETENTION_DAYS': 365,
+  # Particiones mensuales que se crean por adelantado (solo PostgreSQL)
+  'PARTITION_MONTHS_AHEAD': 3,
+  # Filas por lote al eliminar registros expirados sin particiones
+  'PRUNE_BATCH_SIZE': 5000,
+  # Filas que se leen por viaje al cursor del servidor en la exportacion
+  'EXPORT_CHUNK_SIZE': 2000,
+  # Mantener los agregados por hora (AccessLogRollup) al escribir cada lote
+  'ROLLUPS': True,
+  # Valores (accion, ruta, user agent) por tabla de diccionario que se guardan en la cache del escritor
+  'INTERN_CACHE_SIZE': 5000,
+  # Tasa de muestreo de lecturas por vista ("Vista.metodo" -> (0, 1]); ver core.audit.sampling
+  'SAMPLING': {},
+  # Archivo frio (archive_access_logs): directorio de segmentos (None = BASE_DIR/archive/access_logs)
+  'ARCHIVE_DIR': None,
+  # Dias que un registro permanece en la tabla antes de archivarse; debe ser menor que RETENTION_DAYS
+  'ARCHIVE_AFTER_DAYS': 90,
+  # Spool local (SINK='spool'): directorio de segmentos (None = BASE_DIR/spool/access_logs)
+  'SPOOL_DIR': None,
+  # Un segmento se cierra al superar este tamaño (bytes) o esta antigüedad (segundos)
+  'SPOOL_SEGMENT_MAX_BYTES': 64 * 1024 * 1024,
+  'SPOOL_SEGMENT_MAX_AGE': 300,
+  # Segundos sin escritura tras los cuales el cargador trata un segmento abierto como cerrado (writer caido)
+  'SPOOL_STALE_AFTER': 3600,
+  # Segundos en que las lecturas exitosas identicas se agrupan en un solo registro (0 = sin compactar).
+  # Aplica a los destinos 'buffer' y 'spool'
+  'COMPACTION_WINDOW': 0,
+  # Grupos abiertos como maximo; al superarse se escribe el mas antiguo
+  'COMPACTION_MAX_KEYS': 10000,
+}
+
+def get_audit_setting(key: str):
+  """
+  Retorna un valor de la configuracion `ACCESS_LOG` aplicando los valores por defecto.
+  """
+
+  return getattr(settings, 'ACCESS_LOG', {}).get(key, DEFAULTS[key])
@@ -0,0 +1,103 @@
+import hashlib
+import threading
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from django.db import transaction
+
+from core.audit.conf import get_audit_setting
+
+def value_digest(value: str) -> str:
+  """
+  Llave unica de un valor de diccionario (sha256 en hexadecimal).
+  """
+
+  return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+class InternCache:
+  """
+  Cache LRU en proceso valor -> id de una tabla de diccionario.
+  """
+
+  def __init__(self, max_size: int):
+    self.max_size = max_size
+    self._items = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, value: str) -> Optional[int]:
+    with self._lock:
+      pk = self._items.get(value)
+      if pk is not None:
+        self._items.move_to_end(value)
+      return pk
+
+  def update(self, items: Dict[str, int]):
+    with self._lock:
+      for value, pk in items.items():
+        self._items[value] = pk
+        self._items.move_to_end(value)
+      while len(self._items) > self.max_size:
+        self._items.popitem(last=False)
+
+  def clear(self):
+    with self._lock:
+      self._items.clear()
+
+  def __len__(self):
+    return len(self._items)
+
+_caches: Dict[tuple, InternCache] = {}
+_caches_lock = threading.Lock()
+
+def get_intern_cache(model, using: str) -> InternCache:
+  key = (model._meta.label_lower, using)
+  with _caches_lock:
+    cache = _caches.get(key)
+    if cache is None:
+      cache = _caches[key] = InternCache(get_audit_setting('INTERN_CACHE_SIZE'))
+    return cache
+
+def clear_intern_caches():
+  with _caches_lock:
+    for cache in _caches.values():
+      cache.clear()
+
+def resolve_many(model, values: Iterable[str], using: str) -> Dict[str, int]:
+  """
+  Resuelve los ids de un conjunto de valores en la tabla de diccionario `model`,
+  creando los que no existan. Los valores ya vistos se resuelven desde la cache
+  sin consultar la base de datos.
+
+  Los ids nuevos se agregan a la cache hasta que la transaccion confirma, para no
+  guardar ids de filas que un rollback haya descartado.
+
+  Returns:
+    dict: valor -> id
+  """
+
+  cache = get_intern_cache(model, using)
+  resolved = {}
+  missing = set()
+  for value in values:
+    pk = cache.get(value)
+    if pk is None:
+      missing.add(value)
+    else:
+      resolved[value] = pk
+  if not missing:
+    return resolved
+
+  digests = {value_digest(value): value for value in missing}
+  manager = model.objects.db_manager(using)
+  found = dict(manager.filter(digest__in=digests).values_list('digest', 'id'))
+  new_rows = [model(value=value, digest=digest) for digest, value in digests.items() if digest not in found]
+  if new_rows:
+    # Otro proceso puede insertar el mismo valor a la vez: se ignora el conflicto y se relee
+    manager.bulk_create(new_rows, ignore_conflicts=True)
+    found.update(manager.filter(digest__in=[row.digest for row in new_rows]).values_list('digest', 'id'))
+
+  fetched = {digests[digest]: pk for digest, pk in found.items()}
+  resolved.update(fetched)
+  transaction.on_commit(lambda: cache.update(fetched), using=using)
+  return resolved
@@ -0,0 +1,232 @@
+import re
+import logging
+
+from datetime import date, datetime, timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Tabla padre de AccessLog. En PostgreSQL se particiona por rango mensual de created_at;
+# las consultas filtradas por fecha solo recorren las particiones del rango (partition pruning).
+PARENT_TABLE = 'core_access_log'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+_PARTITION_RE = re.compile(rf'^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$')
+
+def month_start(value: date) -> date:
+  """
+  Retorna el primer dia del mes de la fecha dada.
+  """
+
+  return date(value.year, value.month, 1)
+
+def add_months(value: date, months: int) -> date:
+  """
+  Suma (o resta) meses a una fecha que ya esta al inicio de mes.
+  """
+
+  index = value.year * 12 + (value.month - 1) + months
+  return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(start: date) -> str:
+  """
+  Nombre de la particion mensual, ej. 'core_access_log_p2025_05'.
+  """
+
+  return f'{PARENT_TABLE}_p{start:%Y_%m}'
+
+def partition_bounds(name: str) -> Optional[Tuple[date, date]]:
+  """
+  Retorna el rango [inicio, fin) de una particion a partir de su nombre,
+  o None si el nombre no corresponde a una particion mensual.
+  """
+
+  match = _PARTITION_RE.match(name)
+  if not match:
+    return None
+  start = date(int(match.group(1)), int(match.group(2)), 1)
+  return start, add_months(start, 1)
+
+def _bound_literal(value: date) -> str:
+  return f"'{datetime(value.year, value.month, value.day, tzinfo=dt_timezone.utc).isoformat()}'"
+
+def is_partitioned(connection) -> bool:
+  """
+  Indica si la tabla de AccessLog esta particionada en esta conexion.
+  """
+
+  if connection.vendor != 'postgresql':
+    return False
+  with connection.cursor() as cursor:
+    cursor.execute(
+      "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+      [PARENT_TABLE]
+    )
+    return cursor.fetchone() is not None
+
+def list_partitions(connection) -> List[str]:
+  """
+  Lista los nombres de las particiones de AccessLog (incluida la particion default).
+  """
+
+  with connection.cursor() as cursor:
+    cursor.execute(
+      """
+      SELECT child.relname
+      FROM pg_inherits i
+      JOIN pg_class parent ON parent.oid = i.inhparent
+      JOIN pg_class child ON child.oid = i.inhrelid
+      WHERE parent.relname = %s
+      ORDER BY child.relname
+      """,
+      [PARENT_TABLE]
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+def create_partition(connection, start: date) -> bool:
+  """
+  Crea la particion mensual que inicia en `start` si no existe.
+  Si la particion default contiene filas del rango, se mueven a la nueva particion.
+
+  Returns:
+    bool: True si la particion se creo.
+  """
+
+  name = partition_name(start)
+  if name in list_partitions(connection):
+    return False
+
+  qn = connection.ops.quote_name
+  end = add_months(start, 1)
+  bounds = f"FROM ({_bound_literal(start)}) TO ({_bound_literal(end)})"
+  where = f"created_at >= {_bound_literal(start)} AND created_at < {_bound_literal(end)}"
+
+  with transaction.atomic(using=connection.alias):
+    with connection.cursor() as cursor:
+      has_default = DEFAULT_PARTITION in list_partitions(connection)
+      moved = False
+      if has_default:
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {qn(DEFAULT_PARTITION)} WHERE {where})")
+        moved = cursor.fetchone()[0]
+
+      if moved:
+        # PostgreSQL no permite crear la particion si la default tiene filas del rango
+        cursor.execute(f"ALTER TABLE {qn(PARENT_TABLE)} DETACH PARTITION {qn(DEFAULT_PARTITION)}")
+      cursor.execute(f"CREATE TABLE {qn(name)} PARTITION OF {qn(PARENT_TABLE)} FOR VALUES {bounds}")
+      if moved:
+        cursor.execute(f"INSERT INTO {qn(PARENT_TABLE)} SELECT * FROM {qn(DEFAULT_PARTITION)} WHERE {where}")
+        cursor.execute(f"DELETE FROM {qn(DEFAULT_PARTITION)} WHERE {where}")
+        cursor.execute(f"ALTER TABLE {qn(PARENT_TABLE)} ATTACH PARTITION {qn(DEFAULT_PARTITION)} DEFAULT")
+  return True
+
+def create_default_partition(connection) -> bool:
+  """
+  Crea la particion default, que recibe filas fuera de los rangos creados.
+  """
+
+  if DEFAULT_PARTITION in list_partitions(connection):
+    return False
+  qn = connection.ops.quote_name
+  with connection.cursor() as cursor:
+    cursor.execute(f"CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(PARENT_TABLE)} DEFAULT")
+  return True
+
+def ensure_partitions(connection, months_ahead: int, today: Optional[date] = None) -> List[str]:
+  """
+  Crea las particiones del mes actual y de los `months_ahead` meses siguientes.
+
+  Returns:
+    list[str]: Nombres de las particiones creadas.
+  """
+
+  current = month_start(today or datetime.now(dt_timezone.utc).date())
+  created = []
+  for offset in range(months_ahead + 1):
+    start = add_months(current, offset)
+    if create_partition(connection, start):
+      created.append(partition_name(start))
+  return created
+
+def expired_partitions(connection, cutoff: datetime) -> List[str]:
+  """
+  Particiones mensuales cuyo rango completo es anterior a `cutoff`.
+  """
+
+  expired = []
+  for name in list_partitions(connection):
+    bounds = partition_bounds(name)
+    if bounds and datetime(bounds[1].year, bounds[1].month, 1, tzinfo=dt_timezone.utc) <= cutoff:
+      expired.append(name)
+  return expired
+
+def remove_partition(connection, name: str, detach: bool = False):
+  """
+  Elimina una particion o solo la separa de la tabla padre (detach) para archivarla.
+  """
+
+  qn = connection.ops.quote_name
+  with connection.cursor() as cursor:
+    if detach:
+      cursor.execute(f"ALTER TABLE {qn(PARENT_TABLE)} DETACH PARTITION {qn(name)}")
+    else:
+      cursor.execute(f"DROP TABLE {qn(name)}")
+
+def delete_expired_default_rows(connection, cutoff: datetime, batch_size: int) -> int:
+  """
+  Elimina en lotes las filas anteriores a `cutoff` de la particion default. La default no
+  tiene rango mensual y nunca expira como particion, pero recibe filas de meses sin
+  particion (ej. registros con fecha antigua o anteriores a ensure_partitions).
+
+  Returns:
+    int: Numero de filas eliminadas.
+  """
+
+  if DEFAULT_PARTITION not in list_partitions(connection):
+    return 0
+  table = connection.ops.quote_name(DEFAULT_PARTITION)
+  deleted = 0
+  while True:
+    with transaction.atomic(using=connection.alias):
+      with connection.cursor() as cursor:
+        cursor.execute(
+          f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE created_at < %s LIMIT %s)",
+          [cutoff, batch_size]
+        )
+        count = cursor.rowcount
+    deleted += count
+    if count < batch_size:
+      return deleted
+
+def count_expired_default_rows(connection, cutoff: datetime) -> int:
+  """
+  Filas anteriores a `cutoff` en la particion default (para --dry-run).
+  """
+
+  if DEFAULT_PARTITION not in list_partitions(connection):
+    return 0
+  with connection.cursor() as cursor:
+    cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(DEFAULT_PARTITION)} WHERE created_at < %s", [cutoff])
+    return cursor.fetchone()[0]
+
+def delete_expired_rows(cutoff: datetime, batch_size: int, using: Optional[str] = None) -> int:
+  """
+  Elimina filas anteriores a `cutoff` en lotes acotados, cada uno en su propia transaccion.
+  Es la ruta usada cuando la tabla no esta particionada (ej. SQLite).
+
+  Returns:
+    int: Numero de filas eliminadas.
+  """
+
+  from core.models import AccessLog
+
+  manager = AccessLog.objects.db_manager(using) if using else AccessLog.objects
+  deleted = 0
+  while True:
+    ids = list(manager.filter(created_at__lt=cutoff).order_by().values_list('id', flat=True)[:batch_size])
+    if not ids:
+      break
+    with transaction.atomic(using=manager.db):
+      count, _ = manager.filter(id__in=ids).delete()
+    deleted += count
+  return deleted
@@ -0,0 +1,174 @@
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import connections, transaction
+from django.db.models import Case, F, Q, Sum, TextField, Value, When
+from django.db.models.functions import Left, StrIndex, TruncHour
+
+# Separador entre la accion base y la descripcion dinamica (ver LogActionView)
+ACTION_SEPARATOR = ': '
+ERROR_STATUS_CLASSES = ('4xx', '5xx')
+
+def split_action(action: str) -> str:
+  """
+  Retorna la accion sin la descripcion dinamica del objeto.
+  Ej. "Viewed user details.: a@b.com" -> "Viewed user details."
+  """
+
+  return action.split(ACTION_SEPARATOR, 1)[0]
+
+def status_class(status_code: Optional[int]) -> str:
+  """
+  Agrupa el codigo de estatus en su clase ('2xx', '4xx', ...). Sin estatus retorna '---'.
+  """
+
+  if not status_code:
+    return '---'
+  return f'{int(status_code) // 100}xx'
+
+def hour_bucket(value: datetime) -> datetime:
+  """
+  Inicio de la hora (UTC) a la que pertenece el registro.
+  """
+
+  return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+def rollup_key(entry: Dict) -> Tuple:
+  return (
+    hour_bucket(entry['created_at']),
+    split_action(entry['action']),
+    entry['method'],
+    status_class(entry.get('status_code')),
+    entry.get('user_id'),
+  )
+
+def apply_rollups(entries: Iterable[Dict], using: Optional[str] = None) -> int:
+  """
+  Incrementa los agregados por hora con un lote de registros recien escritos.
+  Debe ejecutarse en la misma transaccion que el insert de los registros.
+
+  Returns:
+    int: Numero de agregados tocados.
+  """
+
+  from core.models import AccessLogRollup
+
+  counts = Counter()
+  weights = Counter()
+  for entry in entries:
+    key = rollup_key(entry)
+    # Un registro compactado cuenta por todos los eventos que agrupa
+    counts[key] += entry.get('count', 1)
+    weights[key] += entry.get('sample_weight', 1.0)
+  if not counts:
+    return 0
+
+  manager = AccessLogRollup.objects.db_manager(using)
+  # Con usuario: upsert contra la llave unica, seguro con escritores concurrentes
+  upsert_rollups(manager.db, [(key, counts[key], weights[key]) for key in counts if key[4] is not None])
+
+  # Sin usuario la llave no es unica (NULL): se busca la fila existente y se incrementa
+  anonymous = [key for key in counts if key[4] is None]
+  if not anonymous:
+    return len(counts)
+  existing = {}
+  for row in manager.filter(bucket__in={key[0] for key in anonymous}, user__isnull=True).filter(
+    Q(action__in={key[1] for key in anonymous}) & Q(method__in={key[2] for key in anonymous})
+  ).values_list('id', 'bucket', 'action', 'method', 'status_class', 'user_id'):
+    existing.setdefault(tuple(row[1:]), row[0])
+
+  new_rows = []
+  for key in anonymous:
+    rollup_id = existing.get(key)
+    if rollup_id is not None:
+      manager.filter(id=rollup_id).update(count=F('count') + counts[key], weighted_count=F('weighted_count') + weights[key])
+    else:
+      bucket, action, method, status, user_id = key
+      new_rows.append(AccessLogRollup(
+        bucket=bucket, action=action, method=method,
+        status_class=status, user_id=user_id, count=counts[key], weighted_count=weights[key],
+      ))
+  if new_rows:
+    manager.bulk_create(new_rows)
+  return len(counts)
+
+def upsert_rollups(using: str, rows: Iterable[Tuple[Tuple, int, float]]):
+  """
+  Inserta o incrementa agregados con usuario (INSERT ... ON CONFLICT sobre la llave unica
+  core_access_log_rollup_key). `rows` son tuplas (rollup_key, count, weighted_count).
+  """
+
+  from core.models import AccessLogRollup
+
+  # Orden estable: dos lotes concurrentes toman los mismos bloqueos en el mismo orden
+  rows = sorted(rows, key=lambda row: row[0])
+  if not rows:
+    return
+  connection = connections[using]
+  meta = AccessLogRollup._meta
+  qn = connection.ops.quote_name
+  table = qn(meta.db_table)
+  count, weighted = qn('count'), qn('weighted_count')
+  bucket_field = meta.get_field('bucket')
+  sql = (
+    f"INSERT INTO {table} (bucket, action, method, status_class, user_id, {count}, {weighted}) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s) "
+    "ON CONFLICT (bucket, action, method, status_class, user_id) DO UPDATE SET "
+    f"{count} = {table}.{count} + EXCLUDED.{count}, {weighted} = {table}.{weighted} + EXCLUDED.{weighted}"
+  )
+  params = [
+    (bucket_field.get_db_prep_value(bucket, connection), action, method, status, user_id, total, weight)
+    for (bucket, action, method, status, user_id), total, weight in rows
+  ]
+  with connection.cursor() as cursor:
+    cursor.executemany(sql, params)
+
+def rebuild_rollups(date_from: datetime, date_to: datetime, using: Optional[str] = None) -> int:
+  """
+  Recalcula los agregados del rango [date_from, date_to) a partir de core_access_log.
+  Util para cargar historicos o corregir agregados; los limites se redondean a la hora.
+
+  Returns:
+    int: Numero de agregados creados.
+  """
+
+  from core.models import AccessLog, AccessLogRollup
+
+  date_from = hour_bucket(date_from)
+  date_to = hour_bucket(date_to)
+  separator_at = StrIndex('action__value', Value(ACTION_SEPARATOR))
+  rows = (
+    AccessLog.objects.db_manager(using)
+    .filter(created_at__gte=date_from, created_at__lt=date_to)
+    .annotate(
+      hour=TruncHour('created_at', tzinfo=dt_timezone.utc),
+      base_action=Case(
+        When(Q(action__value__contains=ACTION_SEPARATOR), then=Left('action__value', separator_at - 1)),
+        default=F('action__value'),
+        output_field=TextField(),
+      ),
+      status_hundreds=F('status_code') / 100,
+    )
+    .values('hour', 'base_action', 'method', 'status_hundreds', 'user_id')
+    .annotate(total=Sum('count'), weighted=Sum('sample_weight'))
+    .order_by()
+  )
+
+  manager = AccessLogRollup.objects.db_manager(using)
+  new_rows = [
+    AccessLogRollup(
+      bucket=row['hour'],
+      action=row['base_action'],
+      method=row['method'],
+      status_class=f"{row['status_hundreds']}xx" if row['status_hundreds'] else '---',
+      user_id=row['user_id'],
+      count=row['total'],
+      weighted_count=row['weighted'],
+    )
+    for row in rows
+  ]
+  with transaction.atomic(using=manager.db):
+    manager.filter(bucket__gte=date_from, bucket__lt=date_to).delete()
+    manager.bulk_create(new_rows, batch_size=1000)
+  return len(new_rows)
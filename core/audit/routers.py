@@ -0,0 +1,66 @@
+from django.db import DEFAULT_DB_ALIAS, models
+
+from core.audit.conf import get_audit_setting
+
+# Todos los modelos de core son de auditoria (AccessLog, diccionarios, agregados, spool)
+AUDIT_APP_LABEL = 'core'
+
+def is_audit_model(model) -> bool:
+  return model._meta.app_label == AUDIT_APP_LABEL
+
+def SET_NULL_AUDIT(collector, field, sub_objs, using):
+  """
+  on_delete para FKs desde modelos de auditoria: como SET_NULL, pero el UPDATE se ejecuta en
+  la base de datos del modelo (ACCESS_LOG['DATABASE']) y no en la del objeto eliminado.
+  """
+
+  alias = get_audit_setting('DATABASE')
+  if alias != using:
+    sub_objs = sub_objs.using(alias)
+  models.SET_NULL(collector, field, sub_objs, using)
+
+SET_NULL_AUDIT.lazy_sub_objs = True
+
+class AccessLogRouter:
+  """
+  Envia los modelos de auditoria a la base de datos ACCESS_LOG['DATABASE'] y el resto a
+  `default`. Con DATABASE = 'default' no altera el ruteo.
+
+  Los usuarios viven en `default`, por lo que la FK de AccessLog hacia el usuario no tiene
+  constraint en base de datos (db_constraint=False) y no se puede hacer JOIN entre ambos; al
+  eliminar un usuario sus logs quedan con user = NULL (ver SET_NULL_AUDIT).
+  """
+
+  @property
+  def alias(self) -> str:
+    return get_audit_setting('DATABASE')
+
+  def _route(self, model, **hints):
+    if is_audit_model(model):
+      return self.alias
+    # Sin esto Django usaria la base del log para resolver `log.user`
+    instance = hints.get('instance')
+    if instance is not None and is_audit_model(type(instance)):
+      return DEFAULT_DB_ALIAS
+    return None
+
+  def db_for_read(self, model, **hints):
+    return self._route(model, **hints)
+
+  def db_for_write(self, model, **hints):
+    return self._route(model, **hints)
+
+  def allow_relation(self, obj1, obj2, **hints):
+    if is_audit_model(type(obj1)) or is_audit_model(type(obj2)):
+      return True
+    return None
+
+  def allow_migrate(self, db, app_label, model_name=None, **hints):
+    alias = self.alias
+    if alias == DEFAULT_DB_ALIAS:
+      return None
+    if app_label == AUDIT_APP_LABEL:
+      return db == alias
+    if db == alias:
+      return False
+    return None
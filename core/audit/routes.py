@@ -0,0 +1,29 @@
+import re
+
+from typing import Optional, Tuple
+
+# Grupo con nombre de los routers de DRF, ej. (?P<pk>[^/.]+)
+_REGEX_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+# Convertidor de path(), ej. <int:pk>
+_CONVERTER = re.compile(r'<\w+:(\w+)>')
+
+def normalize_route(route: str) -> str:
+  """
+  Convierte el patron resuelto por Django en una plantilla legible y estable.
+  Ej. "api/accounts/users/users/(?P<pk>[^/.]+)/$" -> "/api/accounts/users/users/<pk>/"
+  """
+
+  route = _REGEX_GROUP.sub(r'<\1>', route)
+  route = _CONVERTER.sub(r'<\1>', route)
+  route = route.replace('^', '').replace('$', '').replace('\\', '')
+  return '/' + route.lstrip('/')
+
+def resolve_route(request) -> Tuple[Optional[str], Optional[str]]:
+  """
+  Retorna (plantilla de la ruta, nombre de la vista) del request; (None, None) si no resolvio.
+  """
+
+  match = getattr(request, 'resolver_match', None)
+  if match is None:
+    return None, None
+  return normalize_route(match.route), match.view_name or None
@@ -0,0 +1,58 @@
+import random
+
+from typing import Optional
+
+from django.core.exceptions import ImproperlyConfigured
+
+from core.audit.conf import get_audit_setting
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+def policy_key(view, handler_name: str) -> str:
+  """
+  Llave de la politica de muestreo de una vista. Ej. "UserViewSet.list".
+  """
+
+  return f'{view.__class__.__name__}.{handler_name}'
+
+def validate_sample_rate(key: str, rate) -> float:
+  """
+  Valida una tasa de muestreo; se usa al decorar la vista y en el system check de
+  ACCESS_LOG['SAMPLING'] (ver core.checks), no en cada request.
+  """
+
+  try:
+    value = float(rate)
+  except (TypeError, ValueError):
+    value = None
+  if value is None or not 0 < value <= 1:
+    raise ImproperlyConfigured(f"La tasa de muestreo de '{key}' debe estar en (0, 1]; se recibio {rate!r}.")
+  return value
+
+def get_sample_rate(key: str, default: Optional[float] = None) -> float:
+  """
+  Tasa de muestreo de una vista: ACCESS_LOG['SAMPLING'] tiene prioridad sobre el
+  valor del decorador; sin configuracion se registra todo (1.0). Las tasas ya se
+  validaron al arrancar.
+  """
+
+  rate = get_audit_setting('SAMPLING').get(key, default)
+  return 1.0 if rate is None else float(rate)
+
+def sample_weight(method: str, status_code: Optional[int], rate: float, always_log: bool = False) -> Optional[float]:
+  """
+  Decide si se conserva un registro.
+
+  Siempre se conservan las escrituras, los errores (status >= 400) y los eventos
+  marcados con `always_log` (autenticacion). Las lecturas se conservan con
+  probabilidad `rate`.
+
+  Returns:
+    float | None: Peso del registro (1 / rate) o None si se descarta.
+  """
+
+  if always_log or rate >= 1 or method not in SAFE_METHODS or (status_code or 0) >= 400:
+    return 1.0
+  if random.random() < rate:
+    return 1.0 / rate
+  return None
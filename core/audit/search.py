@@ -0,0 +1,175 @@
+import re
+
+from typing import Optional
+
+from django.db import connections, transaction
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+# Texto buscable de cada log: accion (tabla de diccionario) + mensaje.
+# 'simple' no aplica stemming: sirve para identificadores como token_invalid o emails.
+SEARCH_CONFIG = 'simple'
+FTS_TABLE = 'core_access_log_fts'
+# Filas por lote (rango de ids) al indexar los registros existentes
+BACKFILL_BATCH_SIZE = 10000
+
+POSTGRES_INSTALL = (
+  "ALTER TABLE core_access_log ADD COLUMN IF NOT EXISTS search_vector tsvector",
+  f"""
+  CREATE OR REPLACE FUNCTION core_access_log_search_vector() RETURNS trigger AS $$
+  BEGIN
+    NEW.search_vector := to_tsvector('{SEARCH_CONFIG}',
+      coalesce((SELECT value FROM core_access_log_action WHERE id = NEW.action_id), '') || ' ' || coalesce(NEW.message, ''));
+    RETURN NEW;
+  END
+  $$ LANGUAGE plpgsql
+  """,
+  "DROP TRIGGER IF EXISTS core_access_log_search_vector ON core_access_log",
+  """
+  CREATE TRIGGER core_access_log_search_vector
+  BEFORE INSERT OR UPDATE OF message, action_id ON core_access_log
+  FOR EACH ROW EXECUTE FUNCTION core_access_log_search_vector()
+  """,
+)
+
+POSTGRES_INDEX = "CREATE INDEX IF NOT EXISTS core_access_log_search_idx ON core_access_log USING GIN (search_vector)"
+
+POSTGRES_BACKFILL = f"""
+  UPDATE core_access_log l
+  SET search_vector = to_tsvector('{SEARCH_CONFIG}', coalesce(a.value, '') || ' ' || coalesce(l.message, ''))
+  FROM core_access_log_action a
+  WHERE a.id = l.action_id AND l.id >= %s AND l.id < %s AND l.search_vector IS NULL
+"""
+
+POSTGRES_UNINSTALL = (
+  "DROP TRIGGER IF EXISTS core_access_log_search_vector ON core_access_log",
+  "DROP FUNCTION IF EXISTS core_access_log_search_vector()",
+  "DROP INDEX IF EXISTS core_access_log_search_idx",
+  "ALTER TABLE core_access_log DROP COLUMN IF EXISTS search_vector",
+)
+
+_FTS_ACTION = "(SELECT value FROM core_access_log_action WHERE id = NEW.action_id)"
+
+SQLITE_INSTALL = (
+  f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(action, message, tokenize = 'unicode61')",
+  f"""
+  CREATE TRIGGER IF NOT EXISTS core_access_log_fts_ai AFTER INSERT ON core_access_log BEGIN
+    INSERT INTO {FTS_TABLE}(rowid, action, message) VALUES (NEW.id, {_FTS_ACTION}, NEW.message);
+  END
+  """,
+  f"""
+  CREATE TRIGGER IF NOT EXISTS core_access_log_fts_ad AFTER DELETE ON core_access_log BEGIN
+    DELETE FROM {FTS_TABLE} WHERE rowid = OLD.id;
+  END
+  """,
+  f"""
+  CREATE TRIGGER IF NOT EXISTS core_access_log_fts_au AFTER UPDATE OF message, action_id ON core_access_log BEGIN
+    UPDATE {FTS_TABLE} SET action = {_FTS_ACTION}, message = NEW.message WHERE rowid = NEW.id;
+  END
+  """,
+)
+
+# Registros sin indexar (instalacion inicial o insertados mientras SQLite reconstruia la tabla)
+SQLITE_BACKFILL = f"""
+  INSERT INTO {FTS_TABLE}(rowid, action, message)
+  SELECT l.id, a.value, l.message FROM core_access_log l JOIN core_access_log_action a ON a.id = l.action_id
+  WHERE l.id >= %s AND l.id < %s AND l.id NOT IN (SELECT rowid FROM {FTS_TABLE} WHERE rowid >= %s AND rowid < %s)
+"""
+
+SQLITE_UNINSTALL = (
+  "DROP TRIGGER IF EXISTS core_access_log_fts_ai",
+  "DROP TRIGGER IF EXISTS core_access_log_fts_ad",
+  "DROP TRIGGER IF EXISTS core_access_log_fts_au",
+  f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+
+def _execute(connection, statements):
+  with connection.cursor() as cursor:
+    for statement in statements:
+      cursor.execute(statement)
+
+def install_search(connection, batch_size: int = BACKFILL_BATCH_SIZE):
+  """
+  Crea el indice de texto completo y los triggers que lo mantienen al insertar:
+  columna tsvector + GIN en PostgreSQL, tabla FTS5 en SQLite. Los registros existentes
+  se indexan en lotes (ver backfill_search). Es idempotente.
+  """
+
+  if connection.vendor == 'postgresql':
+    _execute(connection, POSTGRES_INSTALL)
+    backfill_search(connection, batch_size)
+    # El indice GIN se crea despues de llenar la columna (mas rapido que mantenerlo fila por fila)
+    _execute(connection, (POSTGRES_INDEX,))
+  elif connection.vendor == 'sqlite':
+    _execute(connection, SQLITE_INSTALL)
+    backfill_search(connection, batch_size)
+
+def backfill_search(connection, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+  """
+  Indexa los registros que aun no estan en el indice de texto completo, por rangos de
+  `batch_size` ids y cada rango en su propia transaccion: no bloquea ni reescribe toda la
+  tabla de una vez. Los registros nuevos los indexan los triggers.
+
+  Returns:
+    int: Numero de registros indexados.
+  """
+
+  if connection.vendor == 'postgresql':
+    sql, params = POSTGRES_BACKFILL, lambda start, end: [start, end]
+  elif connection.vendor == 'sqlite':
+    sql, params = SQLITE_BACKFILL, lambda start, end: [start, end, start, end]
+  else:
+    return 0
+
+  with connection.cursor() as cursor:
+    cursor.execute("SELECT MIN(id), MAX(id) FROM core_access_log")
+    low, high = cursor.fetchone()
+  if low is None:
+    return 0
+  indexed = 0
+  for start in range(low, high + 1, batch_size):
+    with transaction.atomic(using=connection.alias):
+      with connection.cursor() as cursor:
+        cursor.execute(sql, params(start, start + batch_size))
+        indexed += max(cursor.rowcount, 0)
+  return indexed
+
+def uninstall_search(connection):
+  if connection.vendor == 'postgresql':
+    _execute(connection, POSTGRES_UNINSTALL)
+  elif connection.vendor == 'sqlite':
+    _execute(connection, SQLITE_UNINSTALL)
+
+def fts_query(text: str) -> Optional[str]:
+  """
+  Convierte el texto del usuario en una consulta FTS5 segura: cada termino como frase
+  entre comillas y todos requeridos. Ej. 'token a@b.com' -> '"token" "a@b.com"'
+  """
+
+  terms = re.findall(r'\S+', text or '')
+  if not terms:
+    return None
+  return ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+def search_access_logs(queryset, text: str):
+  """
+  Filtra un queryset de AccessLog por texto en la accion y el mensaje usando el indice
+  de texto completo del motor. En otros motores recurre a icontains (sin indice).
+  """
+
+  vendor = connections[queryset.db].vendor
+  if vendor == 'postgresql':
+    return queryset.filter(RawSQL(
+      f"core_access_log.search_vector @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s)", [text],
+      output_field=BooleanField(),
+    ))
+  if vendor == 'sqlite':
+    query = fts_query(text)
+    if query is None:
+      return queryset.none()
+    return queryset.filter(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [query]))
+
+  condition = Q()
+  for term in text.split():
+    condition &= Q(action__value__icontains=term) | Q(message__icontains=term)
+  return queryset.filter(condition)
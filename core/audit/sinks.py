@@ -0,0 +1,324 @@
+import os
+import atexit
+import logging
+import threading
+
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+from django.db import close_old_connections, router, transaction
+from django.utils import timezone
+
+from core.audit.conf import get_audit_setting
+from core.audit.compaction import compaction_key, is_compactable, is_expired, merge_into, start_group
+from core.audit.interning import resolve_many
+from core.audit.rollups import apply_rollups
+
+logger = logging.getLogger(__name__)
+
+def write_access_logs(entries: List[Dict]) -> int:
+  """
+  Persiste un lote de registros de AccessLog con un solo bulk_create y, si esta
+  habilitado, actualiza los agregados por hora en la misma transaccion.
+
+  Args:
+    entries (list[dict]): Registros con los campos del modelo AccessLog; `action`,
+      `path`, `route` y `user_agent` se reciben como texto.
+
+  Returns:
+    int: Numero de registros escritos.
+  """
+
+  from core.models import AccessLog
+
+  if not entries:
+    return 0
+  using = router.db_for_write(AccessLog)
+  with transaction.atomic(using=using):
+    rows = build_access_logs(entries, using)
+    AccessLog.objects.using(using).bulk_create(rows, batch_size=len(rows))
+    if get_audit_setting('ROLLUPS'):
+      apply_rollups(entries, using=using)
+  return len(entries)
+
+def build_access_logs(entries: List[Dict], using: str) -> List:
+  """
+  Convierte los registros en instancias de AccessLog sustituyendo accion, ruta,
+  patron de ruta y user agent por el id de su tabla de diccionario.
+  """
+
+  from core.models import AccessLog, AccessLogAction, AccessLogPath, AccessLogRoute, AccessLogUserAgent
+
+  actions = resolve_many(AccessLogAction, {entry['action'] for entry in entries}, using)
+  paths = resolve_many(AccessLogPath, {entry['path'] for entry in entries}, using)
+  routes = resolve_many(AccessLogRoute, {entry['route'] for entry in entries if entry.get('route')}, using)
+  agents = resolve_many(AccessLogUserAgent, {entry['user_agent'] for entry in entries if entry.get('user_agent')}, using)
+
+  rows = []
+  for entry in entries:
+    fields = {key: value for key, value in entry.items() if key not in ('action', 'path', 'route', 'user_agent')}
+    rows.append(AccessLog(
+      action_id=actions[entry['action']],
+      path_id=paths[entry['path']],
+      route_id=routes.get(entry.get('route')),
+      user_agent_id=agents.get(entry.get('user_agent')),
+      **fields,
+    ))
+  return rows
+
+class DirectLogSink:
+  """
+  Destino sincrono: escribe cada registro en cuanto se recibe (un INSERT por request).
+  """
+
+  # put() accede a la base de datos: las vistas async lo llaman desde un hilo
+  blocking = True
+
+  def put(self, entry: Dict) -> bool:
+    write_access_logs([entry])
+    return True
+
+  def flush(self) -> int:
+    return 0
+
+  def stop(self):
+    pass
+
+  def stats(self) -> Dict[str, int]:
+    return {}
+
+class BufferedLogSink:
+  """
+  Destino en memoria por proceso. Los registros se acumulan en una cola y un hilo
+  de fondo los escribe con bulk_create cuando se alcanza `batch_size` o cuando
+  pasan `flush_interval` segundos. La cola se vacia al terminar el worker.
+
+  Con `compaction_window` > 0 las lecturas exitosas identicas (ver core.audit.compaction)
+  se agrupan en memoria durante la ventana y se escriben como un solo registro con
+  `count`, `first_seen` y `last_seen`. Escrituras y errores no se compactan.
+
+  Contadores expuestos por `stats()`:
+    - queued: registros aceptados en la cola desde el arranque.
+    - pending: registros en espera de escritura.
+    - compacting: grupos abiertos en la ventana de compactacion.
+    - compacted: eventos absorbidos por un grupo existente.
+    - flushed: registros escritos en la base de datos.
+    - dropped: eventos descartados por cola llena o por error de escritura (un grupo
+      compactado cuenta todos sus eventos).
+  """
+
+  # put() solo agrega a la cola en memoria: se puede llamar desde el event loop
+  blocking = False
+
+  def __init__(
+    self,
+    batch_size: int = 200,
+    flush_interval: float = 2.0,
+    max_queue_size: int = 10000,
+    autostart: bool = True,
+    compaction_window: float = 0,
+    compaction_max_keys: int = 10000,
+  ):
+    self.batch_size = max(1, int(batch_size))
+    self.flush_interval = float(flush_interval)
+    self.max_queue_size = max(1, int(max_queue_size))
+    self.autostart = autostart
+    self.compaction_window = float(compaction_window or 0)
+    self.compaction_max_keys = max(1, int(compaction_max_keys))
+    self._atexit_registered = False
+    self._reset()
+
+  def _reset(self):
+    self._queue = deque()
+    self._groups = OrderedDict()
+    self._lock = threading.Lock()
+    self._flush_lock = threading.Lock()
+    self._wakeup = threading.Event()
+    self._stopping = threading.Event()
+    self._thread = None
+    self._pid = os.getpid()
+    self.queued = 0
+    self.compacted = 0
+    self.flushed = 0
+    self.dropped = 0
+
+  def put(self, entry: Dict) -> bool:
+    """
+    Agrega un registro a la cola. Retorna False si se descarto por cola llena.
+    """
+
+    with self._lock:
+      if self.compaction_window and is_compactable(entry):
+        key = compaction_key(entry)
+        group = self._groups.get(key)
+        if group is not None:
+          merge_into(group, entry)
+          self.compacted += 1
+          return True
+        if len(self._groups) >= self.compaction_max_keys:
+          # Sin espacio para otro grupo: el mas antiguo se escribe antes de tiempo, salvo
+          # que la cola este llena (mismo limite que un registro sin compactar)
+          evicted = self._groups.popitem(last=False)[1]
+          if len(self._queue) >= self.max_queue_size:
+            self.dropped += evicted['count']
+          else:
+            self._queue.append(evicted)
+        self._groups[key] = start_group(entry)
+        self.queued += 1
+        pending = len(self._queue)
+      elif len(self._queue) >= self.max_queue_size:
+        self.dropped += 1
+        return False
+      else:
+        self._queue.append(entry)
+        self.queued += 1
+        pending = len(self._queue)
+
+    if self.autostart:
+      self._ensure_started()
+    if pending >= self.batch_size:
+      self._wakeup.set()
+    return True
+
+  def flush(self) -> int:
+    """
+    Escribe todos los registros pendientes en lotes de `batch_size`.
+
+    Returns:
+      int: Numero de registros escritos.
+    """
+
+    written = 0
+    self._release_groups()
+    with self._flush_lock:
+      while True:
+        with self._lock:
+          size = min(self.batch_size, len(self._queue))
+          batch = [self._queue.popleft() for _ in range(size)]
+        if not batch:
+          break
+
+        try:
+          self._write_batch(batch)
+        except Exception as e:
+          with self._lock:
+            self.dropped += sum(entry.get('count', 1) for entry in batch)
+          logger.error(f"[AccessLog Error] No se pudo escribir un lote de {len(batch)} logs: {e}")
+          continue
+
+        written += len(batch)
+        with self._lock:
+          self.flushed += len(batch)
+    return written
+
+  def _release_groups(self, force: bool = False):
+    """
+    Pasa a la cola de escritura los grupos cuya ventana termino (todos con `force`).
+    """
+
+    if not self._groups:
+      return
+    now = timezone.now()
+    with self._lock:
+      # Los grupos se crean en orden de llegada: el primero vigente detiene el recorrido
+      while self._groups:
+        key, group = next(iter(self._groups.items()))
+        if not force and not is_expired(group, now, self.compaction_window):
+          break
+        del self._groups[key]
+        self._queue.append(group)
+
+  def _write_batch(self, batch: List[Dict]):
+    write_access_logs(batch)
+
+  def stats(self) -> Dict[str, int]:
+    with self._lock:
+      return {
+        "queued": self.queued,
+        "pending": len(self._queue),
+        "compacting": len(self._groups),
+        "compacted": self.compacted,
+        "flushed": self.flushed,
+        "dropped": self.dropped,
+      }
+
+  def stop(self, timeout: Optional[float] = 5.0):
+    """
+    Detiene el hilo de escritura y vacia la cola en el hilo actual.
+    """
+
+    self._stopping.set()
+    self._wakeup.set()
+    thread = self._thread
+    if thread is not None and thread is not threading.current_thread():
+      thread.join(timeout)
+    self._release_groups(force=True)
+    self.flush()
+
+  def _ensure_started(self):
+    # Tras un fork (gunicorn --preload) el hilo y la cola del padre no son validos
+    if self._pid != os.getpid():
+      self._reset()
+
+    if self._thread is not None and self._thread.is_alive():
+      return
+    with self._lock:
+      if self._thread is not None and self._thread.is_alive():
+        return
+      self._stopping.clear()
+      self._thread = threading.Thread(target=self._run, name='access-log-flusher', daemon=True)
+      self._thread.start()
+      if not self._atexit_registered:
+        atexit.register(self.stop)
+        self._atexit_registered = True
+
+  def _run(self):
+    while not self._stopping.is_set():
+      self._wakeup.wait(self.flush_interval)
+      self._wakeup.clear()
+      try:
+        self.flush()
+      finally:
+        # El hilo tiene su propia conexion; se libera segun CONN_MAX_AGE
+        close_old_connections()
+
+_sink = None
+_sink_lock = threading.Lock()
+
+def get_log_sink():
+  """
+  Retorna el destino de logs del proceso segun `ACCESS_LOG['SINK']`.
+  """
+
+  global _sink
+  if _sink is None:
+    with _sink_lock:
+      if _sink is None:
+        _sink = _build_sink()
+  return _sink
+
+def _build_sink():
+  name = get_audit_setting('SINK')
+  if name == 'direct':
+    return DirectLogSink()
+  if name == 'buffer':
+    return BufferedLogSink(
+      batch_size=get_audit_setting('BATCH_SIZE'),
+      flush_interval=get_audit_setting('FLUSH_INTERVAL'),
+      max_queue_size=get_audit_setting('MAX_QUEUE_SIZE'),
+      compaction_window=get_audit_setting('COMPACTION_WINDOW'),
+      compaction_max_keys=get_audit_setting('COMPACTION_MAX_KEYS'),
+    )
+  if name == 'spool':
+    from core.audit.spool import SpoolLogSink, spool_dir
+    return SpoolLogSink(
+      directory=spool_dir(),
+      segment_max_bytes=get_audit_setting('SPOOL_SEGMENT_MAX_BYTES'),
+      segment_max_age=get_audit_setting('SPOOL_SEGMENT_MAX_AGE'),
+      batch_size=get_audit_setting('BATCH_SIZE'),
+      flush_interval=get_audit_setting('FLUSH_INTERVAL'),
+      max_queue_size=get_audit_setting('MAX_QUEUE_SIZE'),
+      compaction_window=get_audit_setting('COMPACTION_WINDOW'),
+      compaction_max_keys=get_audit_setting('COMPACTION_MAX_KEYS'),
+    )
+  raise ValueError(f"ACCESS_LOG['SINK'] no soportado: {name}")
@@ -0,0 +1,228 @@
+import os
+import json
+import time
+import logging
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import router, transaction
+from django.utils.dateparse import parse_datetime
+
+from core.audit.conf import get_audit_setting
+from core.audit.sinks import BufferedLogSink, write_access_logs
+
+logger = logging.getLogger(__name__)
+
+# Un segmento se escribe como *.open y se renombra a *.seg al cerrarse
+OPEN_SUFFIX = '.open'
+SEALED_SUFFIX = '.seg'
+
+def spool_dir() -> Path:
+  """
+  Directorio del spool local de logs (ACCESS_LOG['SPOOL_DIR']).
+  """
+
+  return Path(get_audit_setting('SPOOL_DIR') or Path(settings.BASE_DIR) / 'spool' / 'access_logs')
+
+# Campos de fecha del registro; se guardan en ISO 8601
+DATETIME_FIELDS = ('created_at', 'first_seen', 'last_seen')
+
+def encode_entry(entry: Dict) -> bytes:
+  """
+  Serializa un registro como una linea NDJSON.
+  """
+
+  data = dict(entry)
+  for field in DATETIME_FIELDS:
+    if data.get(field) is not None:
+      data[field] = data[field].isoformat()
+  return (json.dumps(data, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+
+def decode_entry(line: bytes) -> Dict:
+  entry = json.loads(line)
+  for field in DATETIME_FIELDS:
+    if entry.get(field) is not None:
+      entry[field] = parse_datetime(entry[field])
+  return entry
+
+class SpoolLogSink(BufferedLogSink):
+  """
+  Destino en archivo local append-only. Usa la cola y el hilo de BufferedLogSink,
+  pero cada lote se agrega al segmento activo con un solo write + fsync en lugar de
+  escribirse en la base de datos; el request nunca toca la base de datos para auditar.
+
+  El segmento rota al superar `segment_max_bytes` o `segment_max_age` segundos. Los
+  segmentos los carga `load_access_log_spool` (ver `load_spool`).
+  """
+
+  def __init__(self, directory: Path, segment_max_bytes: int = 64 * 1024 * 1024, segment_max_age: float = 300, **kwargs):
+    self.directory = Path(directory)
+    self.segment_max_bytes = int(segment_max_bytes)
+    self.segment_max_age = float(segment_max_age)
+    super().__init__(**kwargs)
+
+  def _reset(self):
+    super()._reset()
+    # Tras un fork el hijo abre su propio segmento; el del padre sigue siendo del padre
+    self._file = None
+    self._file_path = None
+    self._file_opened_at = 0.0
+    self._sequence = 0
+
+  def _write_batch(self, batch: List[Dict]):
+    data = b''.join(encode_entry(entry) for entry in batch)
+    fh = self._segment()
+    fh.write(data)
+    fh.flush()
+    os.fsync(fh.fileno())
+    if fh.tell() >= self.segment_max_bytes:
+      self._seal()
+
+  def _segment(self):
+    if self._file is not None and time.monotonic() - self._file_opened_at >= self.segment_max_age:
+      self._seal()
+    if self._file is None:
+      self.directory.mkdir(parents=True, exist_ok=True)
+      self._sequence += 1
+      name = f'{time.strftime("%Y%m%dT%H%M%S", time.gmtime())}-{os.getpid()}-{self._sequence:06d}{OPEN_SUFFIX}'
+      self._file_path = self.directory / name
+      self._file = open(self._file_path, 'ab')
+      self._file_opened_at = time.monotonic()
+    return self._file
+
+  def flush(self) -> int:
+    written = super().flush()
+    # Sin trafico el segmento tambien se cierra por antigüedad para que el cargador lo tome
+    with self._flush_lock:
+      if self._file is not None and time.monotonic() - self._file_opened_at >= self.segment_max_age:
+        self._seal()
+    return written
+
+  def _seal(self):
+    if self._file is None:
+      return
+    self._file.close()
+    os.replace(self._file_path, self._file_path.with_suffix(SEALED_SUFFIX))
+    self._file = None
+    self._file_path = None
+
+  def stop(self, timeout: Optional[float] = 5.0):
+    super().stop(timeout)
+    with self._flush_lock:
+      self._seal()
+
+def pending_segments(directory: Path, stale_after: float) -> List[Tuple[Path, bool]]:
+  """
+  Segmentos por cargar en orden de creacion: (ruta, cerrado). Un segmento abierto sin
+  escrituras en `stale_after` segundos se considera cerrado (su writer termino sin rotarlo).
+  """
+
+  now = time.time()
+  segments = []
+  for path in directory.glob('*'):
+    if path.suffix == SEALED_SUFFIX:
+      segments.append((path, True))
+    elif path.suffix == OPEN_SUFFIX:
+      segments.append((path, now - path.stat().st_mtime >= stale_after))
+  return sorted(segments, key=lambda item: item[0].stem)
+
+def _read_lines(fh, batch_size: int) -> Tuple[List[bytes], int]:
+  # Solo lineas completas: una linea sin '\n' puede estar escribiendose todavia
+  lines = []
+  end = fh.tell()
+  while len(lines) < batch_size:
+    line = fh.readline()
+    if not line.endswith(b'\n'):
+      break
+    lines.append(line)
+    end = fh.tell()
+  fh.seek(end)
+  return lines, end
+
+def load_segment(path: Path, sealed: bool, batch_size: int, using: Optional[str] = None) -> Dict[str, int]:
+  """
+  Carga un segmento desde el ultimo offset registrado. Cada lote se inserta y su offset
+  se actualiza en la misma transaccion, por lo que tras una caida no se pierde ni se
+  duplica nada. El segmento cerrado y cargado por completo se elimina.
+
+  Returns:
+    dict: {'loaded', 'skipped', 'removed'}
+  """
+
+  from core.models import AccessLog, AccessLogSpoolOffset
+
+  using = using or router.db_for_write(AccessLog)
+  manager = AccessLogSpoolOffset.objects.db_manager(using)
+  # El offset se guarda por nombre sin sufijo: sigue valido cuando el writer cierra el segmento
+  state, _ = manager.get_or_create(segment=path.stem)
+  stats = {'loaded': 0, 'skipped': 0, 'removed': 0}
+
+  with open(path, 'rb') as fh:
+    fh.seek(state.offset)
+    while True:
+      start = fh.tell()
+      lines, end = _read_lines(fh, batch_size)
+      if not lines:
+        break
+
+      entries = []
+      for line in lines:
+        try:
+          entries.append(decode_entry(line))
+        except (ValueError, KeyError, TypeError) as e:
+          stats['skipped'] += 1
+          logger.warning(f"[AccessLog Warning] Linea invalida en {path.name}: {e}")
+
+      with transaction.atomic(using=using):
+        # Otro cargador pudo avanzar el mismo segmento: se respeta su offset
+        current = manager.select_for_update().get(pk=state.pk)
+        if current.offset != start:
+          logger.warning(f"[AccessLog Warning] {path.name} ya fue cargado hasta {current.offset}; se omite")
+          return stats
+        write_access_logs(entries)
+        current.offset = end
+        current.save(update_fields=['offset', 'updated_at'])
+      stats['loaded'] += len(entries)
+
+    if sealed:
+      rest = fh.read()
+      if rest:
+        # Linea incompleta de un writer interrumpido
+        stats['skipped'] += 1
+        logger.warning(f"[AccessLog Warning] {path.name} termina con una linea incompleta ({len(rest)} bytes)")
+
+  if sealed:
+    # Primero el archivo: si se borrara antes el offset, una caida provocaria una recarga
+    path.unlink()
+    manager.filter(segment=path.stem).delete()
+    stats['removed'] = 1
+  return stats
+
+def load_spool(
+  directory: Optional[Path] = None,
+  batch_size: Optional[int] = None,
+  stale_after: Optional[float] = None,
+  using: Optional[str] = None,
+) -> Dict[str, int]:
+  """
+  Carga todos los segmentos pendientes del spool en core_access_log.
+
+  Returns:
+    dict: {'segments', 'loaded', 'skipped', 'removed'}
+  """
+
+  directory = Path(directory or spool_dir())
+  batch_size = batch_size or get_audit_setting('BATCH_SIZE')
+  stale_after = get_audit_setting('SPOOL_STALE_AFTER') if stale_after is None else stale_after
+  totals = {'segments': 0, 'loaded': 0, 'skipped': 0, 'removed': 0}
+  if not directory.exists():
+    return totals
+
+  for path, sealed in pending_segments(directory, stale_after):
+    stats = load_segment(path, sealed, batch_size, using=using)
+    totals['segments'] += 1
+    for key, value in stats.items():
+      totals[key] += value
+  return totals
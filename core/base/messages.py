@@ -39,6 +39,9 @@ MESSAGES = {
         # Logs
         'log_list': _("Access logs list."), # Listado de logs de acceso.
         'log_details': _("Access log details."), # Detalle del log de acceso.
+        'log_stats': _("Access log statistics."), # Estadisticas de los logs de acceso.
+        'log_timeline': _("Object audit timeline."), # Historial de auditoria del objeto.
+        'log_search': _("Access logs search results."), # Resultados de la busqueda en los logs de acceso.
     },
     "errors": {
         # Authentication
@@ -75,11 +78,17 @@ MESSAGES = {
 
         # Permissions
         'permissions_list_required': _("Must provide a list of permission IDs."), # Debe enviar una lista de IDs de permisos.
+
+        # Logs
+        'log_export_invalid_output': _("Output format must be 'csv' or 'ndjson'."), # El formato de salida debe ser 'csv' o 'ndjson'.
+        'log_search_missing_query': _("A search text (q) is required."), # Se requiere un texto de busqueda (q).
+        'log_stats_invalid_range': _("The end date must be later than the start date."), # La fecha final debe ser posterior a la inicial.
     },
     "logs": {
         # Authentication
         'login': _("User logged in."), # Inicio de sesión.
         'logout': _("User logged out."), # Cierre de sesión.
+        'logout_all': _("User logged out from all devices."), # Cierre de sesión en todos los dispositivos.
         'token_refresh': _("Token refreshed."), # Actualización de token.
         # Users
         'user_list': _("Viewed user list."), # Visualizó el listado de usuarios.
@@ -105,6 +114,9 @@ MESSAGES = {
         'log_list': _("Viewed access logs list."), # Visualizó el listado de logs
         'log_details': _("Viewed access log details."), # Visualizó los detalles del log
         'log_export': _("Access logs list with export."), # Listado de logs de acceso con exportación.
+        'log_stats': _("Viewed access log statistics."), # Visualizó las estadisticas de los logs
+        'log_timeline': _("Viewed object audit timeline."), # Visualizó el historial de auditoria de un objeto
+        'log_search': _("Searched access logs."), # Buscó en los logs de acceso
     }
 }
 
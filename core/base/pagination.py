@@ -1,6 +1,199 @@
+import json
+import base64
+import binascii
+
+from datetime import datetime
+from collections import OrderedDict
+
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
 
 class BasePagination(PageNumberPagination):
   page_size = 10
   page_size_query_param = 'page_size'
-  max_page_size = 100
\ No newline at end of file
+  max_page_size = 100
+
+class AsyncBasePagination(BasePagination):
+  """
+  BasePagination para vistas async: el conteo y la pagina se leen con el ORM async y
+  el resto (parametros, enlaces y respuesta) es el de PageNumberPagination.
+  """
+
+  async def apaginate_queryset(self, queryset, request):
+    page_size = self.get_page_size(request)
+    paginator = self.django_paginator_class(queryset, page_size)
+    # El conteo se asigna a la cache de Paginator.count para no ejecutarlo de forma sincrona
+    paginator.count = await queryset.acount()
+    try:
+      number = paginator.validate_number(request.query_params.get(self.page_query_param) or 1)
+    except InvalidPage as exc:
+      raise NotFound(self.invalid_page_message.format(page_number=request.query_params.get(self.page_query_param), message=str(exc)))
+
+    offset = (number - 1) * page_size
+    results = [obj async for obj in queryset[offset:offset + page_size]]
+    self.page = Page(results, number, paginator)
+    self.request = request
+    return results
+
+class EstimatedCountPaginator(Paginator):
+  """
+  Paginador de Django (admin) para tablas grandes: en PostgreSQL toma el total de la
+  estimacion del planificador (EXPLAIN) en lugar de COUNT(*). Si la estimacion es menor
+  a `exact_count_threshold` cuenta exacto, porque el conteo ya es barato. En otros
+  motores cuenta normalmente.
+  """
+
+  exact_count_threshold = 10000
+
+  @cached_property
+  def count(self):
+    queryset = self.object_list
+    if connections[queryset.db].vendor != 'postgresql':
+      return super().count
+
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    estimate = int(plan[0]['Plan']['Plan Rows'])
+    if estimate < self.exact_count_threshold:
+      return super().count
+    return estimate
+
+class KeysetPagination(pagination.BasePagination):
+  """
+  Paginacion por llave (keyset) sobre (created_at, id) en orden descendente.
+  No usa COUNT(*) ni OFFSET: cada pagina es un rango sobre el indice compuesto,
+  por lo que una pagina profunda cuesta lo mismo que la primera.
+
+  El cursor es opaco (base64) y contiene la direccion y la ultima llave vista.
+  """
+
+  page_size = 50
+  page_size_query_param = 'page_size'
+  max_page_size = 500
+  cursor_query_param = 'cursor'
+  invalid_cursor_message = 'Invalid cursor'
+  # Campos de la llave: (timestamp, desempate unico)
+  ordering = ('created_at', 'id')
+
+  def paginate_queryset(self, queryset, request, view=None):
+    self.request = request
+    self.page_size = self.get_page_size(request)
+    self.cursor = self.decode_cursor(request)
+
+    time_field, id_field = self.ordering
+    if self.cursor is None:
+      queryset = queryset.order_by(f'-{time_field}', f'-{id_field}')
+    else:
+      reverse, position, pk = self.cursor
+      if reverse:
+        # Hacia registros mas recientes: se lee en orden ascendente y luego se invierte
+        queryset = queryset.filter(**{f'{time_field}__gte': position}).filter(
+          Q(**{f'{time_field}__gt': position}) | Q(**{f'{id_field}__gt': pk})
+        ).order_by(time_field, id_field)
+      else:
+        # El filtro `lte` acota el rango del indice; el Q resuelve los empates por id
+        queryset = queryset.filter(**{f'{time_field}__lte': position}).filter(
+          Q(**{f'{time_field}__lt': position}) | Q(**{f'{id_field}__lt': pk})
+        ).order_by(f'-{time_field}', f'-{id_field}')
+
+    rows = list(queryset[:self.page_size + 1])
+    has_more = len(rows) > self.page_size
+    rows = rows[:self.page_size]
+
+    reverse = self.cursor is not None and self.cursor[0]
+    if reverse:
+      rows.reverse()
+      self.has_next = True
+      self.has_previous = has_more
+    else:
+      self.has_next = has_more
+      self.has_previous = self.cursor is not None
+
+    self.page = rows
+    return rows
+
+  def get_page_size(self, request):
+    if self.page_size_query_param:
+      try:
+        value = int(request.query_params[self.page_size_query_param])
+        if value > 0:
+          return min(value, self.max_page_size)
+      except (KeyError, ValueError):
+        pass
+    return self.page_size
+
+  def decode_cursor(self, request):
+    encoded = request.query_params.get(self.cursor_query_param)
+    if not encoded:
+      return None
+    try:
+      payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+      return bool(payload['r']), datetime.fromisoformat(payload['t']), int(payload['i'])
+    except (TypeError, ValueError, KeyError, binascii.Error, UnicodeError):
+      raise NotFound(self.invalid_cursor_message)
+
+  def encode_cursor(self, reverse, row):
+    time_field, id_field = self.ordering
+    payload = {
+      'r': int(reverse),
+      't': getattr(row, time_field).isoformat(),
+      'i': getattr(row, id_field),
+    }
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+    url = self.request.build_absolute_uri()
+    return replace_query_param(url, self.cursor_query_param, encoded)
+
+  def get_next_link(self):
+    if not self.has_next or not self.page:
+      return None
+    return self.encode_cursor(False, self.page[-1])
+
+  def get_previous_link(self):
+    if not self.has_previous:
+      return None
+    if not self.page:
+      return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+    return self.encode_cursor(True, self.page[0])
+
+  def get_paginated_response(self, data):
+    return Response(OrderedDict([
+      ('next', self.get_next_link()),
+      ('previous', self.get_previous_link()),
+      ('results', data),
+    ]))
+
+  def get_paginated_response_schema(self, schema):
+    return {
+      'type': 'object',
+      'required': ['results'],
+      'properties': {
+        'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+        'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+        'results': schema,
+      },
+    }
+
+  def get_schema_operation_parameters(self, view):
+    return [
+      {
+        'name': self.cursor_query_param,
+        'required': False,
+        'in': 'query',
+        'description': 'Cursor de paginacion (usar los enlaces next/previous).',
+        'schema': {'type': 'string'},
+      },
+      {
+        'name': self.page_size_query_param,
+        'required': False,
+        'in': 'query',
+        'description': 'Numero de resultados por pagina.',
+        'schema': {'type': 'integer'},
+      },
+    ]
@@ -2,6 +2,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.request import Request
 
+from django.http import JsonResponse
+
 from typing import Any, Optional
 
 def response_structure(success: bool = True, message: str = "Operacón exitosa.", data: Optional[Any] = None, errors: Optional[Any] = None, status_code: int = status.HTTP_200_OK) -> Response:
@@ -16,6 +18,23 @@ def response_structure(success: bool = True, message: str = "Operacón exitosa."
     status=status_code
   )
 
+def json_response_structure(success: bool = True, message: str = "Operacón exitosa.", data: Optional[Any] = None, errors: Optional[Any] = None, status_code: int = status.HTTP_200_OK) -> JsonResponse:
+  """
+  Misma estructura que response_structure para vistas fuera de DRF (ej. vistas async).
+  Expone `data` como Response para que LogActionView lea el mensaje.
+  """
+
+  payload = {
+    "success": success,
+    "message": message,
+    "status_code": status_code,
+    "data": data,
+    "errors": errors,
+  }
+  response = JsonResponse(payload, status=status_code)
+  response.data = payload
+  return response
+
 class APIRequestInfo:
   @staticmethod
   def GetIPClient(request: Request) -> str:
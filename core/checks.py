@@ -0,0 +1,19 @@
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+
+from core.audit.conf import get_audit_setting
+from core.audit.sampling import validate_sample_rate
+
+@checks.register()
+def check_sampling_rates(app_configs, **kwargs):
+  """
+  Valida ACCESS_LOG['SAMPLING'] al arrancar, en lugar de en cada request.
+  """
+
+  errors = []
+  for key, rate in get_audit_setting('SAMPLING').items():
+    try:
+      validate_sample_rate(key, rate)
+    except ImproperlyConfigured as e:
+      errors.append(checks.Error(str(e), hint="Ajusta ACCESS_LOG['SAMPLING'].", id='core.E001'))
+  return errors
@@ -0,0 +1,25 @@
+import django_filters
+
+from core.models import AccessLog
+
+class AccessLogFilter(django_filters.FilterSet):
+  """
+  Filtro para el modelo AccessLog.
+  Permite filtrar por rango de fechas, usuario, accion, endpoint, codigo de estatus y objeto afectado.
+  """
+
+  date_from = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+  date_to = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+  user = django_filters.NumberFilter(field_name="user_id")
+  # La accion vive en la tabla de diccionario; el filtro recorre esa tabla pequeña y no los logs
+  action = django_filters.CharFilter(field_name="action__value", lookup_expr="icontains")
+  route = django_filters.CharFilter(field_name="route__value")
+  view_name = django_filters.CharFilter(field_name="view_name")
+  status_code = django_filters.NumberFilter(field_name="status_code")
+  method = django_filters.CharFilter(field_name="method", lookup_expr="iexact")
+  object_type = django_filters.CharFilter(field_name="object_type")
+  object_id = django_filters.NumberFilter(field_name="object_id")
+
+  class Meta:
+    model = AccessLog
+    fields = ['date_from', 'date_to', 'user', 'action', 'route', 'view_name', 'status_code', 'method', 'object_type', 'object_id']
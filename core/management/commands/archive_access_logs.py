@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import router
+from django.utils import timezone
+
+from core.models import AccessLog
+from core.audit.conf import get_audit_setting
+from core.audit.archive import archive_dir, archivable_days, archive_day
+
+class Command(BaseCommand):
+  help = (
+    "Mueve los registros de core_access_log anteriores a N dias a segmentos comprimidos "
+    "por dia (UTC) en disco, con un indice min/max por segmento. Los registros archivados "
+    "se consultan con search_access_log_archive; los agregados por hora no se modifican."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--older-than-days', type=int, default=None, help="Archiva los dias completos anteriores a N dias (por defecto ACCESS_LOG['ARCHIVE_AFTER_DAYS']).")
+    parser.add_argument('--batch-size', type=int, default=None, help="Filas por lectura y por lote de borrado (por defecto ACCESS_LOG['PRUNE_BATCH_SIZE']).")
+    parser.add_argument('--dry-run', action='store_true', help="Solo muestra los dias que se archivarian.")
+
+  def handle(self, *args, **options):
+    days_old = options['older_than_days'] if options['older_than_days'] is not None else get_audit_setting('ARCHIVE_AFTER_DAYS')
+    batch_size = options['batch_size'] or get_audit_setting('PRUNE_BATCH_SIZE')
+    cutoff = (timezone.now() - timedelta(days=days_old)).date()
+    using = router.db_for_write(AccessLog)
+
+    days = archivable_days(cutoff, using=using)
+    if options['dry_run']:
+      self.stdout.write(f"Dias por archivar: {', '.join(f'{day:%Y-%m-%d}' for day in days) or '-'}")
+      return
+
+    total = 0
+    for day in days:
+      count = archive_day(day, batch_size, using=using)
+      total += count
+      self.stdout.write(f"{day:%Y-%m-%d}: {count} registros archivados")
+
+    self.stdout.write(self.style.SUCCESS(
+      f"Registros archivados: {total} en {len(days)} segmentos (anteriores a {cutoff:%Y-%m-%d}) en {archive_dir()}."
+    ))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.audit.spool import load_spool, spool_dir
+
+class Command(BaseCommand):
+  help = (
+    "Carga en core_access_log los segmentos del spool local (ACCESS_LOG['SINK'] = 'spool'). "
+    "La carga es idempotente: el avance de cada segmento se guarda en la misma transaccion "
+    "que el insert. Con --loop se ejecuta como proceso permanente."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--batch-size', type=int, default=None, help="Registros por transaccion (por defecto ACCESS_LOG['BATCH_SIZE']).")
+    parser.add_argument('--stale-after', type=float, default=None, help="Segundos sin escritura para tratar un segmento abierto como cerrado (por defecto ACCESS_LOG['SPOOL_STALE_AFTER']).")
+    parser.add_argument('--loop', action='store_true', help="Repite la carga cada --interval segundos.")
+    parser.add_argument('--interval', type=float, default=5.0, help="Segundos entre cargas con --loop.")
+
+  def handle(self, *args, **options):
+    while True:
+      totals = load_spool(batch_size=options['batch_size'], stale_after=options['stale_after'])
+      if totals['segments'] or not options['loop']:
+        self.stdout.write(self.style.SUCCESS(
+          f"Segmentos: {totals['segments']}, registros cargados: {totals['loaded']}, "
+          f"omitidos: {totals['skipped']}, segmentos eliminados: {totals['removed']} ({spool_dir()})."
+        ))
+      if not options['loop']:
+        return
+      close_old_connections()
+      time.sleep(options['interval'])
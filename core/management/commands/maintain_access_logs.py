@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connections, router
+from django.utils import timezone
+
+from core.models import AccessLog
+from core.audit.conf import get_audit_setting
+from core.audit.partitions import (
+  is_partitioned, ensure_partitions, expired_partitions, remove_partition,
+  delete_expired_rows, delete_expired_default_rows, count_expired_default_rows,
+)
+
+class Command(BaseCommand):
+  help = (
+    "Mantenimiento de core_access_log: crea las particiones mensuales futuras, elimina "
+    "(o separa con --detach) las que superan la retencion y borra en lotes las filas expiradas "
+    "de la particion default. Si la tabla no esta particionada (ej. SQLite) elimina las filas "
+    "expiradas en lotes acotados."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--retention-days', type=int, default=None, help="Dias a conservar (por defecto ACCESS_LOG['RETENTION_DAYS']).")
+    parser.add_argument('--months-ahead', type=int, default=None, help="Meses futuros a pre-crear (por defecto ACCESS_LOG['PARTITION_MONTHS_AHEAD']).")
+    parser.add_argument('--batch-size', type=int, default=None, help="Filas por lote en el borrado sin particiones (por defecto ACCESS_LOG['PRUNE_BATCH_SIZE']).")
+    parser.add_argument('--detach', action='store_true', help="Separa las particiones expiradas en lugar de eliminarlas.")
+    parser.add_argument('--dry-run', action='store_true', help="Solo muestra lo que se haria.")
+
+  def handle(self, *args, **options):
+    retention_days = options['retention_days'] if options['retention_days'] is not None else get_audit_setting('RETENTION_DAYS')
+    months_ahead = options['months_ahead'] if options['months_ahead'] is not None else get_audit_setting('PARTITION_MONTHS_AHEAD')
+    batch_size = options['batch_size'] or get_audit_setting('PRUNE_BATCH_SIZE')
+    cutoff = timezone.now() - timedelta(days=retention_days)
+
+    using = router.db_for_write(AccessLog)
+    connection = connections[using]
+
+    if is_partitioned(connection):
+      self._maintain_partitions(connection, months_ahead, cutoff, batch_size, options['detach'], options['dry_run'])
+      return
+
+    if options['dry_run']:
+      count = AccessLog.objects.using(using).filter(created_at__lt=cutoff).count()
+      self.stdout.write(f"Se eliminarian {count} registros anteriores a {cutoff:%Y-%m-%d}.")
+      return
+
+    deleted = delete_expired_rows(cutoff, batch_size, using=using)
+    self.stdout.write(self.style.SUCCESS(f"Registros eliminados: {deleted} (anteriores a {cutoff:%Y-%m-%d})."))
+
+  def _maintain_partitions(self, connection, months_ahead, cutoff, batch_size, detach, dry_run):
+    expired = expired_partitions(connection, cutoff)
+    if dry_run:
+      self.stdout.write(f"Particiones expiradas: {', '.join(expired) or '-'}")
+      self.stdout.write(f"Se eliminarian {count_expired_default_rows(connection, cutoff)} registros de la particion default.")
+      return
+
+    created = ensure_partitions(connection, months_ahead)
+    for name in created:
+      self.stdout.write(f"Particion creada: {name}")
+
+    for name in expired:
+      remove_partition(connection, name, detach=detach)
+      self.stdout.write(f"Particion {'separada' if detach else 'eliminada'}: {name}")
+
+    deleted = delete_expired_default_rows(connection, cutoff, batch_size)
+    self.stdout.write(self.style.SUCCESS(
+      f"Particiones creadas: {len(created)}, expiradas: {len(expired)}; registros eliminados de la particion default: {deleted}."
+    ))
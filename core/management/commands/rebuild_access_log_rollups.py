@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.audit.rollups import rebuild_rollups
+
+class Command(BaseCommand):
+  help = (
+    "Recalcula los agregados por hora de AccessLog (core_access_log_rollup) a partir de "
+    "core_access_log. Por defecto recalcula las ultimas 24 horas; puede programarse de forma "
+    "periodica o usarse para cargar historicos."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--hours', type=int, default=24, help="Horas hacia atras a recalcular (si no se indica --date-from).")
+    parser.add_argument('--date-from', type=str, default=None, help="Fecha inicial ISO 8601 (inclusiva).")
+    parser.add_argument('--date-to', type=str, default=None, help="Fecha final ISO 8601 (exclusiva). Por defecto la hora siguiente a la actual.")
+
+  def handle(self, *args, **options):
+    date_to = self._parse(options['date_to']) or timezone.now() + timedelta(hours=1)
+    date_from = self._parse(options['date_from']) or date_to - timedelta(hours=options['hours'] + 1)
+    if date_from >= date_to:
+      raise CommandError("--date-from debe ser anterior a --date-to.")
+
+    created = rebuild_rollups(date_from, date_to)
+    self.stdout.write(self.style.SUCCESS(
+      f"Agregados recalculados: {created} ({date_from:%Y-%m-%d %H:00} - {date_to:%Y-%m-%d %H:00})."
+    ))
+
+  def _parse(self, value) -> datetime:
+    if not value:
+      return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+      raise CommandError(f"Fecha invalida: {value}")
+    if timezone.is_naive(parsed):
+      parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
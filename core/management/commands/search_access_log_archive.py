@@ -0,0 +1,42 @@
+import json
+from datetime import timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.audit.archive import search_archive
+
+class Command(BaseCommand):
+  help = (
+    "Busca registros de AccessLog en el archivo frio (segmentos de archive_access_logs) por "
+    "rango de fechas, usuario y accion, sin restaurarlos a la base de datos. Imprime NDJSON."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument('--date-from', type=str, default=None, help="Fecha inicial ISO 8601 (inclusiva).")
+    parser.add_argument('--date-to', type=str, default=None, help="Fecha final ISO 8601 (exclusiva).")
+    parser.add_argument('--user', type=int, default=None, help="ID del usuario.")
+    parser.add_argument('--action', type=str, default=None, help="Texto contenido en la accion.")
+    parser.add_argument('--limit', type=int, default=None, help="Maximo de registros a imprimir.")
+
+  def handle(self, *args, **options):
+    rows = search_archive(
+      date_from=self._parse(options['date_from']),
+      date_to=self._parse(options['date_to']),
+      user_id=options['user'],
+      action=options['action'],
+      limit=options['limit'],
+    )
+    for row in rows:
+      self.stdout.write(json.dumps(row, ensure_ascii=False))
+
+  def _parse(self, value):
+    if not value:
+      return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+      raise CommandError(f"Fecha invalida: {value}")
+    if timezone.is_naive(parsed):
+      parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
@@ -0,0 +1,69 @@
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from django.middleware.locale import LocaleMiddleware
+
+# Las rutas de la API se autentican con JWT (sin cookies): no usan sesion, mensajes ni CSRF
+API_PATH_PREFIX = '/api/'
+
+def is_api_request(request) -> bool:
+  return request.path.startswith(API_PATH_PREFIX)
+
+class ApiSkipMixin:
+  """
+  Omite el middleware completo en las rutas de la API. Ademas de no ejecutar
+  process_request/process_response, bajo ASGI evita el salto a un hilo
+  (sync_to_async) que MiddlewareMixin hace para llamarlos.
+  """
+
+  def prepare_api_request(self, request):
+    pass
+
+  def __call__(self, request):
+    if is_api_request(request):
+      self.prepare_api_request(request)
+      # En modo async get_response es una corrutina: quien llama la espera
+      return self.get_response(request)
+    return super().__call__(request)
+
+class ApiSkipSessionMiddleware(ApiSkipMixin, SessionMiddleware):
+  """
+  SessionMiddleware que no carga ni guarda la sesion en las rutas de la API.
+  """
+
+class ApiSkipCsrfViewMiddleware(ApiSkipMixin, CsrfViewMiddleware):
+  """
+  CsrfViewMiddleware que no lee ni emite la cookie CSRF en las rutas de la API
+  (las vistas de DRF ya son csrf_exempt y JWT no usa cookies).
+  """
+
+  def process_view(self, request, callback, callback_args, callback_kwargs):
+    if is_api_request(request):
+      return None
+    return super().process_view(request, callback, callback_args, callback_kwargs)
+
+class ApiSkipAuthenticationMiddleware(ApiSkipMixin, AuthenticationMiddleware):
+  """
+  AuthenticationMiddleware sin sesion en las rutas de la API: el usuario lo asigna la
+  autenticacion de DRF (JWT) al ejecutar la vista.
+  """
+
+  def prepare_api_request(self, request):
+    request.user = AnonymousUser()
+    request.auser = _anonymous_user
+
+class ApiSkipMessageMiddleware(ApiSkipMixin, MessageMiddleware):
+  """
+  MessageMiddleware que no crea el almacenamiento de mensajes en las rutas de la API.
+  """
+
+class ApiSkipLocaleMiddleware(ApiSkipMixin, LocaleMiddleware):
+  """
+  LocaleMiddleware solo para rutas fuera de la API; en la API el idioma lo activa
+  CoreRequestMiddleware.
+  """
+
+async def _anonymous_user():
+  return AnonymousUser()
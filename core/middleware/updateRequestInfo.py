@@ -1,71 +1,110 @@
 import logging
-import threading
 
-from django.utils.timezone import now
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
 
 from core.base.responses import APIRequestInfo
+from core.middleware.apiFastPath import is_api_request
+from core.utils.activity import get_activity_tracker
 
 logger = logging.getLogger(__name__)
-_user_request_local = threading.local()
+# Request en curso; un ContextVar es correcto tanto por hilo (WSGI) como por corrutina (ASGI)
+_current_request: ContextVar = ContextVar('current_request', default=None)
 
-class UpdateUserInfoMiddleware:
+class CoreRequestMiddleware:
   """
-  Middleware que actualiza last_activity y last_ip del usuario autenticado en cada request a /api/.
+  Middleware unico del core; en una sola pasada por request:
+    - Activa el idioma: el del usuario si ya esta autenticado (sesion) o el de Accept-Language
+      en la API (ahi LocaleMiddleware se omite, ver core.middleware.apiFastPath).
+    - Expone el request actual para get_current_user().
+    - Registra last_activity/last_ip del usuario autenticado en la API (ver core.utils.activity).
+
+  Soporta WSGI y ASGI sin adaptadores: bajo ASGI no hay saltos a hilos (sync_to_async).
   """
 
+  sync_capable = True
+  async_capable = True
+
   def __init__(self, get_response):
     self.get_response = get_response
-  
+    self.async_mode = iscoroutinefunction(get_response)
+    if self.async_mode:
+      markcoroutinefunction(self)
+
   def __call__(self, request):
-    response = self.get_response(request)
+    if self.async_mode:
+      return self.__acall__(request)
+
+    user = getattr(request, 'user', None)
+    self._activate_language(request, user if user is not None and user.is_authenticated else None)
+    token = _current_request.set(request)
+    try:
+      response = self.get_response(request)
+    finally:
+      _current_request.reset(token)
 
-    # Ignora rutas que no son API
-    if not request.path.startswith('/api/'):
+    if not is_api_request(request):
       return response
-    
+    user = self._authenticated_user(request)
     try:
-      if request.user.is_authenticated:
-        user = request.user
-        ip = APIRequestInfo.GetIPClient(request)
-        update_fields = []
-
-        # Actualiza la última actividade del usuario
-        user.last_activity = now()
-        update_fields.append('last_activity')
-
-        if ip and ip != user.last_ip:
-          user.last_ip = ip
-          update_fields.append('last_ip')
-        
-        if update_fields:
-          user.save(update_fields=update_fields)
+      if user is not None:
+        get_activity_tracker().touch(user, APIRequestInfo.GetIPClient(request))
     except Exception as e:
       logger.warning(f"[Middleware] No se pudo actualizar la informacion default del usuario: {e}")
-    
-    return response
+    return self._finalize(response)
 
-def get_current_user():
-  """
-  Devuelve el usuario autenticado almacenado en el thread-local actual, o None si no hay usuario.
-  """
+  async def __acall__(self, request):
+    user = None
+    if hasattr(request, 'auser'):
+      # El usuario de sesion es perezoso: se resuelve con la API async para no bloquear el loop
+      user = await request.auser()
+    self._activate_language(request, user if user is not None and user.is_authenticated else None)
+    token = _current_request.set(request)
+    try:
+      response = await self.get_response(request)
+    finally:
+      _current_request.reset(token)
 
-  return getattr(_user_request_local, 'current_user', None)
+    if not is_api_request(request):
+      return response
+    user = self._authenticated_user(request)
+    try:
+      if user is not None:
+        await get_activity_tracker().atouch(user, APIRequestInfo.GetIPClient(request))
+    except Exception as e:
+      logger.warning(f"[Middleware] No se pudo actualizar la informacion default del usuario: {e}")
+    return self._finalize(response)
+
+  def _activate_language(self, request, user):
+    if user is not None:
+      language = getattr(user, 'language', None) or translation.get_language()
+    elif is_api_request(request):
+      language = translation.get_language_from_request(request)
+    else:
+      # Fuera de la API el idioma ya lo activo LocaleMiddleware
+      return
+    translation.activate(language)
+    request.LANGUAGE_CODE = language
+
+  def _authenticated_user(self, request):
+    # DRF asigna el usuario (JWT) al ejecutar la vista: aqui ya es el usuario autenticado
+    user = getattr(request, 'user', None)
+    return user if user is not None and user.is_authenticated else None
+
+  def _finalize(self, response):
+    response.headers.setdefault('Content-Language', translation.get_language())
+    patch_vary_headers(response, ('Accept-Language',))
+    return response
 
-class ThreadLocalUserMiddleware:
+def get_current_user():
   """
-  Middleware que almacena el usuario autenticado en una variable thread-local accesible globalmente
-  durante el ciclo de vida de la request. Limpia el valor después de procesar la request.
+  Devuelve el usuario autenticado del request en curso, o None si no hay usuario.
+  Se evalua al llamarse, por lo que incluye al usuario autenticado por DRF (JWT).
   """
 
-  def __init__(self, get_response):
-    self.get_response = get_response
-  
-  def __call__(self, request):
-    # Almacena el usuario autenticado en el thread-local
-    _user_request_local.current_user = request.user if request.user.is_authenticated else None
-    try:
-      response = self.get_response(request)
-    finally:
-      # Limpia el thread-local para evitar fugas de memoria en servidores multihilo
-      _user_request_local.current_user = None
-    return response
\ No newline at end of file
+  request = _current_request.get()
+  user = getattr(request, 'user', None)
+  return user if user is not None and user.is_authenticated else None
@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-18 16:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    0001_initial sin constraint en la FK del usuario. Una base de auditoria separada
+    (ACCESS_LOG['DATABASE']) no tiene accounts_user: en PostgreSQL la FK de 0001 haria fallar
+    `migrate --database audit`. Las bases que ya aplicaron 0001 lo conservan y quitan la
+    constraint en 0016.
+    """
+
+    replaces = [('core', '0001_initial')]
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(max_length=10)),
+                ('path', models.TextField()),
+                ('action', models.TextField()),
+                ('status_code', models.PositiveIntegerField(blank=True, null=True)),
+                ('message', models.TextField(blank=True, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, null=True)),
+                ('object_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('object_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='access_logs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Registro de acceso',
+                'verbose_name_plural': 'Registros de acceso',
+                'db_table': 'core_access_log',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user'], name='core_access_user_id_51ae0c_idx'), models.Index(fields=['created_at'], name='core_access_created_76e34d_idx'), models.Index(fields=['action'], name='core_access_action_ccef75_idx'), models.Index(fields=['method', 'path'], name='core_access_method_028a30_idx')],
+            },
+        ),
+    ]
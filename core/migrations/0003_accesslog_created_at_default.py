@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 13:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_accesslog_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accesslog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,92 @@
+import re
+
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+from core.audit.partitions import (
+  PARENT_TABLE, add_months, month_start, is_partitioned,
+  create_partition, create_default_partition,
+)
+
+OLD_TABLE = f'{PARENT_TABLE}_old'
+NEW_SEQUENCE = f'{PARENT_TABLE}_id_seq_new'
+
+
+def partition_access_log(apps, schema_editor):
+    """
+    Convierte core_access_log en una tabla particionada por rango mensual de created_at.
+    Solo aplica en PostgreSQL; en otros motores la tabla queda igual.
+
+    PostgreSQL exige que la llave primaria incluya la columna de particion, por lo que
+    la PK en base de datos pasa a ser (id, created_at). `id` sigue siendo unico porque
+    proviene de una secuencia.
+    """
+
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql' or is_partitioned(connection):
+        return
+
+    months_ahead = getattr(settings, 'ACCESS_LOG', {}).get('PARTITION_MONTHS_AHEAD', 3)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME TO {OLD_TABLE}')
+        cursor.execute(f'ALTER TABLE {OLD_TABLE} RENAME CONSTRAINT {PARENT_TABLE}_pkey TO {OLD_TABLE}_pkey')
+
+        # Indices y llaves foraneas a recrear sobre la tabla padre
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s",
+            [OLD_TABLE, f'{OLD_TABLE}_pkey']
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+            [OLD_TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(f'CREATE SEQUENCE {NEW_SEQUENCE}')
+        cursor.execute(
+            f'CREATE TABLE {PARENT_TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        cursor.execute(f"ALTER TABLE {PARENT_TABLE} ALTER COLUMN id SET DEFAULT nextval('{NEW_SEQUENCE}')")
+        cursor.execute(f'ALTER SEQUENCE {NEW_SEQUENCE} OWNED BY {PARENT_TABLE}.id')
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {PARENT_TABLE}_pkey PRIMARY KEY (id, created_at)')
+
+        cursor.execute(f'SELECT MIN(created_at) FROM {OLD_TABLE}')
+        oldest = cursor.fetchone()[0]
+
+    # Particiones desde el registro mas antiguo hasta `months_ahead` meses adelante
+    current = month_start(timezone.now().date())
+    start = month_start(oldest.date()) if oldest else current
+    while start <= add_months(current, months_ahead):
+        create_partition(connection, start)
+        start = add_months(start, 1)
+    create_default_partition(connection)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {PARENT_TABLE} SELECT * FROM {OLD_TABLE}')
+        cursor.execute(
+            f"SELECT setval('{NEW_SEQUENCE}', COALESCE((SELECT MAX(id) FROM {PARENT_TABLE}), 0) + 1, false)"
+        )
+        cursor.execute(f'DROP TABLE {OLD_TABLE}')
+        cursor.execute(f'ALTER SEQUENCE {NEW_SEQUENCE} RENAME TO {PARENT_TABLE}_id_seq')
+
+        for name, definition in indexes:
+            definition = re.sub(rf'ON (ONLY )?(\S+\.)?{OLD_TABLE} ', f'ON {PARENT_TABLE} ', definition)
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {name} {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_accesslog_created_at_default'),
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_access_log, migrations.RunPython.noop, hints={'model_name': 'accesslog'}),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 13:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_partition_access_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='accesslog',
+            name='core_access_created_76e34d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='accesslog',
+            index=models.Index(fields=['created_at', 'id'], name='core_access_created_91e42f_idx'),
+        ),
+    ]
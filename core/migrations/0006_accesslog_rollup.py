@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 13:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_accesslog_keyset_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessLogRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('action', models.TextField()),
+                ('method', models.CharField(max_length=10)),
+                ('status_class', models.CharField(max_length=3)),
+                ('count', models.PositiveBigIntegerField(default=0)),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'access log rollup',
+                'verbose_name_plural': 'access log rollups',
+                'db_table': 'core_access_log_rollup',
+                'indexes': [models.Index(fields=['bucket', 'action', 'method', 'status_class', 'user'], name='core_access_bucket_1070bc_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,169 @@
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# (columna de AccessLog, tabla de diccionario, modelo de diccionario)
+DICTIONARY_COLUMNS = (
+    ('action', 'core_access_log_action', 'AccessLogAction'),
+    ('path', 'core_access_log_path', 'AccessLogPath'),
+    ('user_agent', 'core_access_log_user_agent', 'AccessLogUserAgent'),
+)
+
+
+def _exclude_empty(column):
+    # Un user agent vacio se guarda como NULL; accion y ruta siempre se internan
+    return column == 'user_agent'
+
+
+def intern_existing_values(apps, schema_editor):
+    """
+    Copia los valores de texto existentes a las tablas de diccionario y asigna
+    la referencia entera en cada log.
+    """
+
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            for column, table, _ in DICTIONARY_COLUMNS:
+                empty = f" AND {column} <> ''" if _exclude_empty(column) else ''
+                cursor.execute(
+                    f"INSERT INTO {table} (value, digest) "
+                    f"SELECT v, encode(sha256(convert_to(v, 'UTF8')), 'hex') "
+                    f"FROM (SELECT DISTINCT {column} AS v FROM core_access_log WHERE {column} IS NOT NULL{empty}) s "
+                    f"ON CONFLICT (digest) DO NOTHING"
+                )
+                cursor.execute(
+                    f"UPDATE core_access_log l SET {column}_ref_id = d.id "
+                    f"FROM {table} d WHERE d.value = l.{column}"
+                )
+        return
+
+    AccessLog = apps.get_model('core', 'AccessLog')
+    for column, _, model_name in DICTIONARY_COLUMNS:
+        Dictionary = apps.get_model('core', model_name)
+        values = AccessLog.objects.filter(**{f'{column}__isnull': False}).values_list(column, flat=True).distinct()
+        for value in list(values):
+            if value == '' and _exclude_empty(column):
+                continue
+            digest = hashlib.sha256(value.encode('utf-8')).hexdigest()
+            entry, _ = Dictionary.objects.get_or_create(digest=digest, defaults={'value': value})
+            AccessLog.objects.filter(**{column: value}).update(**{f'{column}_ref': entry})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_accesslog_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessLogAction',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('digest', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'verbose_name': 'access log action',
+                'verbose_name_plural': 'access log actions',
+                'db_table': 'core_access_log_action',
+            },
+        ),
+        migrations.CreateModel(
+            name='AccessLogPath',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('digest', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'verbose_name': 'access log path',
+                'verbose_name_plural': 'access log paths',
+                'db_table': 'core_access_log_path',
+            },
+        ),
+        migrations.CreateModel(
+            name='AccessLogUserAgent',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('digest', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'verbose_name': 'access log user agent',
+                'verbose_name_plural': 'access log user agents',
+                'db_table': 'core_access_log_user_agent',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='accesslog',
+            name='core_access_action_ccef75_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='accesslog',
+            name='core_access_method_028a30_idx',
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='action_ref',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accesslogaction'),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='path_ref',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accesslogpath'),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='user_agent_ref',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accessloguseragent'),
+        ),
+        migrations.RunPython(intern_existing_values, migrations.RunPython.noop, hints={'model_name': 'accesslog'}),
+        migrations.RemoveField(
+            model_name='accesslog',
+            name='action',
+        ),
+        migrations.RemoveField(
+            model_name='accesslog',
+            name='path',
+        ),
+        migrations.RemoveField(
+            model_name='accesslog',
+            name='user_agent',
+        ),
+        migrations.RenameField(
+            model_name='accesslog',
+            old_name='action_ref',
+            new_name='action',
+        ),
+        migrations.RenameField(
+            model_name='accesslog',
+            old_name='path_ref',
+            new_name='path',
+        ),
+        migrations.RenameField(
+            model_name='accesslog',
+            old_name='user_agent_ref',
+            new_name='user_agent',
+        ),
+        migrations.AlterField(
+            model_name='accesslog',
+            name='action',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accesslogaction'),
+        ),
+        migrations.AlterField(
+            model_name='accesslog',
+            name='path',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accesslogpath'),
+        ),
+        migrations.AddIndex(
+            model_name='accesslog',
+            index=models.Index(fields=['action'], name='core_access_action__adec3b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accesslog',
+            index=models.Index(fields=['method', 'path'], name='core_access_method_f28d72_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_accesslog_dictionary_encoding'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accesslog',
+            name='sample_weight',
+            field=models.FloatField(default=1.0),
+        ),
+        migrations.AddField(
+            model_name='accesslogrollup',
+            name='weighted_count',
+            field=models.FloatField(default=0),
+        ),
+        # Los agregados existentes provienen de registros sin muestreo (peso 1)
+        migrations.RunSQL(
+            'UPDATE core_access_log_rollup SET weighted_count = count',
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 14:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_accesslog_sample_weight'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessLogSpoolOffset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('segment', models.CharField(max_length=255, unique=True)),
+                ('offset', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'access log spool offset',
+                'verbose_name_plural': 'access log spool offsets',
+                'db_table': 'core_access_log_spool_offset',
+            },
+        ),
+    ]
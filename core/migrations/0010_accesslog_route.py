@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-18 14:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_accesslog_spool_offset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessLogRoute',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('digest', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'verbose_name': 'access log route',
+                'verbose_name_plural': 'access log routes',
+                'db_table': 'core_access_log_route',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='accesslog',
+            name='core_access_method_f28d72_idx',
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='query_string',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='view_name',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='route',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.accesslogroute'),
+        ),
+        migrations.AddIndex(
+            model_name='accesslog',
+            index=models.Index(fields=['method', 'route'], name='core_access_method_c50bba_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 14:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_accesslog_route'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accesslog',
+            index=models.Index(fields=['object_type', 'object_id', 'created_at', 'id'], name='core_access_object__f133b9_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_accesslog_object_timeline_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accesslog',
+            name='count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='first_seen',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='accesslog',
+            name='last_seen',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
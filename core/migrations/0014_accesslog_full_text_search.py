@@ -0,0 +1,32 @@
+from django.db import migrations
+
+from core.audit.search import install_search, uninstall_search
+
+
+def install(apps, schema_editor):
+    install_search(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_search(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    """
+    Indice de texto completo sobre accion y mensaje: columna tsvector con indice GIN y
+    trigger BEFORE INSERT en PostgreSQL; tabla FTS5 con triggers en SQLite. La columna
+    no forma parte del modelo (ver core.audit.search).
+
+    No atomica: los registros existentes se indexan en lotes, cada uno en su propia
+    transaccion (core.audit.search.backfill_search).
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0013_access_log_user_without_constraint'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall, hints={'model_name': 'accesslog'}),
+    ]
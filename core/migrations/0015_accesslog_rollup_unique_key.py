@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 15:03
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_rollups(apps, schema_editor):
+    # Escritores concurrentes pudieron crear la misma llave dos veces antes de la constraint
+    AccessLogRollup = apps.get_model('core', 'AccessLogRollup')
+    rollups = AccessLogRollup.objects.using(schema_editor.connection.alias)
+    key = ('bucket', 'action', 'method', 'status_class', 'user')
+    duplicates = (
+        rollups.filter(user__isnull=False).values(*key)
+        .annotate(rows=Count('id'), keep=Min('id'), total=Sum('count'), weighted=Sum('weighted_count'))
+        .filter(rows__gt=1).order_by()
+    )
+    for row in duplicates:
+        same_key = rollups.filter(**{field: row[field] for field in key})
+        same_key.filter(id=row['keep']).update(count=row['total'], weighted_count=row['weighted'])
+        same_key.exclude(id=row['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_accesslog_full_text_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_rollups, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='accesslogrollup',
+            constraint=models.UniqueConstraint(fields=('bucket', 'action', 'method', 'status_class', 'user'), name='core_access_log_rollup_key'),
+        ),
+        migrations.RemoveIndex(
+            model_name='accesslogrollup',
+            name='core_access_bucket_1070bc_idx',
+        ),
+    ]
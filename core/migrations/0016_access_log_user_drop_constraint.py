@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-18 16:20
+
+import core.audit.routers
+from django.conf import settings
+from django.db import migrations, models
+
+
+def drop_user_foreign_keys(apps, schema_editor):
+    # Bases que aplicaron 0001/0006 con la FK y no la perdieron en 0013 (cualquier motor)
+    connection = schema_editor.connection
+    user_table = apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table
+    for model_name in ('accesslog', 'accesslogrollup'):
+        model = apps.get_model('core', model_name)
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        names = [
+            name for name, constraint in constraints.items()
+            if constraint['foreign_key'] and constraint['foreign_key'][0] == user_table
+        ]
+        if not names:
+            continue
+        if connection.vendor == 'sqlite':
+            # SQLite no elimina constraints: se reconstruye la tabla con el estado actual (sin FK)
+            schema_editor._remake_table(model)
+        else:
+            for name in names:
+                schema_editor.execute(schema_editor._delete_fk_sql(model, name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_accesslog_rollup_unique_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accesslog',
+            name='user',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=core.audit.routers.SET_NULL_AUDIT, related_name='access_logs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='accesslogrollup',
+            name='user',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=core.audit.routers.SET_NULL_AUDIT, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(drop_user_foreign_keys, migrations.RunPython.noop),
+    ]
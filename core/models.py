@@ -1,24 +1,100 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.audit.routers import SET_NULL_AUDIT
+
+class AccessLogValue(models.Model):
+  """
+  Base de las tablas de diccionario de AccessLog. Cada valor de texto repetido
+  (accion, ruta, user agent) se guarda una sola vez y los logs lo referencian
+  con una llave entera pequeña. `digest` (sha256 del valor) es la llave unica,
+  ya que un indice unico sobre el texto completo no es viable para valores largos.
+  """
+
+  id = models.AutoField(primary_key=True)
+  value = models.TextField()
+  digest = models.CharField(max_length=64, unique=True)
+
+  class Meta:
+    abstract = True
+
+  def __str__(self):
+    return self.value
+
+class AccessLogAction(AccessLogValue):
+  class Meta:
+    verbose_name = _("access log action")
+    verbose_name_plural = _("access log actions")
+    db_table = 'core_access_log_action'
+
+class AccessLogPath(AccessLogValue):
+  class Meta:
+    verbose_name = _("access log path")
+    verbose_name_plural = _("access log paths")
+    db_table = 'core_access_log_path'
+
+class AccessLogRoute(AccessLogValue):
+  class Meta:
+    verbose_name = _("access log route")
+    verbose_name_plural = _("access log routes")
+    db_table = 'core_access_log_route'
+
+class AccessLogUserAgent(AccessLogValue):
+  class Meta:
+    verbose_name = _("access log user agent")
+    verbose_name_plural = _("access log user agents")
+    db_table = 'core_access_log_user_agent'
+
+class AccessLogManager(models.Manager):
+  def create_entry(self, **entry):
+    """
+    Crea un registro recibiendo accion, ruta y user agent como texto.
+    Para escrituras desde requests usar core.audit.sinks (en lote).
+    """
+
+    from core.audit.sinks import build_access_logs
+
+    log = build_access_logs([entry], using=self.db)[0]
+    log.save(using=self.db)
+    return log
+
 class AccessLog(models.Model):
   """
   Modelo para registrar logs de acceso y acciones de usuarios en el sistema.
   Guarda información relevante para auditoría y seguridad.
+
+  `path`, `route`, `action` y `user_agent` referencian tablas de diccionario; el escritor
+  resuelve los ids con una cache LRU en proceso (ver core.audit.interning).
   """
 
-  user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='access_logs')
+  # El usuario puede vivir en otra base de datos (ver core.audit.routers): sin constraint; al
+  # eliminarlo Django pone user = NULL en la base de auditoria
+  user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=SET_NULL_AUDIT, db_constraint=False, null=True, blank=True, related_name='access_logs')
   method = models.CharField(max_length=10)
-  path = models.TextField()
-  action = models.TextField()
+  # Ruta solicitada sin query string; `route` es el patron de URL resuelto (ej. /api/accounts/users/users/<pk>/)
+  path = models.ForeignKey(AccessLogPath, on_delete=models.PROTECT, related_name='+', db_index=False)
+  route = models.ForeignKey(AccessLogRoute, on_delete=models.PROTECT, related_name='+', null=True, blank=True, db_index=False)
+  view_name = models.CharField(max_length=100, null=True, blank=True)
+  query_string = models.TextField(null=True, blank=True)
+  action = models.ForeignKey(AccessLogAction, on_delete=models.PROTECT, related_name='+', db_index=False)
   status_code = models.PositiveIntegerField(null=True, blank=True)
   message = models.TextField(null=True, blank=True)
   ip_address = models.GenericIPAddressField(null=True, blank=True)
-  user_agent = models.TextField(blank=True, null=True)
+  user_agent = models.ForeignKey(AccessLogUserAgent, on_delete=models.PROTECT, related_name='+', null=True, blank=True, db_index=False)
   object_id = models.PositiveIntegerField(null=True, blank=True)
   object_type = models.CharField(max_length=50, null=True, blank=True)
-  created_at = models.DateTimeField(auto_now_add=True)
+  # Peticiones que representa el registro cuando la vista se muestrea (1 / tasa)
+  sample_weight = models.FloatField(default=1.0)
+  # Compactacion: eventos identicos agrupados en el registro y su primera/ultima ocurrencia
+  count = models.PositiveIntegerField(default=1)
+  first_seen = models.DateTimeField(null=True, blank=True)
+  last_seen = models.DateTimeField(null=True, blank=True)
+  # Se asigna en el request (no al insertar) porque la escritura se hace en lote
+  created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+  objects = AccessLogManager()
 
   class Meta:
     verbose_name = _("access log")
@@ -30,10 +106,65 @@ class AccessLog(models.Model):
     db_table = 'core_access_log'
     indexes = [
       models.Index(fields=['user']),
-      models.Index(fields=['created_at']),
+      # Llave de la paginacion keyset (created_at, id); tambien sirve a los filtros por fecha
+      models.Index(fields=['created_at', 'id']),
       models.Index(fields=['action']),
-      models.Index(fields=['method', 'path']),
+      # Agregacion por endpoint; la ruta cruda (valores sin limite) no se indexa
+      models.Index(fields=['method', 'route']),
+      # Historial por objeto: igualdad en (object_type, object_id) y rango keyset en (created_at, id)
+      models.Index(fields=['object_type', 'object_id', 'created_at', 'id']),
     ]
     
   def __str__(self):
-    return f"{self.user} - {self.method} {self.path} ({self.status_code})"
\ No newline at end of file
+    return f"{self.user} - {self.method} {self.path} ({self.status_code})"
+
+class AccessLogSpoolOffset(models.Model):
+  """
+  Avance del cargador del spool local (ver core.audit.spool): bytes de cada segmento
+  ya insertados en core_access_log. Se actualiza en la misma transaccion que el insert.
+  """
+
+  segment = models.CharField(max_length=255, unique=True)
+  offset = models.PositiveBigIntegerField(default=0)
+  updated_at = models.DateTimeField(auto_now=True)
+
+  class Meta:
+    verbose_name = _("access log spool offset")
+    verbose_name_plural = _("access log spool offsets")
+    db_table = 'core_access_log_spool_offset'
+
+  def __str__(self):
+    return f"{self.segment} ({self.offset})"
+
+class AccessLogRollup(models.Model):
+  """
+  Agregado por hora de AccessLog (hora × accion × metodo × clase de estatus × usuario).
+  Se mantiene de forma incremental al escribir los logs (ver core.audit.rollups) y
+  permite responder estadisticas sin recorrer core_access_log.
+
+  La accion se guarda sin la parte dinamica (ej. "Viewed user details." sin el email).
+  `count` son los eventos registrados (un registro compactado aporta todos sus eventos) y
+  `weighted_count` las peticiones estimadas, considerando el muestreo (suma de sample_weight).
+  """
+
+  bucket = models.DateTimeField()
+  action = models.TextField()
+  method = models.CharField(max_length=10)
+  status_class = models.CharField(max_length=3)
+  user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=SET_NULL_AUDIT, db_constraint=False, null=True, blank=True, related_name='+')
+  count = models.PositiveBigIntegerField(default=0)
+  # Suma de sample_weight: peticiones estimadas considerando el muestreo
+  weighted_count = models.FloatField(default=0)
+
+  class Meta:
+    verbose_name = _("access log rollup")
+    verbose_name_plural = _("access log rollups")
+    db_table = 'core_access_log_rollup'
+    # Llave del agregado; los escritores concurrentes hacen upsert contra ella (ver
+    # core.audit.rollups). Las filas sin usuario no son unicas (NULL es distinto en el indice)
+    constraints = [
+      models.UniqueConstraint(fields=['bucket', 'action', 'method', 'status_class', 'user'], name='core_access_log_rollup_key'),
+    ]
+
+  def __str__(self):
+    return f"{self.bucket:%Y-%m-%d %H:00} {self.method} {self.action} {self.status_class} ({self.count})"
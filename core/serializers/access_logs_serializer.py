@@ -0,0 +1,59 @@
+from rest_framework import serializers
+
+from core.models import AccessLog
+from core.base.messages import get_message
+
+class AccessLogSerializer(serializers.ModelSerializer):
+  """
+  Serializador de solo lectura para los logs de acceso.
+  """
+
+  user_email = serializers.EmailField(source='user.email', read_only=True, default=None)
+  path = serializers.CharField(source='path.value', read_only=True)
+  route = serializers.CharField(source='route.value', read_only=True, default=None)
+  action = serializers.CharField(source='action.value', read_only=True)
+  user_agent = serializers.CharField(source='user_agent.value', read_only=True, default=None)
+
+  class Meta:
+    model = AccessLog
+    fields = [
+      'id', 'created_at',
+      'user', 'user_email',
+      'method', 'path', 'query_string', 'route', 'view_name', 'action',
+      'status_code', 'message',
+      'ip_address', 'user_agent',
+      'object_type', 'object_id',
+      'sample_weight', 'count', 'first_seen', 'last_seen',
+    ]
+    read_only_fields = fields
+
+class AccessLogStatsQuerySerializer(serializers.Serializer):
+  """
+  Parametros de consulta de las estadisticas de logs de acceso.
+  """
+
+  GROUP_BY_CHOICES = ('hour', 'action', 'method', 'status', 'user')
+
+  date_from = serializers.DateTimeField()
+  date_to = serializers.DateTimeField(required=False)
+  group_by = serializers.ChoiceField(choices=GROUP_BY_CHOICES, default='action')
+  limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+  def validate(self, attrs):
+    date_to = attrs.get('date_to')
+    if date_to and date_to <= attrs['date_from']:
+      raise serializers.ValidationError(
+        {"date_to": [get_message("errors", "log_stats_invalid_range")]}
+      )
+    return attrs
+
+class AccessLogStatsRowSerializer(serializers.Serializer):
+  key = serializers.CharField(allow_null=True)
+  requests = serializers.IntegerField()
+  errors = serializers.IntegerField()
+  error_rate = serializers.FloatField()
+
+class AccessLogStatsSerializer(serializers.Serializer):
+  group_by = serializers.CharField()
+  totals = AccessLogStatsRowSerializer()
+  results = AccessLogStatsRowSerializer(many=True)
@@ -0,0 +1,126 @@
+import gzip
+import json
+import pytest
+from io import StringIO
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.models import AccessLog
+from core.audit.archive import archivable_days, archive_day, iter_segment, read_meta, read_segment, search_archive, segment_paths
+
+DAY = datetime(2025, 1, 10, tzinfo=dt_timezone.utc)
+
+@pytest.fixture
+def archive_root(settings, tmp_path):
+    settings.ACCESS_LOG = {**settings.ACCESS_LOG, "ARCHIVE_DIR": str(tmp_path)}
+    return tmp_path
+
+def make_log(created_at, action="Viewed user list.", user=None):
+    return AccessLog.objects.create_entry(
+        user=user,
+        method="GET",
+        path="/api/accounts/users/users/",
+        action=action,
+        status_code=200,
+        user_agent="pytest",
+        created_at=created_at,
+    )
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestArchiveAccessLogs:
+    def test_command_moves_old_days_to_segments(self, archive_root):
+        old = [make_log(DAY + timedelta(hours=1)), make_log(DAY + timedelta(hours=2)), make_log(DAY + timedelta(days=1))]
+        recent = make_log(timezone.now())
+
+        out = StringIO()
+        call_command("archive_access_logs", "--older-than-days", "30", stdout=out)
+        assert "Registros archivados: 3 en 2 segmentos" in out.getvalue()
+        assert list(AccessLog.objects.values_list("id", flat=True)) == [recent.id]
+
+        data_path, meta_path = segment_paths(DAY.date(), archive_root)
+        assert data_path.exists()
+        meta = read_meta(meta_path)
+        assert meta["rows"] == 2
+        assert (meta["min_id"], meta["max_id"]) == (old[0].id, old[1].id)
+        assert meta["actions"] == ["Viewed user list."]
+
+    def test_late_rows_are_merged_into_existing_segment(self, archive_root):
+        make_log(DAY + timedelta(hours=1))
+        archive_day(DAY.date(), batch_size=100)
+        make_log(DAY + timedelta(hours=5))
+        assert archive_day(DAY.date(), batch_size=100) == 1
+        assert read_meta(segment_paths(DAY.date(), archive_root)[1])["rows"] == 2
+
+    def test_segment_is_written_in_batches(self, archive_root):
+        logs = [make_log(DAY + timedelta(minutes=i)) for i in range(5)]
+        assert archive_day(DAY.date(), batch_size=2) == 5
+        assert AccessLog.objects.count() == 0
+
+        data_path, meta_path = segment_paths(DAY.date(), archive_root)
+        assert [len(block["id"]) for block in iter_segment(data_path)] == [2, 2, 1]
+        assert read_segment(data_path)["id"] == [log.id for log in logs]
+        assert read_meta(meta_path)["rows"] == 5
+
+    def test_reads_single_block_segments(self, archive_root):
+        data_path, _ = segment_paths(DAY.date(), archive_root)
+        data_path.parent.mkdir(parents=True)
+        payload = {"version": 1, "day": "2025-01-10", "columns": {"id": [10**9], "created_at": [DAY.isoformat()], "user_id": [None], "action": ["Viewed user list."]}}
+        data_path.write_bytes(gzip.compress(json.dumps(payload).encode()))
+        make_log(DAY + timedelta(hours=3))
+        assert archive_day(DAY.date(), batch_size=100) == 1
+        columns = read_segment(data_path)
+        assert len(columns["id"]) == 2
+        assert columns["message"][0] is None
+
+    def test_archivable_days(self):
+        make_log(DAY + timedelta(hours=23))
+        make_log(DAY + timedelta(days=2))
+        make_log(DAY + timedelta(days=2, hours=1))
+        make_log(DAY + timedelta(days=5))
+        assert archivable_days((DAY + timedelta(days=5)).date()) == [DAY.date(), (DAY + timedelta(days=2)).date()]
+
+    def test_search_without_restoring(self, archive_root, django_user_model):
+        user = django_user_model.objects.create_user(email="archived@test.com", password="Archived123!")
+        make_log(DAY + timedelta(hours=1), user=user)
+        make_log(DAY + timedelta(hours=2), action="User logged in.", user=user)
+        make_log(DAY + timedelta(days=3), action="User logged in.")
+        call_command("archive_access_logs", "--older-than-days", "1", stdout=StringIO())
+        assert AccessLog.objects.count() == 0
+
+        rows = list(search_archive(user_id=user.id, action="logged in"))
+        assert [(r["user_id"], r["action"]) for r in rows] == [(user.id, "User logged in.")]
+
+        rows = list(search_archive(date_from=DAY + timedelta(days=1)))
+        assert len(rows) == 1
+
+        out = StringIO()
+        call_command("search_access_log_archive", "--action", "logged", "--limit", "1", stdout=out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["created_at"] for line in lines] == [(DAY + timedelta(hours=2)).isoformat()]
+
+    def test_search_command_accepts_naive_dates(self, archive_root):
+        make_log(DAY + timedelta(hours=1))
+        make_log(DAY + timedelta(hours=3))
+        archive_day(DAY.date(), batch_size=100)
+
+        out = StringIO()
+        call_command("search_access_log_archive", "--date-from", "2025-01-10T02:00:00", stdout=out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["created_at"] for line in lines] == [(DAY + timedelta(hours=3)).isoformat()]
+
+    def test_zero_days_is_not_treated_as_unset(self, archive_root, settings):
+        settings.ACCESS_LOG = {**settings.ACCESS_LOG, "ARCHIVE_AFTER_DAYS": 90}
+        make_log(timezone.now() - timedelta(days=2))
+        out = StringIO()
+        call_command("archive_access_logs", "--older-than-days", "0", "--dry-run", stdout=out)
+        assert (timezone.now() - timedelta(days=2)).strftime("%Y-%m-%d") in out.getvalue()
+
+    def test_dry_run_keeps_rows(self, archive_root):
+        make_log(DAY)
+        out = StringIO()
+        call_command("archive_access_logs", "--dry-run", stdout=out)
+        assert "2025-01-10" in out.getvalue()
+        assert AccessLog.objects.count() == 1
+        assert not list(archive_root.iterdir())
@@ -0,0 +1,132 @@
+import pytest
+from datetime import timedelta
+
+from django.db import connections, router
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from core.models import AccessLog
+from core.audit.sinks import BufferedLogSink
+
+User = get_user_model()
+
+def make_entry(**overrides):
+    entry = {
+        "user_id": None,
+        "method": "GET",
+        "path": "/api/accounts/users/users/",
+        "action": "Viewed user list.",
+        "status_code": 200,
+        "message": "User list.",
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest",
+        "object_id": None,
+        "object_type": None,
+        "created_at": timezone.now(),
+    }
+    entry.update(overrides)
+    return entry
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestBufferedLogSink:
+    def test_put_does_not_write_until_flush(self):
+        sink = BufferedLogSink(batch_size=10, flush_interval=60, autostart=False)
+        sink.put(make_entry())
+        sink.put(make_entry())
+        assert AccessLog.objects.count() == 0
+        assert sink.stats()["pending"] == 2
+
+        assert sink.flush() == 2
+        assert AccessLog.objects.count() == 2
+        assert sink.stats() == {"queued": 2, "pending": 0, "compacting": 0, "compacted": 0, "flushed": 2, "dropped": 0}
+
+    def test_flush_writes_in_batches(self):
+        sink = BufferedLogSink(batch_size=3, flush_interval=60, autostart=False)
+        for _ in range(7):
+            sink.put(make_entry())
+        # 3 lotes: 3 + 3 + 1
+        with CaptureQueriesContext(connections[router.db_for_write(AccessLog)]) as ctx:
+            assert sink.flush() == 7
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "core_access_log"')]
+        assert len(inserts) == 3
+        assert AccessLog.objects.count() == 7
+
+    def test_drops_when_queue_is_full(self):
+        sink = BufferedLogSink(batch_size=10, flush_interval=60, max_queue_size=2, autostart=False)
+        assert sink.put(make_entry())
+        assert sink.put(make_entry())
+        assert not sink.put(make_entry())
+        stats = sink.stats()
+        assert stats["queued"] == 2
+        assert stats["dropped"] == 1
+
+    def test_keeps_request_timestamp_and_user(self):
+        user = User.objects.create_user(email="buffer@test.com", password="BufferPass123!")
+        created_at = timezone.now() - timedelta(minutes=5)
+        sink = BufferedLogSink(batch_size=10, flush_interval=60, autostart=False)
+        sink.put(make_entry(user_id=user.id, created_at=created_at))
+        sink.stop()
+        log = AccessLog.objects.get()
+        assert log.user == user
+        assert log.created_at == created_at
+
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestCompaction:
+    def make_sink(self, **kwargs):
+        return BufferedLogSink(batch_size=100, flush_interval=60, autostart=False, compaction_window=60, **kwargs)
+
+    def test_identical_reads_collapse_into_one_row(self):
+        sink = self.make_sink()
+        start = timezone.now()
+        for seconds in range(5):
+            sink.put(make_entry(created_at=start + timedelta(seconds=seconds)))
+        # Escrituras y errores no se compactan
+        sink.put(make_entry(method="POST", action="Created user.", created_at=start))
+        sink.put(make_entry(method="POST", action="Created user.", created_at=start))
+        sink.put(make_entry(status_code=403, created_at=start))
+        sink.put(make_entry(status_code=403, created_at=start))
+
+        assert sink.flush() == 4
+        assert sink.stats()["compacting"] == 1
+        sink.stop()
+
+        compacted = AccessLog.objects.get(action__value="Viewed user list.", status_code=200)
+        assert compacted.count == 5
+        assert (compacted.first_seen, compacted.last_seen) == (start, start + timedelta(seconds=4))
+        assert AccessLog.objects.filter(count=1).count() == 4
+        assert sink.stats()["compacted"] == 4
+
+    def test_expired_window_is_released_on_flush(self):
+        sink = self.make_sink()
+        old = timezone.now() - timedelta(minutes=5)
+        sink.put(make_entry(created_at=old))
+        sink.put(make_entry(created_at=old + timedelta(seconds=1)))
+        sink.put(make_entry(user_id=None, action="Viewed role list.", created_at=timezone.now()))
+        assert sink.flush() == 1
+        assert AccessLog.objects.get().count == 2
+
+    def test_key_limit_releases_oldest_group(self):
+        sink = self.make_sink(compaction_max_keys=1)
+        sink.put(make_entry())
+        sink.put(make_entry(action="Viewed role list."))
+        assert sink.stats()["pending"] == 1
+
+    def test_evicted_group_respects_queue_limit(self):
+        sink = self.make_sink(compaction_max_keys=1, max_queue_size=1)
+        sink.put(make_entry(action="Viewed user list."))
+        sink.put(make_entry(action="Viewed role list."))
+        sink.put(make_entry(action="Viewed group list."))
+        stats = sink.stats()
+        assert (stats["pending"], stats["compacting"], stats["dropped"]) == (1, 1, 1)
+
+    def test_dropped_group_counts_all_its_events(self):
+        sink = self.make_sink(compaction_max_keys=1, max_queue_size=1)
+        sink.put(make_entry(action="Viewed role list."))
+        for _ in range(3):
+            sink.put(make_entry(action="Viewed user list."))
+        # Al abrir el tercer grupo la cola esta llena: se descarta el grupo de 3 eventos
+        sink.put(make_entry(action="Viewed group list."))
+        stats = sink.stats()
+        assert (stats["pending"], stats["compacting"], stats["dropped"]) == (1, 1, 3)
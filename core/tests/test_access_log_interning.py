@@ -0,0 +1,74 @@
+import pytest
+
+from django.db import connections, router
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import AccessLog, AccessLogAction, AccessLogPath, AccessLogUserAgent
+from core.audit.interning import InternCache, clear_intern_caches, resolve_many, value_digest
+from core.audit.sinks import write_access_logs
+
+def make_entry(**overrides):
+    entry = {
+        "user_id": None,
+        "method": "GET",
+        "path": "/api/accounts/users/users/",
+        "action": "Viewed user list.",
+        "status_code": 200,
+        "message": "User list.",
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest",
+        "object_id": None,
+        "object_type": None,
+        "created_at": timezone.now(),
+    }
+    entry.update(overrides)
+    return entry
+
+@pytest.fixture(autouse=True)
+def clean_intern_caches():
+    # La cache es del proceso y los tests hacen rollback: no debe sobrevivir entre tests
+    clear_intern_caches()
+    yield
+    clear_intern_caches()
+
+class TestInternCache:
+    def test_evicts_least_recently_used(self):
+        cache = InternCache(max_size=2)
+        cache.update({"a": 1, "b": 2})
+        assert cache.get("a") == 1
+        cache.update({"c": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestDictionaryEncoding:
+    def test_repeated_values_are_stored_once(self):
+        write_access_logs([make_entry() for _ in range(3)] + [make_entry(path="/api/auth/login/", user_agent="")])
+        assert AccessLog.objects.count() == 4
+        assert AccessLogAction.objects.count() == 1
+        assert AccessLogPath.objects.count() == 2
+        assert AccessLogUserAgent.objects.get().digest == value_digest("pytest")
+        assert AccessLog.objects.filter(user_agent__isnull=True).count() == 1
+
+    def test_existing_values_are_reused(self):
+        write_access_logs([make_entry()])
+        action_id = AccessLog.objects.get().action_id
+        write_access_logs([make_entry()])
+        assert set(AccessLog.objects.values_list("action_id", flat=True)) == {action_id}
+
+    def test_cache_is_filled_on_commit(self, django_capture_on_commit_callbacks):
+        using = router.db_for_write(AccessLogAction)
+        with django_capture_on_commit_callbacks(using=using, execute=True):
+            ids = resolve_many(AccessLogAction, {"User logged in."}, using=using)
+        with CaptureQueriesContext(connections[using]) as ctx:
+            assert resolve_many(AccessLogAction, {"User logged in."}, using=using) == ids
+        assert len(ctx.captured_queries) == 0
+
+    def test_cache_is_not_filled_without_commit(self):
+        using = router.db_for_write(AccessLogAction)
+        resolve_many(AccessLogAction, {"User logged in."}, using=using)
+        with CaptureQueriesContext(connections[using]) as ctx:
+            resolve_many(AccessLogAction, {"User logged in."}, using=using)
+        assert len(ctx.captured_queries) == 1
@@ -0,0 +1,56 @@
+import pytest
+from io import StringIO
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.models import AccessLog
+from core.audit.partitions import add_months, partition_name, partition_bounds, month_start
+
+def make_log(created_at):
+    return AccessLog.objects.create_entry(
+        method="GET",
+        path="/api/accounts/users/users/",
+        action="Viewed user list.",
+        status_code=200,
+        created_at=created_at,
+    )
+
+class TestPartitionHelpers:
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+    def test_partition_name_and_bounds(self):
+        start = month_start(date(2025, 5, 17))
+        name = partition_name(start)
+        assert name == "core_access_log_p2025_05"
+        assert partition_bounds(name) == (date(2025, 5, 1), date(2025, 6, 1))
+        assert partition_bounds("core_access_log_default") is None
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestMaintainAccessLogsCommand:
+    def test_deletes_expired_rows_in_batches(self):
+        now = timezone.now()
+        for days in (400, 380, 370):
+            make_log(now - timedelta(days=days))
+        recent = make_log(now - timedelta(days=10))
+
+        out = StringIO()
+        call_command("maintain_access_logs", retention_days=365, batch_size=2, stdout=out)
+
+        assert list(AccessLog.objects.values_list("id", flat=True)) == [recent.id]
+        assert "3" in out.getvalue()
+
+    def test_dry_run_does_not_delete(self):
+        make_log(datetime(2000, 1, 1, tzinfo=dt_timezone.utc))
+        out = StringIO()
+        call_command("maintain_access_logs", retention_days=30, dry_run=True, stdout=out)
+        assert AccessLog.objects.count() == 1
+        assert "1" in out.getvalue()
+
+    def test_zero_retention_is_not_treated_as_unset(self):
+        make_log(timezone.now() - timedelta(minutes=5))
+        call_command("maintain_access_logs", retention_days=0, stdout=StringIO())
+        assert AccessLog.objects.count() == 0
@@ -0,0 +1,133 @@
+import pytest
+from io import StringIO
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import AccessLog, AccessLogRollup
+from core.audit.sinks import write_access_logs
+from core.audit.rollups import split_action, status_class
+
+User = get_user_model()
+
+HOUR = datetime(2025, 5, 3, 10, 0, tzinfo=dt_timezone.utc)
+
+def make_entry(minute=0, action="Viewed user list.", method="GET", status_code=200, user_id=None, hour=HOUR):
+    return {
+        "user_id": user_id,
+        "method": method,
+        "path": "/api/accounts/users/users/",
+        "action": action,
+        "status_code": status_code,
+        "message": "",
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest",
+        "object_id": None,
+        "object_type": None,
+        "created_at": hour + timedelta(minutes=minute),
+    }
+
+class TestRollupHelpers:
+    def test_split_action_drops_dynamic_part(self):
+        assert split_action("Viewed user details.: a@b.com") == "Viewed user details."
+        assert split_action("Viewed user list.") == "Viewed user list."
+
+    def test_status_class(self):
+        assert status_class(204) == "2xx"
+        assert status_class(404) == "4xx"
+        assert status_class(None) == "---"
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestRollupMaintenance:
+    def test_writer_updates_rollups_incrementally(self):
+        write_access_logs([make_entry(1), make_entry(2), make_entry(3, status_code=403)])
+        write_access_logs([make_entry(4), make_entry(30, action="Viewed user details.: a@b.com")])
+
+        rows = {
+            (r.action, r.status_class): r.count
+            for r in AccessLogRollup.objects.filter(bucket=HOUR)
+        }
+        assert rows == {
+            ("Viewed user list.", "2xx"): 3,
+            ("Viewed user list.", "4xx"): 1,
+            ("Viewed user details.", "2xx"): 1,
+        }
+
+    def test_rebuild_matches_incremental(self):
+        entries = [make_entry(i % 60, status_code=500 if i % 5 == 0 else 200) for i in range(20)]
+        entries.append(make_entry(5, action="Updated user.: x@y.com", method="PUT"))
+        write_access_logs(entries)
+        incremental = sorted(AccessLogRollup.objects.values_list("action", "method", "status_class", "count"))
+
+        AccessLogRollup.objects.all().delete()
+        out = StringIO()
+        call_command(
+            "rebuild_access_log_rollups",
+            date_from=HOUR.isoformat(),
+            date_to=(HOUR + timedelta(hours=1)).isoformat(),
+            stdout=out,
+        )
+        rebuilt = sorted(AccessLogRollup.objects.values_list("action", "method", "status_class", "count"))
+        assert rebuilt == incremental
+
+    def test_compacted_rows_count_every_event(self):
+        compacted = dict(make_entry(1), count=5, sample_weight=5.0, first_seen=HOUR, last_seen=HOUR + timedelta(minutes=1))
+        write_access_logs([compacted, make_entry(2)])
+        rollup = AccessLogRollup.objects.get()
+        assert (rollup.count, rollup.weighted_count) == (6, 6.0)
+
+        AccessLogRollup.objects.all().delete()
+        call_command("rebuild_access_log_rollups", date_from=HOUR.isoformat(), date_to=(HOUR + timedelta(hours=1)).isoformat(), stdout=StringIO())
+        assert AccessLogRollup.objects.get().count == 6
+
+    def test_rebuild_accepts_naive_dates_as_utc(self):
+        write_access_logs([make_entry(1), make_entry(2)])
+        AccessLogRollup.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_access_log_rollups", date_from="2025-05-03T10:00:00", date_to="2025-05-03T11:00:00", stdout=out)
+        assert AccessLogRollup.objects.get(bucket=HOUR).count == 2
+        assert "2025-05-03 10:00 - 2025-05-03 11:00" in out.getvalue()
+
+    def test_user_rollups_are_upserted_on_the_unique_key(self):
+        write_access_logs([make_entry(1, user_id=7), make_entry(2, user_id=8)])
+        write_access_logs([make_entry(3, user_id=7), make_entry(4, user_id=7, status_code=404)])
+
+        rows = sorted(AccessLogRollup.objects.values_list("user_id", "status_class", "count", "weighted_count"))
+        assert rows == [(7, "2xx", 2, 2.0), (7, "4xx", 1, 1.0), (8, "2xx", 1, 1.0)]
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestAccessLogStatsView:
+    @pytest.fixture
+    def client(self):
+        user = User.objects.create_user(email="stats@test.com", password="StatsPass123!", user_type="staff")
+        user.user_permissions.add(Permission.objects.get(codename="view_accesslog", content_type__app_label="core"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def test_stats_by_action(self, client):
+        write_access_logs([make_entry(1), make_entry(2), make_entry(3, status_code=404), make_entry(4, action="User logged in.", method="POST")])
+        response = client.get(reverse("access-logs-stats"), {"date_from": HOUR.isoformat(), "group_by": "action"})
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["totals"]["requests"] == 4
+        assert data["totals"]["errors"] == 1
+        assert data["results"][0] == {"key": "Viewed user list.", "requests": 3, "errors": 1, "error_rate": 0.3333}
+
+    def test_stats_by_hour_respects_range(self, client):
+        write_access_logs([make_entry(1), make_entry(1, hour=HOUR + timedelta(hours=1)), make_entry(1, hour=HOUR + timedelta(hours=2))])
+        response = client.get(reverse("access-logs-stats"), {
+            "date_from": HOUR.isoformat(),
+            "date_to": (HOUR + timedelta(hours=2)).isoformat(),
+            "group_by": "hour",
+        })
+        assert [row["requests"] for row in response.data["data"]["results"]] == [1, 1]
+
+    def test_stats_invalid_range(self, client):
+        response = client.get(reverse("access-logs-stats"), {"date_from": HOUR.isoformat(), "date_to": HOUR.isoformat()})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
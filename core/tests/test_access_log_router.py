@@ -0,0 +1,90 @@
+import pytest
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connections, router
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from core.models import AccessLog, AccessLogRollup
+
+User = get_user_model()
+
+class TestAccessLogRouter:
+    def test_audit_models_use_audit_database(self):
+        assert router.db_for_write(AccessLog) == "audit"
+        assert router.db_for_read(AccessLogRollup) == "audit"
+        assert router.db_for_write(User) == "default"
+
+    def test_migrations_are_split(self):
+        assert router.allow_migrate("audit", "core", model_name="accesslog")
+        assert not router.allow_migrate("default", "core", model_name="accesslog")
+        assert not router.allow_migrate("audit", "accounts", model_name="user")
+        assert router.allow_migrate("default", "accounts", model_name="user")
+
+    def test_default_alias_keeps_single_database(self, settings):
+        settings.ACCESS_LOG = {**settings.ACCESS_LOG, "DATABASE": "default"}
+        assert router.db_for_write(AccessLog) == "default"
+        assert router.allow_migrate("default", "core", model_name="accesslog") is not False
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestCrossDatabaseUser:
+    def test_log_user_is_read_from_default(self):
+        user = User.objects.create_user(email="router@test.com", password="Router123!")
+        log = AccessLog.objects.create_entry(user=user, method="GET", path="/api/", action="Viewed user list.")
+        assert log._state.db == "audit"
+        assert AccessLog.objects.get(pk=log.pk).user.email == "router@test.com"
+
+    def test_deleting_user_keeps_audit_rows_without_user(self):
+        user = User.objects.create_user(email="gone@test.com", password="Router123!")
+        log = AccessLog.objects.create_entry(user=user, method="DELETE", path="/api/", action="Deleted user.")
+        rollup = AccessLogRollup.objects.create(bucket=log.created_at, action="Deleted user.", method="DELETE", status_class="2xx", user=user, count=1)
+        user.delete()
+        assert AccessLog.objects.get(pk=log.pk).user_id is None
+        assert AccessLogRollup.objects.get(pk=rollup.pk).user_id is None
+
+    def test_audit_database_has_no_user_foreign_keys(self):
+        # La base `audit` de pruebas se migra como alias secundario
+        connection = connections["audit"]
+        user_table = User._meta.db_table
+        with connection.cursor() as cursor:
+            tables = [table for table in connection.introspection.table_names(cursor) if table.startswith("core_")]
+            foreign_tables = {
+                constraint["foreign_key"][0]
+                for table in tables
+                for constraint in connection.introspection.get_constraints(cursor, table).values()
+                if constraint["foreign_key"]
+            }
+        assert "core_access_log" in tables
+        assert user_table not in foreign_tables
+
+@pytest.mark.django_db(databases=["default", "audit"], transaction=True)
+class TestAuditMigrations:
+    @pytest.mark.parametrize("migration", ["0001_squashed_0001_initial", "0006"])
+    def test_user_foreign_keys_are_created_without_constraint(self, migration, capsys):
+        call_command("sqlmigrate", "core", migration, database="audit")
+        assert User._meta.db_table not in capsys.readouterr().out
+
+    def test_existing_user_foreign_key_is_dropped(self):
+        # Base que aplico 0001_initial con la FK: 0016 la elimina
+        connection = connections["audit"]
+        field = AccessLog._meta.get_field("user")
+        constrained = field.clone()
+        constrained.db_constraint = True
+        constrained.set_attributes_from_name("user")
+        constrained.model = AccessLog
+        constrained.remote_field.model = User
+        constrained.remote_field.field_name = field.remote_field.field_name
+        with connection.schema_editor() as editor:
+            editor.alter_field(AccessLog, field, constrained)
+        assert self.user_foreign_keys(connection)
+
+        migration = import_module("core.migrations.0016_access_log_user_drop_constraint")
+        with connection.schema_editor() as editor:
+            migration.drop_user_foreign_keys(apps, editor)
+        assert not self.user_foreign_keys(connection)
+
+    def user_foreign_keys(self, connection):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, AccessLog._meta.db_table)
+        return [name for name, c in constraints.items() if c["foreign_key"] and c["foreign_key"][0] == User._meta.db_table]
@@ -0,0 +1,64 @@
+import pytest
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from rest_framework.test import APIClient
+
+from core.models import AccessLog
+from core.audit.routes import normalize_route
+from core.utils import decorators
+
+User = get_user_model()
+
+class FakeSink:
+    def __init__(self):
+        self.entries = []
+
+    def put(self, entry):
+        self.entries.append(entry)
+        return True
+
+class TestNormalizeRoute:
+    def test_router_regex_groups(self):
+        assert normalize_route("api/accounts/users/users/(?P<pk>[^/.]+)/$") == "/api/accounts/users/users/<pk>/"
+
+    def test_path_converters(self):
+        assert normalize_route("api/items/<int:pk>/") == "/api/items/<pk>/"
+        assert normalize_route("api/auth/login/") == "/api/auth/login/"
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestRouteCapture:
+    @pytest.fixture
+    def sink(self, monkeypatch):
+        sink = FakeSink()
+        monkeypatch.setattr(decorators, "get_log_sink", lambda: sink)
+        return sink
+
+    @pytest.fixture
+    def client(self, db):
+        user = User.objects.create_user(email="routes@test.com", password="Routes123!", user_type="staff")
+        user.user_permissions.add(Permission.objects.get(codename="view_accesslog", content_type__app_label="core"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def test_entry_carries_route_view_name_and_query_string(self, client, sink, django_capture_on_commit_callbacks):
+        log = AccessLog.objects.create_entry(method="GET", path="/api/", action="Viewed user list.")
+        with django_capture_on_commit_callbacks(execute=True):
+            client.get(reverse("access-log-detail", args=[log.id]), {"verbose": "1"})
+
+        (entry,) = sink.entries
+        assert entry["path"] == f"/api/core/access-logs/logs/{log.id}/"
+        assert entry["route"] == "/api/core/access-logs/logs/<pk>/"
+        assert entry["view_name"] == "access-log-detail"
+        assert entry["query_string"] == "verbose=1"
+
+    def test_same_route_is_stored_once(self):
+        for pk in (17, 18):
+            AccessLog.objects.create_entry(
+                method="GET", path=f"/api/accounts/users/users/{pk}/", action="Viewed user details.",
+                route="/api/accounts/users/users/<pk>/", view_name="user-detail",
+            )
+        assert AccessLog.objects.values("route_id").distinct().count() == 1
+        assert AccessLog.objects.values("path_id").distinct().count() == 2
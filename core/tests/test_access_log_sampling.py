@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory
+from rest_framework.response import Response
+
+from core.models import AccessLogRollup
+from core.audit import sampling
+from core.checks import check_sampling_rates
+from core.audit.sampling import get_sample_rate, sample_weight
+from core.audit.sinks import write_access_logs
+from core.utils import decorators
+from core.utils.decorators import LogActionView
+
+HOUR = datetime(2025, 5, 3, 10, 0, tzinfo=dt_timezone.utc)
+
+class SampledView:
+    @LogActionView(action_base="Viewed list.", sample_rate=0.25)
+    def list(self, request):
+        return Response({"message": "ok"}, status=request.GET.get("status", 200))
+
+    @LogActionView(action_base="Logged in.", sample_rate=0.25, always_log=True)
+    def login(self, request):
+        return Response({"message": "ok"})
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(decorators, "_schedule_log", lambda *args: calls.append(args[-1]))
+    return calls
+
+@pytest.fixture
+def drop_samples(monkeypatch):
+    # random.random() >= tasa: toda lectura muestreada se descarta
+    monkeypatch.setattr(sampling.random, "random", lambda: 0.99)
+
+def make_request(method="get", **params):
+    return getattr(RequestFactory(), method)("/api/", params)
+
+class TestSampleWeight:
+    def test_writes_errors_and_always_log_are_kept(self, drop_samples):
+        assert sample_weight("POST", 201, 0.1) == 1.0
+        assert sample_weight("GET", 404, 0.1) == 1.0
+        assert sample_weight("GET", 200, 0.1, always_log=True) == 1.0
+        assert sample_weight("GET", 200, 0.1) is None
+
+    def test_kept_reads_carry_inverse_weight(self, monkeypatch):
+        monkeypatch.setattr(sampling.random, "random", lambda: 0.01)
+        assert sample_weight("GET", 200, 0.25) == 4.0
+
+    def test_settings_override_decorator(self, settings):
+        settings.ACCESS_LOG = {"SAMPLING": {"SampledView.list": 0.5}}
+        assert get_sample_rate("SampledView.list", 0.25) == 0.5
+        assert get_sample_rate("SampledView.retrieve", 0.25) == 0.25
+        assert get_sample_rate("SampledView.create") == 1.0
+
+    def test_invalid_rate_fails_system_check(self, settings):
+        settings.ACCESS_LOG = {"SAMPLING": {"SampledView.list": 0, "SampledView.retrieve": "abc", "SampledView.create": 0.5}}
+        errors = check_sampling_rates(None)
+        assert [error.id for error in errors] == ["core.E001", "core.E001"]
+        assert "SampledView.list" in errors[0].msg
+
+    def test_valid_rates_pass_system_check(self, settings):
+        settings.ACCESS_LOG = {"SAMPLING": {"SampledView.list": 0.5}}
+        assert check_sampling_rates(None) == []
+
+    def test_invalid_decorator_rate_fails_at_decoration(self):
+        with pytest.raises(ImproperlyConfigured):
+            LogActionView(action_base="Viewed list.", sample_rate=1.5)(lambda self, request: None)
+
+class TestLogActionViewSampling:
+    def test_sampled_read_is_dropped(self, scheduled, drop_samples):
+        SampledView().list(make_request())
+        assert scheduled == []
+
+    def test_error_and_auth_events_are_kept(self, scheduled, drop_samples):
+        SampledView().list(make_request(status=403))
+        SampledView().login(make_request())
+        assert scheduled == [1.0, 1.0]
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestWeightedRollups:
+    def test_rollups_sum_weights(self):
+        entry = {
+            "method": "GET", "path": "/api/", "action": "Viewed list.", "status_code": 200,
+            "user_agent": "pytest", "created_at": HOUR,
+        }
+        write_access_logs([dict(entry, sample_weight=10.0), dict(entry, sample_weight=10.0), dict(entry, status_code=500)])
+        rows = {r.status_class: (r.count, r.weighted_count) for r in AccessLogRollup.objects.all()}
+        assert rows == {"2xx": (2, 20.0), "5xx": (1, 1.0)}
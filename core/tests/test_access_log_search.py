@@ -0,0 +1,82 @@
+import pytest
+
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import AccessLog
+from django.db import connections
+
+from core.audit.search import FTS_TABLE, backfill_search, fts_query, search_access_logs
+
+User = get_user_model()
+
+@pytest.fixture
+def auditor(db):
+    user = User.objects.create_user(email="search@test.com", password="SearchPass123!", user_type="staff")
+    user.user_permissions.add(Permission.objects.get(codename="view_accesslog", content_type__app_label="core"))
+    return user
+
+@pytest.fixture
+def auditor_client(auditor):
+    client = APIClient()
+    client.force_authenticate(user=auditor)
+    return client
+
+@pytest.fixture
+def logs(auditor):
+    return [
+        AccessLog.objects.create_entry(user=auditor, method="POST", path="/api/auth/login/", action="User logged in.", status_code=200, message="login ok"),
+        AccessLog.objects.create_entry(user=None, method="POST", path="/api/auth/refresh/", action="Token refreshed.", status_code=401, message="token_invalid for ana@test.com"),
+        AccessLog.objects.create_entry(user=auditor, method="GET", path="/api/accounts/users/users/", action="Viewed user list.", status_code=200),
+    ]
+
+def test_fts_query_quotes_terms():
+    assert fts_query('token a@b.com') == '"token" "a@b.com"'
+    assert fts_query('say "hi"') == '"say" """hi"""'
+    assert fts_query('   ') is None
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestAccessLogSearch:
+    def test_matches_action_and_message(self, logs):
+        queryset = AccessLog.objects.all()
+        assert list(search_access_logs(queryset, "logged").values_list("id", flat=True)) == [logs[0].id]
+        assert list(search_access_logs(queryset, "token_invalid").values_list("id", flat=True)) == [logs[1].id]
+        assert list(search_access_logs(queryset, "ana@test.com").values_list("id", flat=True)) == [logs[1].id]
+        assert not search_access_logs(queryset, "user missing").exists()
+
+    def test_index_follows_updates_and_deletes(self, logs):
+        queryset = AccessLog.objects.all()
+        logs[2].message = "bulk export"
+        logs[2].save(update_fields=["message"])
+        assert list(search_access_logs(queryset, "export").values_list("id", flat=True)) == [logs[2].id]
+
+        logs[1].delete()
+        assert not search_access_logs(queryset, "token_invalid").exists()
+
+    def test_backfill_indexes_missing_rows_in_batches(self, logs):
+        connection = connections[AccessLog.objects.db]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        queryset = AccessLog.objects.all()
+        assert not search_access_logs(queryset, "logged").exists()
+
+        assert backfill_search(connection, batch_size=1) == len(logs)
+        assert list(search_access_logs(queryset, "token_invalid").values_list("id", flat=True)) == [logs[1].id]
+        assert backfill_search(connection, batch_size=1) == 0
+
+    def test_search_endpoint_applies_filters(self, auditor_client, logs):
+        url = reverse("access-log-search")
+        response = auditor_client.get(url, {"q": "user"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["id"] for r in response.data["data"]["results"]] == [logs[2].id, logs[0].id]
+
+        response = auditor_client.get(url, {"q": "user", "method": "POST"})
+        assert [r["id"] for r in response.data["data"]["results"]] == [logs[0].id]
+
+    def test_search_requires_query(self, auditor_client):
+        response = auditor_client.get(reverse("access-log-search"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "q" in response.data["errors"]
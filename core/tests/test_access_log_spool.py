@@ -0,0 +1,97 @@
+import pytest
+from io import StringIO
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.models import AccessLog, AccessLogSpoolOffset
+from core.audit.spool import SpoolLogSink, encode_entry, load_spool
+
+def make_entry(minute=0, **overrides):
+    entry = {
+        "user_id": None,
+        "method": "GET",
+        "path": "/api/accounts/users/users/",
+        "action": "Viewed user list.",
+        "status_code": 200,
+        "message": "",
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest",
+        "object_id": None,
+        "object_type": None,
+        "created_at": timezone.now() - timedelta(minutes=minute),
+        "sample_weight": 1.0,
+    }
+    entry.update(overrides)
+    return entry
+
+@pytest.fixture
+def sink(tmp_path):
+    return SpoolLogSink(directory=tmp_path, batch_size=10, flush_interval=60, autostart=False)
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestSpoolLogSink:
+    def test_flush_appends_to_segment_without_database(self, sink, tmp_path, django_assert_num_queries):
+        sink.put(make_entry())
+        sink.put(make_entry())
+        with django_assert_num_queries(0):
+            assert sink.flush() == 2
+        (segment,) = tmp_path.glob("*.open")
+        assert len(segment.read_bytes().splitlines()) == 2
+
+        sink.stop()
+        assert [p.suffix for p in tmp_path.iterdir()] == [".seg"]
+
+    def test_rotates_by_size(self, tmp_path):
+        sink = SpoolLogSink(directory=tmp_path, segment_max_bytes=1, batch_size=1, flush_interval=60, autostart=False)
+        sink.put(make_entry())
+        sink.put(make_entry())
+        sink.flush()
+        assert len(list(tmp_path.glob("*.seg"))) == 2
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestLoadSpool:
+    def test_loads_and_removes_sealed_segments(self, sink, tmp_path, settings):
+        settings.ACCESS_LOG = {**settings.ACCESS_LOG, "SPOOL_DIR": str(tmp_path)}
+        for minute in range(3):
+            sink.put(make_entry(minute))
+        sink.stop()
+
+        out = StringIO()
+        call_command("load_access_log_spool", "--batch-size", "2", stdout=out)
+        assert "registros cargados: 3" in out.getvalue()
+        assert AccessLog.objects.count() == 3
+        assert list(tmp_path.iterdir()) == []
+        assert AccessLogSpoolOffset.objects.count() == 0
+
+    def test_open_segment_resumes_from_offset_after_sealing(self, sink, tmp_path):
+        sink.put(make_entry())
+        sink.flush()
+        # Una linea a medias (writer interrumpido en el write) no se carga todavia
+        (segment,) = tmp_path.glob("*.open")
+        partial = encode_entry(make_entry(action="User logged in."))
+        with open(segment, "ab") as fh:
+            fh.write(partial[:10])
+
+        assert load_spool(tmp_path, stale_after=3600)["loaded"] == 1
+        assert AccessLogSpoolOffset.objects.get().offset == len(encode_entry(make_entry()))
+
+        with open(segment, "ab") as fh:
+            fh.write(partial[10:])
+        sink.stop()
+
+        totals = load_spool(tmp_path, stale_after=3600)
+        assert totals == {"segments": 1, "loaded": 1, "skipped": 0, "removed": 1}
+        assert AccessLog.objects.count() == 2
+
+    def test_stale_open_segment_is_loaded_as_sealed(self, sink, tmp_path):
+        sink.put(make_entry())
+        sink.flush()
+        assert load_spool(tmp_path, stale_after=0)["removed"] == 1
+        assert AccessLog.objects.count() == 1
+
+    def test_invalid_lines_are_skipped(self, tmp_path):
+        (tmp_path / "20250101T000000-1-000001.seg").write_bytes(b"not json\n" + encode_entry(make_entry()))
+        totals = load_spool(tmp_path)
+        assert (totals["loaded"], totals["skipped"]) == (1, 1)
@@ -0,0 +1,160 @@
+import csv
+import io
+import json
+import pytest
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import AccessLog
+
+User = get_user_model()
+
+@pytest.fixture
+def auditor(db):
+    user = User.objects.create_user(
+        email="auditor@test.com",
+        password="AuditorPass123!",
+        first_name="Audit",
+        last_name="User",
+        user_type="staff",
+    )
+    user.user_permissions.add(*Permission.objects.filter(codename__in=["can_export", "view_accesslog"], content_type__app_label="core"))
+    return user
+
+@pytest.fixture
+def auditor_client(auditor):
+    client = APIClient()
+    client.force_authenticate(user=auditor)
+    return client
+
+@pytest.fixture
+def logs(auditor):
+    now = timezone.now()
+    return [
+        AccessLog.objects.create_entry(user=auditor, method="GET", path="/api/accounts/users/users/", action="Viewed user list.", status_code=200, created_at=now - timedelta(days=2)),
+        AccessLog.objects.create_entry(user=auditor, method="POST", path="/api/auth/login/", action="User logged in.", status_code=200, created_at=now - timedelta(days=1)),
+        AccessLog.objects.create_entry(user=None, method="POST", path="/api/auth/login/", action="User logged in.", status_code=400, created_at=now),
+    ]
+
+def read_stream(response):
+    return b"".join(response.streaming_content).decode("utf-8")
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestAccessLogExportView:
+    def test_export_csv(self, auditor_client, logs):
+        response = auditor_client.get(reverse("access-logs-export"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        assert [int(r["id"]) for r in rows] == [log.id for log in logs]
+        assert rows[0]["user_email"] == "auditor@test.com"
+
+    def test_export_ndjson_with_filters(self, auditor_client, logs):
+        response = auditor_client.get(reverse("access-logs-export"), {"output": "ndjson", "action": "logged in", "status_code": 200})
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in read_stream(response).splitlines()]
+        assert [line["id"] for line in lines] == [logs[1].id]
+
+    def test_export_date_range(self, auditor_client, logs):
+        date_from = (timezone.now() - timedelta(days=1, hours=1)).isoformat()
+        response = auditor_client.get(reverse("access-logs-export"), {"output": "ndjson", "date_from": date_from})
+        lines = [json.loads(line) for line in read_stream(response).splitlines()]
+        assert [line["id"] for line in lines] == [logs[1].id, logs[2].id]
+
+    def test_export_invalid_output(self, auditor_client):
+        response = auditor_client.get(reverse("access-logs-export"), {"output": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "output" in response.data["errors"]
+
+    def test_export_requires_permission(self, db):
+        user = User.objects.create_user(email="noperm@test.com", password="NoPerm123!", user_type="admin")
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse("access-logs-export"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestAccessLogViewSet:
+    def test_list_is_newest_first(self, auditor_client, logs):
+        response = auditor_client.get(reverse("access-log-list"))
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["data"]["results"]
+        assert [r["id"] for r in results] == [log.id for log in reversed(logs)]
+        assert response.data["data"]["next"] is None
+
+    def test_keyset_pages_forward_and_back(self, auditor_client, auditor):
+        created_at = timezone.now()
+        # Mismo timestamp en todos: el desempate por id debe mantener el orden
+        ids = [
+            AccessLog.objects.create_entry(user=auditor, method="GET", path="/api/", action="Viewed user list.", status_code=200, created_at=created_at).id
+            for _ in range(5)
+        ]
+        expected = list(reversed(ids))
+
+        first = auditor_client.get(reverse("access-log-list"), {"page_size": 2}).data["data"]
+        assert [r["id"] for r in first["results"]] == expected[:2]
+        assert first["previous"] is None
+
+        second = auditor_client.get(first["next"]).data["data"]
+        assert [r["id"] for r in second["results"]] == expected[2:4]
+
+        third = auditor_client.get(second["next"]).data["data"]
+        assert [r["id"] for r in third["results"]] == expected[4:]
+        assert third["next"] is None
+
+        back = auditor_client.get(third["previous"]).data["data"]
+        assert [r["id"] for r in back["results"]] == expected[2:4]
+
+    def test_list_filters(self, auditor_client, logs, auditor):
+        response = auditor_client.get(reverse("access-log-list"), {"user": auditor.id, "method": "post"})
+        assert [r["id"] for r in response.data["data"]["results"]] == [logs[1].id]
+
+    def test_invalid_cursor(self, auditor_client):
+        response = auditor_client.get(reverse("access-log-list"), {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve(self, auditor_client, logs):
+        response = auditor_client.get(reverse("access-log-detail", args=[logs[0].id]))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["user_email"] == "auditor@test.com"
+
+    def test_list_requires_permission(self, db):
+        user = User.objects.create_user(email="viewer@test.com", password="Viewer123!", user_type="staff")
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse("access-log-list"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db(databases=["default", "audit"])
+class TestAccessLogTimeline:
+    def test_object_history_newest_first(self, auditor_client, auditor):
+        now = timezone.now()
+        history = [
+            AccessLog.objects.create_entry(user=auditor, method="PATCH", path="/api/accounts/users/users/42/", action="Updated user.", object_type="accounts.user", object_id=42, created_at=now - timedelta(minutes=minutes))
+            for minutes in (3, 2, 1)
+        ]
+        AccessLog.objects.create_entry(user=auditor, method="PATCH", path="/api/accounts/users/users/7/", action="Updated user.", object_type="accounts.user", object_id=7, created_at=now)
+        AccessLog.objects.create_entry(user=auditor, method="PATCH", path="/api/accounts/roles/roles/42/", action="Updated role.", object_type="auth.group", object_id=42, created_at=now)
+
+        url = reverse("access-log-timeline", kwargs={"object_type": "accounts.user", "object_id": 42})
+        first = auditor_client.get(url, {"page_size": 2}).data["data"]
+        assert [r["id"] for r in first["results"]] == [history[2].id, history[1].id]
+
+        second = auditor_client.get(first["next"]).data["data"]
+        assert [r["id"] for r in second["results"]] == [history[0].id]
+        assert second["next"] is None
+
+    def test_timeline_requires_permission(self, db):
+        user = User.objects.create_user(email="timeline@test.com", password="Timeline123!", user_type="admin")
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("access-log-timeline", kwargs={"object_type": "accounts.user", "object_id": 1})
+        assert client.get(url).status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+from datetime import timedelta
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.middleware import updateRequestInfo
+from core.middleware.updateRequestInfo import CoreRequestMiddleware, get_current_user
+from core.utils.activity import ActivityTracker
+
+User = get_user_model()
+
+@pytest.mark.django_db
+class TestCoreRequestMiddleware:
+    def test_api_skips_session_and_csrf(self, client):
+        response = client.get(reverse("access-log-list"), HTTP_ACCEPT_LANGUAGE="en")
+        assert response.status_code == 401
+        assert "sessionid" not in response.cookies
+        assert "csrftoken" not in response.cookies
+        assert response["Content-Language"] == "en"
+        assert "Accept-Language" in response["Vary"]
+
+    def test_admin_keeps_session_pipeline(self, client):
+        response = client.get(reverse("admin:login"))
+        assert response.status_code == 200
+        assert "csrftoken" in response.cookies
+
+    def test_records_activity_of_jwt_user(self, monkeypatch):
+        tracker = ActivityTracker(granularity=60, flush_interval=0)
+        monkeypatch.setattr(updateRequestInfo, "get_activity_tracker", lambda: tracker)
+        user = User.objects.create_user(email="mw@test.com", password="Middleware123!", last_activity=timezone.now() - timedelta(hours=1))
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        client.get(reverse("access-log-list"), REMOTE_ADDR="10.1.1.1")
+        user.refresh_from_db()
+        assert user.last_ip == "10.1.1.1"
+        assert user.last_activity > timezone.now() - timedelta(minutes=1)
+
+    def test_current_user_is_resolved_lazily(self):
+        user = User.objects.create_user(email="current@test.com", password="Current123!")
+        seen = []
+
+        def view(request):
+            # La autenticacion de DRF asigna el usuario dentro de la vista
+            request.user = user
+            seen.append(get_current_user())
+            return HttpResponse()
+
+        request = RequestFactory().get("/api/ping/")
+        request.user = None
+        CoreRequestMiddleware(view)(request)
+        assert seen == [user]
+        assert get_current_user() is None
+
+class TestCoreRequestMiddlewareAsync:
+    def test_async_mode_without_thread_hops(self):
+        async def view(request):
+            return HttpResponse()
+
+        middleware = CoreRequestMiddleware(view)
+        assert middleware.async_mode
+        assert iscoroutinefunction(middleware)
+
+    def test_current_user_is_isolated_per_coroutine(self):
+        users = [SimpleNamespace(pk=pk, is_authenticated=True, language="es", last_ip=None, last_activity=None) for pk in (1, 2)]
+        seen = {}
+
+        async def view(request):
+            request.user = users[request.GET["user"] == "2"]
+            # Cede el loop: la otra corrutina corre mientras esta espera
+            await asyncio.sleep(0.01)
+            seen[request.GET["user"]] = get_current_user()
+            return HttpResponse()
+
+        middleware = CoreRequestMiddleware(view)
+        factory = RequestFactory()
+
+        async def run():
+            await asyncio.gather(*(middleware(factory.get("/ping/", {"user": value})) for value in ("1", "2")))
+
+        async_to_sync(run)()
+        assert seen == {"1": users[0], "2": users[1]}
+
+    def test_asgi_api_request(self):
+        response = async_to_sync(AsyncClient().get)(reverse("access-log-list"), headers={"accept-language": "en"})
+        assert response.status_code == 401
+        assert response["Content-Language"] == "en"
+        assert "sessionid" not in response.cookies
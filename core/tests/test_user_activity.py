@@ -0,0 +1,59 @@
+import pytest
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from core.utils.activity import ActivityTracker
+
+User = get_user_model()
+
+def make_user(email, **fields):
+    return User.objects.create_user(email=email, password="Activity123!", **fields)
+
+@pytest.mark.django_db
+class TestActivityTracker:
+    def test_recent_activity_is_not_written(self):
+        user = make_user("recent@test.com", last_activity=timezone.now(), last_ip="10.0.0.1")
+        tracker = ActivityTracker(granularity=60, flush_interval=0)
+        with CaptureQueriesContext(connection) as ctx:
+            assert tracker.touch(user, "10.0.0.1") is False
+        assert len(ctx.captured_queries) == 0
+
+    def test_stale_activity_is_batched(self):
+        old = timezone.now() - timedelta(minutes=5)
+        users = [make_user(f"stale{i}@test.com", last_activity=old, last_ip="10.0.0.1") for i in range(3)]
+        tracker = ActivityTracker(granularity=60, flush_interval=3600)
+        with CaptureQueriesContext(connection) as ctx:
+            for user in users:
+                tracker.touch(user, "10.0.0.1")
+        assert len(ctx.captured_queries) == 0
+        assert tracker.pending() == 3
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert tracker.flush() == 3
+        assert sum(q["sql"].startswith("UPDATE") for q in ctx.captured_queries) == 1
+        for user in users:
+            user.refresh_from_db()
+            assert user.last_activity > old
+
+    def test_flush_when_interval_elapsed(self):
+        user = make_user("due@test.com", last_ip="10.0.0.1")
+        tracker = ActivityTracker(granularity=60, flush_interval=0)
+        assert tracker.touch(user, "10.0.0.1") is True
+        user.refresh_from_db()
+        assert user.last_activity is not None
+        assert tracker.pending() == 0
+
+    def test_ip_change_is_written_immediately(self):
+        old = timezone.now() - timedelta(minutes=5)
+        user = make_user("ip@test.com", last_activity=old, last_ip="10.0.0.1")
+        tracker = ActivityTracker(granularity=60, flush_interval=3600)
+        tracker.touch(user, "10.0.0.1")
+        assert tracker.touch(user, "10.0.0.2") is True
+        assert tracker.pending() == 0
+        user.refresh_from_db()
+        assert user.last_ip == "10.0.0.2"
+        assert user.last_activity > old
@@ -0,0 +1,5 @@
+from django.urls import include, path
+
+urlpatterns = [
+  path('access-logs/', include('core.urls.access_logs_urls')),
+]
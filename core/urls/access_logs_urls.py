@@ -0,0 +1,14 @@
+from rest_framework.routers import DefaultRouter
+
+from django.urls import path, include
+
+from core.views.access_logs_views import AccessLogViewSet, AccessLogExportView, AccessLogStatsView
+
+rAccessLogs = DefaultRouter()
+rAccessLogs.register(r'logs', AccessLogViewSet, basename='access-log')
+
+urlpatterns = [
+  path('', include(rAccessLogs.urls)),
+  path('export/', AccessLogExportView.as_view(), name='access-logs-export'),
+  path('stats/', AccessLogStatsView.as_view(), name='access-logs-stats'),
+]
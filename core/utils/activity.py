@@ -0,0 +1,149 @@
+import time
+import atexit
+import logging
+import threading
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Valores por defecto de la configuracion USER_ACTIVITY (ver config/settings/base.py)
+DEFAULTS = {
+  # Segundos minimos entre escrituras de last_activity del mismo usuario
+  'GRANULARITY': 60,
+  # Segundos maximos que la actividad acumulada permanece en memoria antes de escribirse
+  'FLUSH_INTERVAL': 30,
+}
+
+def get_activity_setting(key: str):
+  return getattr(settings, 'USER_ACTIVITY', {}).get(key, DEFAULTS[key])
+
+class ActivityTracker:
+  """
+  Acumula last_activity por usuario en memoria y lo escribe en un solo UPDATE por
+  intervalo, en lugar de un UPDATE sobre accounts_user en cada request.
+
+  - last_activity solo se registra si el valor guardado es mas antiguo que `granularity`.
+  - Un cambio de IP se escribe de inmediato (junto con last_activity) con save(), que
+    invalida el usuario en la cache de autenticacion.
+  - La escritura en lote la hace el request que encuentra vencido el intervalo.
+  """
+
+  def __init__(self, granularity: float = 60, flush_interval: float = 30):
+    self.granularity = timedelta(seconds=granularity)
+    self.flush_interval = float(flush_interval)
+    self._pending: Dict[int, datetime] = {}
+    self._lock = threading.Lock()
+    self._last_flush = time.monotonic()
+    atexit.register(self.flush)
+
+  def touch(self, user, ip: Optional[str] = None):
+    """
+    Registra la actividad de un usuario autenticado. Retorna True si escribio en la base de datos.
+    """
+
+    now = timezone.now()
+    if self._ip_changed(user, ip):
+      # save() (y no update()) para que post_save invalide el usuario en cache (authentication.signals)
+      user.last_ip, user.last_activity = ip, now
+      user.save(update_fields=['last_ip', 'last_activity'])
+      return True
+
+    self._record(user, now)
+    return self.flush_if_due() > 0
+
+  async def atouch(self, user, ip: Optional[str] = None):
+    """
+    Version async de touch(): no bloquea el event loop cuando no hay escritura.
+    """
+
+    now = timezone.now()
+    if self._ip_changed(user, ip):
+      user.last_ip, user.last_activity = ip, now
+      await user.asave(update_fields=['last_ip', 'last_activity'])
+      return True
+
+    self._record(user, now)
+    if time.monotonic() - self._last_flush < self.flush_interval:
+      return False
+    return await self.aflush() > 0
+
+  def _ip_changed(self, user, ip: Optional[str]) -> bool:
+    if not ip or ip == user.last_ip:
+      return False
+    with self._lock:
+      self._pending.pop(user.pk, None)
+    return True
+
+  def _record(self, user, now: datetime):
+    if user.last_activity is None or now - user.last_activity >= self.granularity:
+      with self._lock:
+        self._pending[user.pk] = now
+
+  def flush_if_due(self) -> int:
+    if time.monotonic() - self._last_flush < self.flush_interval:
+      return 0
+    return self.flush()
+
+  def flush(self) -> int:
+    """
+    Escribe la actividad pendiente con un solo UPDATE (bulk_update).
+
+    Returns:
+      int: Numero de usuarios actualizados.
+    """
+
+    users = self._take_pending()
+    if not users:
+      return 0
+    try:
+      get_user_model().objects.bulk_update(users, ['last_activity'])
+    except Exception as e:
+      logger.warning(f"[Activity] No se pudo escribir la actividad de {len(users)} usuarios: {e}")
+      return 0
+    return len(users)
+
+  async def aflush(self) -> int:
+    users = self._take_pending()
+    if not users:
+      return 0
+    try:
+      await get_user_model().objects.abulk_update(users, ['last_activity'])
+    except Exception as e:
+      logger.warning(f"[Activity] No se pudo escribir la actividad de {len(users)} usuarios: {e}")
+      return 0
+    return len(users)
+
+  def _take_pending(self) -> List:
+    with self._lock:
+      pending, self._pending = self._pending, {}
+      self._last_flush = time.monotonic()
+    User = get_user_model()
+    return [User(pk=pk, last_activity=last_activity) for pk, last_activity in pending.items()]
+
+  def pending(self) -> int:
+    with self._lock:
+      return len(self._pending)
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+def get_activity_tracker() -> ActivityTracker:
+  """
+  Retorna el ActivityTracker del proceso segun `USER_ACTIVITY`.
+  """
+
+  global _tracker
+  if _tracker is None:
+    with _tracker_lock:
+      if _tracker is None:
+        _tracker = ActivityTracker(
+          granularity=get_activity_setting('GRANULARITY'),
+          flush_interval=get_activity_setting('FLUSH_INTERVAL'),
+        )
+  return _tracker
@@ -0,0 +1,75 @@
+from typing import Any, Optional
+
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, PermissionDenied
+from rest_framework.request import Request
+
+from django.http import JsonResponse
+from django.views import View
+from django.contrib.auth.models import AnonymousUser
+
+from authentication.backends import CachedJWTAuthentication
+from core.utils.handlers import custom_exception_handler
+from core.utils.mixins import APIResponseMixin
+from core.base.responses import json_response_structure
+
+async def authenticate_jwt(request):
+  """
+  Autenticacion JWT (Bearer) sin ORM sincrono: el token se valida en memoria y el
+  usuario se obtiene de la cache de usuarios o del ORM async. Sin header retorna AnonymousUser.
+
+  Raises:
+    AuthenticationFailed: Token invalido o usuario inexistente/inactivo.
+  """
+
+  authentication = CachedJWTAuthentication()
+  header = authentication.get_header(request)
+  if header is None:
+    return AnonymousUser()
+  raw_token = authentication.get_raw_token(header)
+  if raw_token is None:
+    return AnonymousUser()
+
+  return await authentication.aget_user(authentication.get_validated_token(raw_token))
+
+class AsyncAPIView(APIResponseMixin, View):
+  """
+  Vista base async (ASGI) para endpoints de solo lectura. DRF 3.16 no ejecuta vistas
+  async, por lo que aqui se resuelven la autenticacion JWT, los permisos y los errores
+  con la misma estructura de respuesta que las vistas DRF, sin bloquear el event loop.
+
+  Los handlers (`async def get`) reciben un `rest_framework.request.Request` con el
+  usuario ya asignado, de modo que permisos, filtros, paginacion y LogActionView
+  funcionan igual que en las vistas sincronas.
+  """
+
+  permission_classes = []
+  http_method_names = ['get', 'head', 'options']
+
+  async def dispatch(self, request, *args, **kwargs):
+    request = Request(request, authenticators=())
+    self.request = request
+    try:
+      request.user = await authenticate_jwt(request)
+      self.check_permissions(request)
+      return await super().dispatch(request, *args, **kwargs)
+    except APIException as exc:
+      return self.handle_exception(exc)
+
+  def check_permissions(self, request):
+    for permission in [permission() for permission in self.permission_classes]:
+      if not permission.has_permission(request, self):
+        if not request.user.is_authenticated:
+          raise NotAuthenticated()
+        raise PermissionDenied()
+
+  def handle_exception(self, exc):
+    # Mismo formato y mensajes que las vistas DRF (core.utils.handlers)
+    response = custom_exception_handler(exc, {'view': self, 'request': self.request})
+    return JsonResponse(response.data, status=response.status_code)
+
+  def success_response(self, data: Optional[Any] = None, message: str = "Operación exitosa.", status_code: int = status.HTTP_200_OK) -> JsonResponse:
+    return json_response_structure(success=True, message=message, data=data, status_code=status_code)
+
+  def error_response(self, message: str = "Error en la solicitud.", errors: Optional[Any] = None, status_code: int = status.HTTP_400_BAD_REQUEST) -> JsonResponse:
+    return json_response_structure(success=False, message=message, errors=errors, status_code=status_code)
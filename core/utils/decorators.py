@@ -4,11 +4,15 @@ import inspect
 from functools import wraps
 from typing import Callable, Any, Optional, Dict
 
+from asgiref.sync import sync_to_async
 from rest_framework import status
 
 from django.db import transaction
+from django.utils import timezone
 
-from core.models import AccessLog
+from core.audit.sinks import get_log_sink
+from core.audit.sampling import get_sample_rate, policy_key, sample_weight, validate_sample_rate
+from core.audit.routes import resolve_route
 from core.base.responses import APIRequestInfo
 
 logger = logging.getLogger(__name__)
@@ -16,7 +20,9 @@ logger = logging.getLogger(__name__)
 def LogActionView(
   action_base: Optional[str] = None, 
   object_getter: Optional[Callable[[Any, Any, Dict, Any], str]] = None, 
-  meta_getter: Optional[Callable[[Any, Any, Dict, Any], Dict]] = None
+  meta_getter: Optional[Callable[[Any, Any, Dict, Any], Dict]] = None,
+  sample_rate: Optional[float] = None,
+  always_log: bool = False
 ):
   """
   Decorador avanzado para registrar acciones con trazabilidad extendida.
@@ -26,9 +32,15 @@ def LogActionView(
     - action_base: Texto base para la acción (opcional; usa la clase de la vista si no se provee).
     - object_getter: Función(view, request, kwargs, instance) -> str con descripción dinámica del objeto.
     - meta_getter:  Función(view, request, kwargs, instance) -> dict con 'object_id' y 'object_type'.
+    - sample_rate: Fracción (0, 1] de lecturas exitosas que se registran; ACCESS_LOG['SAMPLING']
+      tiene prioridad. Escrituras y errores siempre se registran.
+    - always_log: Registra siempre, sin muestreo (eventos de autenticación).
   """
 
   def decorator(view_func):
+    if sample_rate is not None:
+      validate_sample_rate(view_func.__qualname__, sample_rate)
+
     if inspect.iscoroutinefunction(view_func):
       async def wrapped_async(self, request, *args, **kwargs):
         instance = None
@@ -45,7 +57,9 @@ def LogActionView(
           exception = e
           status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         
-        _schedule_log(self, request, response, status_code, action_base, object_getter, meta_getter, kwargs, exception, instance)
+        weight = sample_weight(request.method, status_code, get_sample_rate(policy_key(self, view_func.__name__), sample_rate), always_log)
+        if weight is not None:
+          await _aschedule_log(self, request, response, status_code, action_base, object_getter, meta_getter, kwargs, exception, instance, weight)
 
         if exception:
           raise exception
@@ -68,7 +82,9 @@ def LogActionView(
           exception = e
           status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
-        _schedule_log(self, request, response, status_code, action_base, object_getter, meta_getter, kwargs, exception, instance)
+        weight = sample_weight(request.method, status_code, get_sample_rate(policy_key(self, view_func.__name__), sample_rate), always_log)
+        if weight is not None:
+          _schedule_log(self, request, response, status_code, action_base, object_getter, meta_getter, kwargs, exception, instance, weight)
 
         if exception:
           raise exception
@@ -87,16 +103,67 @@ def _schedule_log(
   meta_getter: Optional[Callable], 
   view_kwargs: Dict, 
   exception: Optional[Exception] = None, 
-  instance: Any = None
+  instance: Any = None,
+  weight: float = 1.0
 ):
   """
-  Función interna para crear el registro en AccessLog tras la respuesta o excepción.
+  Función interna que arma el registro de AccessLog tras la respuesta o excepción
+  y lo entrega al destino de logs del proceso (ver core.audit.sinks).
+  """
+
+  entry = _build_log_entry(view, request, response, status_code, action_base, object_getter, meta_getter, view_kwargs, exception, instance, weight)
+  if entry is None:
+    return
+  try:
+    # Se entrega cuando confirma la transaccion del request (base `default`), aunque el log
+    # se escriba en otra base de datos (ACCESS_LOG['DATABASE'])
+    transaction.on_commit(lambda: get_log_sink().put(entry))
+  except Exception as e:
+    logger.error(f"[AccessLog Error] No se pudo registrar el log: {e}")
+
+async def _aschedule_log(*args, **kwargs):
+  """
+  Version async de _schedule_log para vistas async (ASGI). No usa on_commit: las vistas
+  async no corren dentro de una transaccion del request. Con un destino en memoria
+  ('buffer', 'spool') la entrega no toca la base de datos ni el disco y se hace en el
+  event loop; solo un destino bloqueante ('direct') se ejecuta en un hilo.
+  """
+
+  entry = _build_log_entry(*args, **kwargs)
+  if entry is None:
+    return
+  try:
+    sink = get_log_sink()
+    if getattr(sink, 'blocking', True):
+      await sync_to_async(sink.put, thread_sensitive=False)(entry)
+    else:
+      sink.put(entry)
+  except Exception as e:
+    logger.error(f"[AccessLog Error] No se pudo registrar el log: {e}")
+
+def _build_log_entry(
+  view: Any, 
+  request: Any, 
+  response: Any, 
+  status_code: int, 
+  action_base: Optional[str], 
+  object_getter: Optional[Callable], 
+  meta_getter: Optional[Callable], 
+  view_kwargs: Dict, 
+  exception: Optional[Exception] = None, 
+  instance: Any = None,
+  weight: float = 1.0
+) -> Optional[Dict]:
+  """
+  Arma el registro de AccessLog (dict) sin acceder a la base de datos; None si falla.
   """
   
   try:
     user = request.user if getattr(request, 'user', None) and request.user.is_authenticated else None
     method = request.method
-    path = request.get_full_path()
+    path = request.path
+    query_string = request.META.get('QUERY_STRING') or None
+    route, view_name = resolve_route(request)
     ip = APIRequestInfo.GetIPClient(request)
     user_agent = request.META.get('HTTP_USER_AGENT', '')[:255]
 
@@ -104,7 +171,7 @@ def _schedule_log(
     if exception:
       message = str(exception)
     elif hasattr(response, 'data') and isinstance(response.data, dict):
-      message = response.data.get('message', '')
+      message = str(response.data.get('message', ''))
     else:
       message = ''
 
@@ -128,21 +195,26 @@ def _schedule_log(
         logger.warning(f"[AccessLog Warning] meta_getter failed: {e}")
         meta = {}
     
-    def create_log():
-      AccessLog.objects.create(
-        user=user,
-        method=method,
-        path=path,
-        action=action,
-        status_code=status_code,
-        message=message,
-        ip_address=ip,
-        user_agent=user_agent,
-        object_id=meta.get('object_id'),
-        object_type=meta.get('object_type'),
-      )
-    
-    transaction.on_commit(create_log)
+    # La hora se fija en el request; el registro se escribe despues en lote
+    entry = {
+      'user_id': user.pk if user else None,
+      'method': method,
+      'path': path,
+      'route': route,
+      'view_name': view_name[:100] if view_name else None,
+      'query_string': query_string,
+      'action': action,
+      'status_code': status_code,
+      'message': message,
+      'ip_address': ip,
+      'user_agent': user_agent,
+      'object_id': meta.get('object_id'),
+      'object_type': meta.get('object_type'),
+      'created_at': timezone.now(),
+      'sample_weight': weight,
+    }
+    return entry
 
   except Exception as e:
-    logger.error(f"[AccessLog Error] No se pudo registrar el log: {e}")
\ No newline at end of file
+    logger.error(f"[AccessLog Error] No se pudo registrar el log: {e}")
+    return None
\ No newline at end of file
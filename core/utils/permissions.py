@@ -1,5 +1,18 @@
 from rest_framework.permissions import BasePermission
 
+from authentication.permission_snapshot import token_has_perm
+
+def has_perm(request, perm: str) -> bool:
+  """
+  Verifica un permiso con los claims del access token (PERMISSION_SNAPSHOT), sin consultar la
+  base de datos; si el token no los trae o su version es obsoleta, usa `user.has_perm`.
+  """
+
+  allowed = token_has_perm(getattr(request, 'auth', None), perm)
+  if allowed is None:
+    return request.user.has_perm(perm)
+  return allowed
+
 class IsAdmin(BasePermission):
   """
   Permite acceso solo a usuarios administradores.
@@ -22,4 +35,20 @@ class IsUserAuthenticated(BasePermission):
   """
 
   def has_permission(self, request, view):
-    return bool(request.user and request.user.is_authenticated)
\ No newline at end of file
+    return bool(request.user and request.user.is_authenticated)
+
+class CanViewAccessLog(BasePermission):
+  """
+  Permite acceso a los usuarios con el permiso `core.view_accesslog` (consultar logs de acceso).
+  """
+
+  def has_permission(self, request, view):
+    return bool(request.user and request.user.is_authenticated and has_perm(request, 'core.view_accesslog'))
+
+class CanExportAccessLog(BasePermission):
+  """
+  Permite acceso a los usuarios con el permiso `core.can_export` (exportar logs de acceso).
+  """
+
+  def has_permission(self, request, view):
+    return bool(request.user and request.user.is_authenticated and has_perm(request, 'core.can_export'))
\ No newline at end of file
@@ -0,0 +1,340 @@
+import csv
+import json
+
+from itertools import islice
+
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.views import APIView
+from rest_framework.viewsets import ReadOnlyModelViewSet
+
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiTypes
+from django_filters.rest_framework import DjangoFilterBackend
+from django.http import StreamingHttpResponse
+from django.contrib.auth import get_user_model
+from django.db.models import Q, Sum
+from django.utils import timezone
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.models import AccessLog, AccessLogRollup
+from core.filters import AccessLogFilter
+from core.audit.conf import get_audit_setting
+from core.audit.rollups import ERROR_STATUS_CLASSES, hour_bucket
+from core.audit.search import search_access_logs
+from core.base.common import GetModelName
+from core.base.messages import get_message
+from core.base.pagination import KeysetPagination
+from core.base.serializers.responses_serializer import error_400_serializer, error_403_serializer
+from core.utils.mixins import APIResponseMixin
+from core.utils.decorators import LogActionView
+from core.utils.permissions import CanViewAccessLog, CanExportAccessLog
+from core.serializers.access_logs_serializer import (
+  AccessLogSerializer, AccessLogStatsQuerySerializer, AccessLogStatsSerializer
+)
+
+# Columna exportada -> campo del queryset (accion, ruta y user agent se leen del diccionario).
+# `user_email` no es campo: los usuarios pueden estar en otra base de datos (ver _with_user_emails)
+EXPORT_COLUMNS = (
+  ('id', 'id'),
+  ('created_at', 'created_at'),
+  ('user_id', 'user_id'),
+  ('user_email', None),
+  ('method', 'method'),
+  ('path', 'path__value'),
+  ('query_string', 'query_string'),
+  ('route', 'route__value'),
+  ('view_name', 'view_name'),
+  ('action', 'action__value'),
+  ('status_code', 'status_code'),
+  ('message', 'message'),
+  ('ip_address', 'ip_address'),
+  ('user_agent', 'user_agent__value'),
+  ('object_type', 'object_type'),
+  ('object_id', 'object_id'),
+  ('sample_weight', 'sample_weight'),
+  ('count', 'count'),
+  ('first_seen', 'first_seen'),
+  ('last_seen', 'last_seen'),
+)
+EXPORT_HEADERS = tuple(header for header, _ in EXPORT_COLUMNS)
+EXPORT_FIELDS = tuple(field for _, field in EXPORT_COLUMNS if field)
+USER_EMAIL_INDEX = EXPORT_HEADERS.index('user_email')
+USER_ID_INDEX = EXPORT_FIELDS.index('user_id')
+EXPORT_CONTENT_TYPES = {
+  'csv': 'text/csv; charset=utf-8',
+  'ndjson': 'application/x-ndjson',
+}
+
+@extend_schema_view(
+  list=extend_schema(
+    summary="Listar logs de acceso",
+    description=(
+      "Lista los logs de acceso del mas reciente al mas antiguo con paginacion por cursor "
+      "sobre (created_at, id). Requiere el permiso `core.view_accesslog`."
+    ),
+    responses={
+      200: AccessLogSerializer
+    }
+  ),
+  retrieve=extend_schema(
+    summary="Detalle de un log de acceso",
+    description="Permite ver el detalle de un log de acceso. Requiere el permiso `core.view_accesslog`.",
+  ),
+)
+class AccessLogViewSet(APIResponseMixin, ReadOnlyModelViewSet):
+  # Usuario con prefetch (consulta aparte): puede vivir en otra base de datos que los logs
+  queryset = AccessLog.objects.select_related('path', 'route', 'action', 'user_agent').prefetch_related('user')
+  serializer_class = AccessLogSerializer
+  permission_classes = [CanViewAccessLog]
+  pagination_class = KeysetPagination
+  filter_backends = [DjangoFilterBackend]
+  filterset_class = AccessLogFilter
+
+  @LogActionView(action_base=get_message("logs", "log_list"))
+  def list(self, request, *args, **kwargs):
+    queryset = self.filter_queryset(self.get_queryset())
+    page = self.paginate_queryset(queryset)
+    serializer = self.get_serializer(page, many=True)
+    return self.success_response(
+      data=self.get_paginated_response(serializer.data).data,
+      message=get_message("success", "log_list")
+    )
+
+  @LogActionView(
+    action_base=get_message("logs", "log_details"),
+    meta_getter=lambda view, request, view_kwargs, instance: {
+      "object_id": instance.id,
+      "object_type": GetModelName(instance),
+    }
+  )
+  def retrieve(self, request, *args, **kwargs):
+    instance = self.get_object()
+    serializer = self.get_serializer(instance)
+    resp = self.success_response(
+      data=serializer.data,
+      message=get_message("success", "log_details")
+    )
+    resp.instance = instance
+    return resp
+
+  @extend_schema(
+    summary="Historial de auditoria de un objeto",
+    description=(
+      "Lista los logs de un objeto (`object_type`, ej. `accounts.user`, y `object_id`) del mas reciente "
+      "al mas antiguo con paginacion por cursor. Usa el indice (object_type, object_id, created_at, id). "
+      "Requiere el permiso `core.view_accesslog`."
+    ),
+    responses={
+      200: AccessLogSerializer(many=True)
+    }
+  )
+  @action(detail=False, methods=['get'], url_path=r'objects/(?P<object_type>[^/]+)/(?P<object_id>\d+)', filter_backends=[])
+  @LogActionView(
+    action_base=get_message("logs", "log_timeline"),
+    # Sin meta_getter: consultar el historial no debe aparecer en el historial del objeto
+    object_getter=lambda view, request, view_kwargs, instance: f"{view_kwargs['object_type']}#{view_kwargs['object_id']}",
+  )
+  def timeline(self, request, object_type=None, object_id=None):
+    queryset = self.get_queryset().filter(object_type=object_type, object_id=object_id)
+    page = self.paginate_queryset(queryset)
+    serializer = self.get_serializer(page, many=True)
+    return self.success_response(
+      data=self.get_paginated_response(serializer.data).data,
+      message=get_message("success", "log_timeline")
+    )
+
+  @extend_schema(
+    summary="Buscar en los logs de acceso",
+    description=(
+      "Busqueda de texto completo en la accion y el mensaje (`q`, todos los terminos requeridos). "
+      "Usa el indice de texto completo de la base de datos y admite los mismos filtros que el listado. "
+      "Requiere el permiso `core.view_accesslog`."
+    ),
+    parameters=[
+      OpenApiParameter(name='q', type=OpenApiTypes.STR, required=True, description="Texto a buscar, ej. `token_invalid`."),
+    ],
+    responses={
+      200: AccessLogSerializer(many=True),
+      400: error_400_serializer,
+    }
+  )
+  @action(detail=False, methods=['get'], url_path='search')
+  @LogActionView(action_base=get_message("logs", "log_search"))
+  def search(self, request):
+    text = request.query_params.get('q', '').strip()
+    if not text:
+      return self.error_response(
+        message=get_message("generic", "bad_request"),
+        errors={"q": [get_message("errors", "log_search_missing_query")]},
+        status_code=status.HTTP_400_BAD_REQUEST
+      )
+
+    queryset = search_access_logs(self.filter_queryset(self.get_queryset()), text)
+    page = self.paginate_queryset(queryset)
+    serializer = self.get_serializer(page, many=True)
+    return self.success_response(
+      data=self.get_paginated_response(serializer.data).data,
+      message=get_message("success", "log_search")
+    )
+
+class _Echo:
+  """
+  Pseudo-buffer para csv.writer: retorna la linea en lugar de guardarla.
+  """
+
+  def write(self, value):
+    return value
+
+def _with_user_emails(rows, chunk_size):
+  """
+  Agrega el email del usuario a cada fila con una consulta por bloque de filas.
+  """
+
+  User = get_user_model()
+  while True:
+    chunk = list(islice(rows, chunk_size))
+    if not chunk:
+      return
+    user_ids = {row[USER_ID_INDEX] for row in chunk if row[USER_ID_INDEX] is not None}
+    emails = dict(User.objects.filter(id__in=user_ids).values_list('id', 'email')) if user_ids else {}
+    for row in chunk:
+      yield row[:USER_EMAIL_INDEX] + (emails.get(row[USER_ID_INDEX]),) + row[USER_EMAIL_INDEX:]
+
+def _csv_rows(rows):
+  writer = csv.writer(_Echo())
+  yield writer.writerow(EXPORT_HEADERS)
+  for row in rows:
+    yield writer.writerow(row)
+
+def _ndjson_rows(rows):
+  for row in rows:
+    yield json.dumps(dict(zip(EXPORT_HEADERS, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+@extend_schema(
+  summary="Exportar logs de acceso",
+  description=(
+    "Exporta los logs de acceso en CSV o NDJSON como respuesta en streaming. "
+    "Requiere el permiso `core.can_export`."
+  ),
+  parameters=[
+    OpenApiParameter('output', OpenApiTypes.STR, enum=list(EXPORT_CONTENT_TYPES), description="Formato de salida (csv por defecto)."),
+    OpenApiParameter('date_from', OpenApiTypes.DATETIME, description="Fecha inicial (inclusiva)."),
+    OpenApiParameter('date_to', OpenApiTypes.DATETIME, description="Fecha final (exclusiva)."),
+    OpenApiParameter('user', OpenApiTypes.INT, description="ID del usuario."),
+    OpenApiParameter('action', OpenApiTypes.STR, description="Texto contenido en la accion."),
+    OpenApiParameter('route', OpenApiTypes.STR, description="Plantilla de la ruta, ej. /api/accounts/users/users/<pk>/."),
+    OpenApiParameter('status_code', OpenApiTypes.INT, description="Codigo de estatus HTTP."),
+  ],
+  responses={
+    (200, 'text/csv'): OpenApiTypes.STR,
+    (200, 'application/x-ndjson'): OpenApiTypes.STR,
+    400: error_400_serializer,
+    403: error_403_serializer,
+  }
+)
+class AccessLogExportView(APIResponseMixin, APIView):
+  permission_classes = [CanExportAccessLog]
+
+  @LogActionView(action_base=get_message("logs", "log_export"))
+  def get(self, request, *args, **kwargs):
+    output = request.query_params.get('output', 'csv')
+    if output not in EXPORT_CONTENT_TYPES:
+      return self.error_response(
+        message=get_message("generic", "bad_request"),
+        errors={"output": [get_message("errors", "log_export_invalid_output")]},
+        status_code=status.HTTP_400_BAD_REQUEST
+      )
+
+    filterset = AccessLogFilter(request.query_params, queryset=AccessLog.objects.all())
+    if not filterset.is_valid():
+      return self.error_response(
+        message=get_message("generic", "bad_request"),
+        errors=filterset.errors,
+        status_code=status.HTTP_400_BAD_REQUEST
+      )
+
+    # Cursor del lado del servidor: solo `chunk_size` filas en memoria a la vez
+    chunk_size = get_audit_setting('EXPORT_CHUNK_SIZE')
+    rows = _with_user_emails(
+      filterset.qs.order_by('created_at', 'id').values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size),
+      chunk_size,
+    )
+    stream = _csv_rows(rows) if output == 'csv' else _ndjson_rows(rows)
+
+    response = StreamingHttpResponse(stream, content_type=EXPORT_CONTENT_TYPES[output])
+    filename = f"access_logs_{timezone.now():%Y%m%d_%H%M%S}.{output}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+# Campo del agregado para cada valor de `group_by`
+STATS_GROUP_FIELDS = {
+  'hour': 'bucket',
+  'action': 'action',
+  'method': 'method',
+  'status': 'status_class',
+  'user': 'user_id',
+}
+
+def _stats_row(key, requests, errors):
+  # Los agregados suman pesos de muestreo: se reportan como peticiones estimadas
+  requests = round(requests or 0)
+  errors = round(errors or 0)
+  return {
+    "key": key,
+    "requests": requests,
+    "errors": errors,
+    "error_rate": round(errors / requests, 4) if requests else 0.0,
+  }
+
+@extend_schema(
+  summary="Estadisticas de logs de acceso",
+  description=(
+    "Devuelve peticiones, errores (4xx/5xx) y tasa de error agrupados por hora, accion, metodo, "
+    "clase de estatus o usuario. Se calcula sobre los agregados por hora (AccessLogRollup), por lo "
+    "que los limites del rango se redondean a la hora. Requiere el permiso `core.view_accesslog`."
+  ),
+  parameters=[AccessLogStatsQuerySerializer],
+  responses={
+    200: AccessLogStatsSerializer,
+    400: error_400_serializer,
+    403: error_403_serializer,
+  }
+)
+class AccessLogStatsView(APIResponseMixin, APIView):
+  permission_classes = [CanViewAccessLog]
+
+  @LogActionView(action_base=get_message("logs", "log_stats"))
+  def get(self, request, *args, **kwargs):
+    serializer = AccessLogStatsQuerySerializer(data=request.query_params)
+    if not serializer.is_valid():
+      return self.error_response(
+        message=get_message("generic", "bad_request"),
+        errors=serializer.errors,
+        status_code=status.HTTP_400_BAD_REQUEST
+      )
+
+    params = serializer.validated_data
+    date_from = hour_bucket(params['date_from'])
+    queryset = AccessLogRollup.objects.filter(bucket__gte=date_from)
+    if params.get('date_to'):
+      queryset = queryset.filter(bucket__lt=params['date_to'])
+
+    metrics = {
+      'requests': Sum('weighted_count'),
+      'errors': Sum('weighted_count', filter=Q(status_class__in=ERROR_STATUS_CLASSES)),
+    }
+    field = STATS_GROUP_FIELDS[params['group_by']]
+    ordering = field if params['group_by'] == 'hour' else '-requests'
+    groups = queryset.values(field).annotate(**metrics).order_by(ordering)[:params['limit']]
+    totals = queryset.aggregate(**metrics)
+
+    data = {
+      "group_by": params['group_by'],
+      "totals": _stats_row(None, totals['requests'], totals['errors']),
+      "results": [_stats_row(row[field], row['requests'], row['errors']) for row in groups],
+    }
+    return self.success_response(
+      data=AccessLogStatsSerializer(data).data,
+      message=get_message("success", "log_stats")
+    )